@@ -4,14 +4,14 @@ Website analyzer to understand job page structures.
 """
 
 import requests
-from bs4 import BeautifulSoup
 import sys
+from scraper.utils.html import make_soup
 
 def analyze_website(url):
     try:
         print(f"Analyzing: {url}")
         resp = requests.get(url, timeout=15)
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = make_soup(resp.text)
         
         print("\n=== Job-related headings ===")
         headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
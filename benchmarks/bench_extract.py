@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Extraction benchmark for the declarative site parsers.
+Compares a compiled ExtractionPlan (one walk per card) with the per-field
+select_one loop the site parsers used before, on a synthetic career page:
+
+    python benchmarks/bench_extract.py                # 200 cards
+    python benchmarks/bench_extract.py --cards 1000 --repeat 50
+
+Also checks that both return the same jobs, relative apply links included.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from scraper.parsers.site_spec import DEFAULT_FIELDS, DEFAULT_VALUES, ExtractionPlan
+
+CARDS = ".career-section .job-item, .job-listing .job-card, .careers .position"
+PAGE_URL = "https://example.com/career/"
+
+PARTS = [
+    '<h3 class="job-title">Software Engineer {i}</h3>',
+    '<span class="location">Dhaka, Bangladesh</span>',
+    '<span class="job-type">Full-Time</span>',
+    '<div class="job-description"><p>Build and ship features for job {i}.</p><ul><li>Python</li><li>SQL</li></ul></div>',
+    '<div class="meta"><span>Posted 3 days ago</span><span>Deadline: soon</span></div>',
+    '<a class="btn" href="{href}">Apply now</a>',
+]
+
+
+def make_page(cards: int, rng: random.Random) -> str:
+    items = []
+    for i in range(cards):
+        # Some career pages link to their jobs with relative URLs
+        href = f"/jobs/{i}" if i % 3 == 0 else f"https://example.com/jobs/{i}"
+        parts = [part.format(i=i, href=href) for part in PARTS if rng.random() < 0.9]
+        items.append(f'<div class="job-item"><div class="inner">{"".join(parts)}</div></div>')
+    return f'<html><body><nav>{"<a href=#>x</a>" * 50}</nav><div class="career-section">{"".join(items)}</div></body></html>'
+
+
+def select_one_loop(soup) -> list:
+    """The extraction loop of the hand-written site parsers."""
+    jobs = []
+    for card in soup.select(CARDS):
+        job = {}
+        for name, selector in DEFAULT_FIELDS.items():
+            attr = selector.get('attr') if isinstance(selector, dict) else None
+            element = card.select_one(selector['selector'] if isinstance(selector, dict) else selector)
+            if element is None or (attr and not element.has_attr(attr)):
+                job[name] = DEFAULT_VALUES.get(name, "").format(url=PAGE_URL)
+            else:
+                job[name] = element[attr] if attr else element.get_text(strip=True)
+        jobs.append(job)
+    return jobs
+
+
+def timed(fn, repeat: int) -> tuple:
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[max(int(len(latencies) * 0.95) - 1, 0)], result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compiled extraction plans against select_one loops')
+    parser.add_argument('--cards', type=int, default=200, help='Job cards on the synthetic page')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per method')
+    args = parser.parse_args()
+
+    soup = BeautifulSoup(make_page(args.cards, random.Random(42)), "html.parser")
+    plan = ExtractionPlan.from_spec({'cards': CARDS})
+
+    loop_p50, loop_p95, expected = timed(lambda: select_one_loop(soup), args.repeat)
+    plan_p50, plan_p95, jobs = timed(lambda: plan.extract(soup, PAGE_URL), args.repeat)
+
+    print(f"{'Method':<16} {'p50 ms':>8} {'p95 ms':>8} {'Jobs':>6}")
+    print("-" * 42)
+    print(f"{'select_one loop':<16} {loop_p50:>8.2f} {loop_p95:>8.2f} {len(expected):>6}")
+    print(f"{'extraction plan':<16} {plan_p50:>8.2f} {plan_p95:>8.2f} {len(jobs):>6}")
+    print(f"\nSpeedup: {loop_p50 / max(plan_p50, 1e-9):.1f}x, same jobs: {jobs == expected}")
+
+
+if __name__ == "__main__":
+    main()
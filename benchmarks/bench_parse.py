@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+HTML parsing benchmark for the backends of ``scraper.utils.html``.
+Parses a saved career page of every registered site with each backend and
+reports the median parse time and the peak memory the parsed page costs:
+
+    python benchmarks/bench_parse.py --fetch          # save missing pages first
+    python benchmarks/bench_parse.py --repeat 20 --pages /tmp/pages
+
+Pages are read from ``--pages`` as ``<parser name>.html``; ``--fetch``
+downloads the missing ones from the parsers' URLs. Sites without a saved
+page get a synthetic one (marked in the output).
+
+Every page is parsed in a fresh interpreter per backend, so the peak
+memory (growth of the peak RSS during the parse, which also counts the
+native parsers' C memory) is not hidden by memory an earlier parse
+freed. On Linux the peak is reset right before the parse. The ``a``
+column counts the links found, as a check that the backends agree.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_extract import make_page
+from scraper.parsers.registry import parser_specs
+from scraper.utils.html import BACKENDS, backend_available, parse_html
+
+PAGES_DIR = os.path.join(ROOT, '.cache', 'html')
+
+
+def _proc_status(key: str) -> float:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(key + ':'):
+                return float(line.split()[1])
+    raise KeyError(key)
+
+
+def reset_peak_rss() -> float:
+    """Reset the peak RSS to the current RSS where the OS allows it; return the peak in KiB."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return _proc_status('VmHWM')
+    except OSError:
+        return peak_rss_kb()
+
+
+def peak_rss_kb() -> float:
+    try:
+        return _proc_status('VmHWM')
+    except (OSError, KeyError):
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / 1024 if sys.platform == 'darwin' else rss  # bytes on macOS, KiB elsewhere
+
+
+def measure(backend: str, path: str, repeat: int) -> dict:
+    """Parse one page with one backend (runs in the child interpreter)."""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        markup = f.read()
+    parse_html('<p>warm up</p>', backend)
+
+    gc.collect()
+    before = reset_peak_rss()
+    document = parse_html(markup, backend)
+    peak_kb = peak_rss_kb() - before
+    links = len(document.select('a'))
+    del document
+
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse_html(markup, backend)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return {'p50': statistics.median(latencies), 'peak_kb': peak_kb, 'links': links}
+
+
+def run_child(backend: str, path: str, repeat: int) -> dict:
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', backend, path,
+                           '--repeat', str(repeat)], capture_output=True, text=True, cwd=ROOT)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{backend} on {path} failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout)
+
+
+def fetch_pages(specs: list, pages_dir: str):
+    from scraper.utils.http_client import get_client
+    os.makedirs(pages_dir, exist_ok=True)
+    client = get_client()
+    for spec in specs:
+        path = os.path.join(pages_dir, f"{spec['name']}.html")
+        if os.path.exists(path):
+            continue
+        try:
+            resp = client.get(spec['url'], timeout=15)
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"Could not fetch {spec['url']}: {e}")
+            continue
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(resp.text)
+        print(f"Saved {spec['url']} to {path}")
+
+
+def page_path(name: str, pages_dir: str, synthetic_dir: str) -> tuple:
+    """``(path, synthetic)`` of the page to parse for one site."""
+    path = os.path.join(pages_dir, f"{name}.html")
+    if os.path.exists(path):
+        return path, False
+    path = os.path.join(synthetic_dir, f"{name}.html")
+    rng = random.Random(name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(make_page(rng.randint(20, 300), rng))
+    return path, True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the HTML parsing backends on saved career pages')
+    parser.add_argument('--pages', default=PAGES_DIR, help='Directory of saved pages (<parser name>.html)')
+    parser.add_argument('--fetch', action='store_true', help='Download the pages that are not saved yet')
+    parser.add_argument('--repeat', type=int, default=10, help='Parses per page and backend')
+    parser.add_argument('--child', nargs=2, metavar=('BACKEND', 'PAGE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], args.child[1], args.repeat)))
+        return
+
+    specs = parser_specs()
+    if args.fetch:
+        fetch_pages(specs, args.pages)
+
+    backends = [backend for backend in BACKENDS if backend_available(backend)]
+    missing = [backend for backend in BACKENDS if backend not in backends]
+    synthetic_dir = os.path.join(ROOT, '.cache', 'html-synthetic')
+    os.makedirs(synthetic_dir, exist_ok=True)
+
+    header = f"{'Site':<18} {'KB':>6}"
+    for backend in backends:
+        header += f" | {backend:>11} ms {'peak MB':>8} {'a':>5}"
+    print(header)
+    print("-" * len(header))
+
+    totals = {backend: [0.0, 0.0] for backend in backends}
+    synthetic = 0
+    for spec in specs:
+        path, is_synthetic = page_path(spec['name'], args.pages, synthetic_dir)
+        synthetic += is_synthetic
+        line = f"{spec['name'] + ('*' if is_synthetic else ''):<18} {os.path.getsize(path) / 1024:>6.0f}"
+        for backend in backends:
+            result = run_child(backend, path, args.repeat)
+            totals[backend][0] += result['p50']
+            totals[backend][1] = max(totals[backend][1], result['peak_kb'])
+            line += f" | {result['p50']:>14.2f} {result['peak_kb'] / 1024:>8.1f} {result['links']:>5}"
+        print(line)
+
+    print("-" * len(header))
+    line = f"{'total / max':<18} {'':>6}"
+    for backend in backends:
+        line += f" | {totals[backend][0]:>14.2f} {totals[backend][1] / 1024:>8.1f} {'':>5}"
+    print(line)
+
+    baseline = totals.get('html.parser', [0])[0]
+    if baseline:
+        print("\nSpeedup over html.parser: " + ", ".join(
+            f"{backend} {baseline / max(total, 1e-9):.1f}x" for backend, (total, _) in totals.items()
+            if backend != 'html.parser'))
+    if synthetic:
+        print(f"* no saved page in {args.pages}: parsed a synthetic career page (use --fetch)")
+    if missing:
+        print(f"Not installed: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
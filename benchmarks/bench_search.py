@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Search benchmark for the job database.
+Compares the FTS5 index behind search_jobs with the old LIKE scan on a
+synthetic jobs table:
+
+    python benchmarks/bench_search.py                 # 50000 jobs
+    python benchmarks/bench_search.py --rows 200000 --repeat 50
+
+Reports p50/p95 latency per query for both paths and how many results
+each returned.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.database import JobDatabase
+
+ROLES = ["Software Engineer", "Backend Developer", "Frontend Developer", "QA Engineer",
+         "DevOps Engineer", "Data Scientist", "Product Manager", "Mobile Developer"]
+SKILLS = ["Python", "Django", "React", "Node.js", "Kubernetes", "AWS", "Flutter",
+          "PostgreSQL", "Go", "Java", "Spring", "TypeScript", "Docker", "Kotlin"]
+FILLER = ("We are looking for a motivated engineer to join a growing team and "
+          "ship reliable software to customers across the region. ")
+QUERIES = ["python", "react developer", "kube", "devops aws", "senior data", "flutter mobile"]
+
+
+def make_job(i: int, rng: random.Random) -> dict:
+    skills = rng.sample(SKILLS, 3)
+    seniority = rng.choice(["Junior", "Mid", "Senior", "Lead"])
+    return {
+        'title': f"{seniority} {rng.choice(ROLES)}",
+        'company': f"Company {i % 50}",
+        'location': rng.choice(["Dhaka", "Chittagong", "Remote", "Sylhet"]),
+        'type': "Full-Time",
+        'description': FILLER * rng.randint(3, 12) + f"Experience with {', '.join(skills)} is required.",
+        'skills': ', '.join(skills),
+        'apply_link': f"https://example.com/jobs/{i}",
+    }
+
+
+def timed(fn, query: str, repeat: int) -> tuple:
+    latencies = []
+    results = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = len(fn(query, 20))
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[max(int(len(latencies) * 0.95) - 1, 0)], results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark FTS5 search against LIKE')
+    parser.add_argument('--rows', type=int, default=50000, help='Synthetic jobs to insert')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per query')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = JobDatabase(os.path.join(tmp, "bench.db"), profile="bulk")
+        if not db.fts_enabled:
+            sys.exit("This SQLite build has no FTS5 support")
+
+        started = time.perf_counter()
+        for i in range(0, args.rows, 1000):
+            db.add_jobs([make_job(j, rng) for j in range(i, min(i + 1000, args.rows))])
+        print(f"Inserted {args.rows} jobs in {time.perf_counter() - started:.1f}s (FTS kept in sync by triggers)\n")
+
+        print(f"{'Query':<16} {'FTS p50 ms':>11} {'FTS p95 ms':>11} {'LIKE p50 ms':>12} "
+              f"{'LIKE p95 ms':>12} {'Speedup':>8} {'FTS hits':>9} {'LIKE hits':>10}")
+        print("-" * 95)
+        for query in QUERIES:
+            fts_p50, fts_p95, fts_hits = timed(db.search_jobs, query, args.repeat)
+            like_p50, like_p95, like_hits = timed(db._search_jobs_like, query, args.repeat)
+            print(f"{query:<16} {fts_p50:>11.2f} {fts_p95:>11.2f} {like_p50:>12.2f} {like_p95:>12.2f} "
+                  f"{like_p50 / max(fts_p50, 1e-9):>7.1f}x {fts_hits:>9} {like_hits:>10}")
+
+
+if __name__ == "__main__":
+    main()
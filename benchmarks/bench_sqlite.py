@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+SQLite benchmark for the job database.
+Compares the legacy connect-per-call / rollback-journal setup with the
+pragma profiles of the connection manager:
+
+    python benchmarks/bench_sqlite.py                 # all profiles, 5000 jobs
+    python benchmarks/bench_sqlite.py --rows 20000 --profile default
+
+Reports insert throughput (one job per commit, as post_job does, and one
+batch per commit, as the job sink does) and read latency of
+get_recent_jobs while a writer thread keeps inserting.
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.database import JobDatabase, PRAGMA_PROFILES
+
+LEGACY = {'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+
+
+class LegacyJobDatabase(JobDatabase):
+    """The pre-connection-manager behaviour: a fresh connection per call."""
+    
+    def _connect(self):
+        return self.connections.connect()
+
+
+def make_job(i: int) -> dict:
+    return {
+        'title': f"Software Engineer {i}",
+        'company': f"Company {i % 20}",
+        'location': "Dhaka",
+        'type': "Full-Time",
+        'description': "Build and maintain services. " * 10,
+        'apply_link': f"https://example.com/jobs/{i}",
+    }
+
+
+def bench_profile(name: str, rows: int, readers_seconds: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        if name == 'legacy':
+            db = LegacyJobDatabase(path, profile=LEGACY)
+        else:
+            db = JobDatabase(path, profile=name)
+        
+        # One commit per job
+        single = min(rows, 1000)
+        started = time.perf_counter()
+        for i in range(single):
+            db.add_job(make_job(i))
+        single_rate = single / (time.perf_counter() - started)
+        
+        # One commit per batch of 100
+        started = time.perf_counter()
+        for i in range(single, rows, 100):
+            db.add_jobs([make_job(j) for j in range(i, min(i + 100, rows))])
+        batch_rate = (rows - single) / max(time.perf_counter() - started, 1e-9)
+        
+        # Read latency while a writer keeps inserting
+        stop = threading.Event()
+        
+        def writer():
+            writer_db = db if name != 'legacy' else LegacyJobDatabase(path, profile=LEGACY)
+            i = rows
+            while not stop.is_set():
+                try:
+                    writer_db.add_jobs([make_job(j) for j in range(i, i + 20)])
+                except sqlite3.OperationalError:
+                    pass
+                i += 20
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        latencies = []
+        errors = 0
+        deadline = time.perf_counter() + readers_seconds
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                db.get_recent_jobs("Company 3", days=7)
+                latencies.append((time.perf_counter() - started) * 1000)
+            except sqlite3.OperationalError:
+                errors += 1
+        stop.set()
+        thread.join()
+    
+    latencies.sort()
+    return {
+        'profile': name,
+        'single_per_sec': single_rate,
+        'batch_per_sec': batch_rate,
+        'read_p50_ms': statistics.median(latencies) if latencies else float('nan'),
+        'read_p95_ms': latencies[int(len(latencies) * 0.95) - 1] if latencies else float('nan'),
+        'read_errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark SQLite pragma profiles for the job database')
+    parser.add_argument('--rows', type=int, default=5000, help='Jobs to insert per profile')
+    parser.add_argument('--profile', choices=['legacy'] + list(PRAGMA_PROFILES), action='append',
+                        help='Profile to benchmark (repeatable, default: all)')
+    parser.add_argument('--read-seconds', type=float, default=3.0, help='Duration of the read-under-write phase')
+    args = parser.parse_args()
+    
+    profiles = args.profile or ['legacy'] + list(PRAGMA_PROFILES)
+    print(f"{'Profile':<10} {'Inserts/s (1/commit)':>21} {'Inserts/s (batched)':>20} "
+          f"{'Read p50 ms':>12} {'Read p95 ms':>12} {'Read errors':>12}")
+    print("-" * 92)
+    for name in profiles:
+        r = bench_profile(name, args.rows, args.read_seconds)
+        print(f"{r['profile']:<10} {r['single_per_sec']:>21.0f} {r['batch_per_sec']:>20.0f} "
+              f"{r['read_p50_ms']:>12.2f} {r['read_p95_ms']:>12.2f} {r['read_errors']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the scraper entry points.
+Runs each entry point in a fresh interpreter with ``python -X importtime``
+and reports the wall time and the time spent importing modules:
+
+    python benchmarks/bench_startup.py                # 5 runs each
+    python benchmarks/bench_startup.py --repeat 10 --scale 2
+
+Fails (exit status 1) when the median import time of an entry point is
+over its budget, or when it imports a module it should load lazily
+(e.g. ``cli.py --list`` importing a parser or Playwright). Budgets
+include the interpreter's own startup imports (``site``); ``--scale``
+multiplies them for slower machines. The entry points run against
+a throwaway database.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name: (command, import budget in ms, modules that must not be imported)
+ENTRY_POINTS = {
+    'cli.py --list': (
+        ['cli.py', '--list'], 150,
+        ['requests', 'bs4', 'playwright', 'scraper.main', 'scraper.parsers.base_parser'],
+    ),
+    'main.py --stats': (
+        ['scraper/main.py', '--stats'], 200,
+        ['requests', 'bs4', 'playwright', 'scraper.parsers.base_parser'],
+    ),
+    'dashboard.py': (
+        ['-c', 'import dashboard'], 600,
+        ['requests', 'bs4', 'playwright', 'scraper.publisher'],
+    ),
+}
+
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def run_once(command: list, env: dict) -> tuple:
+    """Run one entry point; return ``(wall ms, import ms, imported module names)``."""
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime'] + command, cwd=ROOT, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = (time.perf_counter() - started) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+
+    imported = set()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        imported.add(match.group(4))
+        if len(match.group(3)) == 1:
+            # Top-level imports: their cumulative times add up to the total
+            total_us += int(match.group(2))
+    return wall, total_us / 1000, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the startup time of the scraper entry points')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per entry point')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiply the import budgets by this factor')
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DB_PATH=os.path.join(tmp, 'startup.db'))
+        # First run creates the database and the bytecode caches
+        for command, _, _ in ENTRY_POINTS.values():
+            run_once(command, env)
+
+        print(f"{'Entry point':<18} {'Wall p50 ms':>12} {'Import p50 ms':>14} {'Budget ms':>10} {'Modules':>8}  Status")
+        print("-" * 80)
+        for name, (command, budget, forbidden) in ENTRY_POINTS.items():
+            walls, imports, modules = [], [], set()
+            for _ in range(args.repeat):
+                wall, import_ms, imported = run_once(command, env)
+                walls.append(wall)
+                imports.append(import_ms)
+                modules |= imported
+
+            import_p50 = statistics.median(imports)
+            budget *= args.scale
+            problems = []
+            if import_p50 > budget:
+                problems.append(f"imports take {import_p50:.0f} ms, budget {budget:.0f} ms")
+            eager = sorted(module for module in forbidden if module in modules)
+            if eager:
+                problems.append(f"imports {', '.join(eager)}")
+
+            print(f"{name:<18} {statistics.median(walls):>12.1f} {import_p50:>14.1f} {budget:>10.0f} "
+                  f"{len(modules):>8}  {'FAIL' if problems else 'ok'}")
+            failures += [f"{name}: {problem}" for problem in problems]
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,38 +5,67 @@ Usage examples:
     python cli.py --list                    # List all available parsers
     python cli.py --single pathao           # Run single parser
     python cli.py --once                    # Run all parsers once
+    python cli.py --once --workers 8        # Run all parsers once, 8 at a time
     python cli.py                          # Run continuously
+    python cli.py export --since 7d > jobs.ndjson            # Export last week's jobs
+    python cli.py export --format csv -o jobs.csv            # Export all active jobs as CSV
+    python cli.py retention --days 60                        # Archive and delete old jobs now
 """
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scraper.main import run_all_parsers, run_single_parser, PARSER_MODULES
 from scraper.utils.logger import setup_logger
+from scraper.config import MAX_WORKERS, RETENTION_DAYS, RETENTION_ARCHIVE_DIR
 import argparse
 
 logger = setup_logger("CLI")
 
 def list_parsers():
-    """List all available parsers."""
+    """List all available parsers (read from the parser manifest, no parser is imported)."""
+    from scraper.parsers.registry import parser_specs
+    
     print("\nAvailable parsers:")
     print("=" * 50)
-    for module_name in PARSER_MODULES:
-        parser_name = module_name.split('.')[-1]
-        try:
-            module = __import__(module_name, fromlist=[parser_name])
-            for attr in dir(module):
-                obj = getattr(module, attr)
-                if hasattr(obj, 'company') and hasattr(obj, 'url'):
-                    company = obj.company
-                    url = obj.url
-                    print(f"  {parser_name:<20} - {company:<25} - {url}")
-                    break
-        except Exception as e:
-            print(f"  {parser_name:<20} - Error loading parser: {e}")
+    for spec in parser_specs():
+        browser = "  [browser]" if spec['needs_browser'] else ""
+        print(f"  {spec['name']:<20} - {spec['company']:<25} - {spec['url']}{browser}")
     print()
 
+def export(args):
+    """Stream the job database to a file or stdout."""
+    from scraper.export import export_jobs, parse_since
+    from scraper.utils.logger import log_to_stderr
+    
+    if not args.output:
+        # Keep log lines out of the exported data
+        log_to_stderr()
+    
+    try:
+        since = parse_since(args.since)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(2)
+    
+    filters = {'since': since, 'company': args.company, 'include_inactive': args.include_inactive}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as out:
+            export_jobs(out, args.format, **filters)
+        logger.info(f"Exported jobs to {args.output}")
+    else:
+        export_jobs(sys.stdout, args.format, **filters)
+
+def run_retention(args):
+    """Run a retention pass now, regardless of the schedule."""
+    from scraper.retention import RetentionEngine
+    
+    engine = RetentionEngine(days=args.days, archive_dir='' if args.no_archive else args.archive_dir)
+    report = engine.run(force=True)
+    print(f"Deleted {report['deleted']['jobs']} jobs and {report['deleted']['scraping_runs']} runs "
+          f"({report['archived']['jobs'] + report['archived']['scraping_runs']} rows archived), "
+          f"reclaimed {report['bytes_reclaimed'] / 1024:.0f} KB, {report['free_bytes'] / 1024:.0f} KB still free")
+
 def main():
     parser = argparse.ArgumentParser(
         description='Web Scraper for Bangladeshi Software Companies',
@@ -46,7 +75,12 @@ Examples:
   python cli.py --list                    List all available parsers
   python cli.py --single pathao           Run single parser for Pathao
   python cli.py --once                    Run all parsers once and exit
+  python cli.py --once --workers 8        Run all parsers once, 8 at a time
   python cli.py                          Run continuously (default)
+  python cli.py export --since 7d         Export the last 7 days as NDJSON to stdout
+  python cli.py export --format csv -o jobs.csv
+                                          Export all active jobs as CSV
+  python cli.py retention --days 60       Archive and delete jobs unseen for 60 days
         """
     )
     
@@ -56,24 +90,61 @@ Examples:
                        help='Run all parsers once and exit')
     parser.add_argument('--list', action='store_true', 
                        help='List all available parsers')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, metavar='N',
+                       help=f'Run up to N parsers concurrently (default: {MAX_WORKERS})')
+    
+    subparsers = parser.add_subparsers(dest='command')
+    export_parser = subparsers.add_parser('export', help='Stream stored jobs as NDJSON or CSV')
+    export_parser.add_argument('--format', choices=['ndjson', 'csv'], default='ndjson',
+                               help='Output format (default: ndjson)')
+    export_parser.add_argument('--since', metavar='WHEN',
+                               help='Only jobs scraped since WHEN: 7d, 12h or an ISO date (default: all)')
+    export_parser.add_argument('--company', help='Only jobs of this company')
+    export_parser.add_argument('--include-inactive', action='store_true',
+                               help='Also export jobs that are no longer listed')
+    export_parser.add_argument('-o', '--output', metavar='FILE', help='Write to FILE instead of stdout')
+    
+    retention_parser = subparsers.add_parser('retention', help='Archive and delete old jobs and runs now')
+    retention_parser.add_argument('--days', type=int, default=RETENTION_DAYS,
+                                  help=f'Keep jobs seen within this many days (default: {RETENTION_DAYS})')
+    retention_parser.add_argument('--archive-dir', default=RETENTION_ARCHIVE_DIR or 'archive', metavar='DIR',
+                                  help='Directory for the gzipped NDJSON archives')
+    retention_parser.add_argument('--no-archive', action='store_true', help='Delete without archiving')
     
     args = parser.parse_args()
     
+    if args.command == 'export':
+        export(args)
+        return
+    if args.command == 'retention':
+        run_retention(args)
+        return
+    
     if args.list:
         list_parsers()
-    elif args.single:
+        return
+    
+    # Imported here so that export and --list don't load the scraping pipeline
+    from scraper.main import run_all_parsers, run_single_parser
+    from scraper.publisher import publisher
+    from scraper.config import PUBLISH_DRAIN_TIMEOUT
+    
+    if args.single:
         logger.info(f"Running single parser: {args.single}")
         run_single_parser(args.single)
+        # Give the background publisher a chance to post the new jobs
+        publisher.stop(PUBLISH_DRAIN_TIMEOUT)
     elif args.once:
         logger.info("Running all parsers once")
-        run_all_parsers()
+        run_all_parsers(args.workers)
+        publisher.stop(PUBLISH_DRAIN_TIMEOUT)
     else:
         logger.info("Starting continuous scraping mode (use Ctrl+C to stop)")
         try:
             import time
             from scraper.config import SLEEP_BETWEEN_RUNS
             while True:
-                run_all_parsers()
+                run_all_parsers(args.workers)
                 logger.info(f"Sleeping for {SLEEP_BETWEEN_RUNS} seconds before next run...")
                 time.sleep(SLEEP_BETWEEN_RUNS)
         except KeyboardInterrupt:
@@ -0,0 +1,50 @@
+"""Shared pytest fixtures: tests run against throwaway databases and caches."""
+
+import os
+import tempfile
+
+import pytest
+
+# Set before anything imports scraper.config, so no test touches jobs.db,
+# the page cache or the retention archive of a real installation
+_TMP = tempfile.mkdtemp(prefix="scraper-tests-")
+os.environ['DB_PATH'] = os.path.join(_TMP, "jobs.db")
+os.environ['PAGE_CACHE_DIR'] = os.path.join(_TMP, "pages")
+os.environ['RETENTION_ARCHIVE_DIR'] = os.path.join(_TMP, "archive")
+
+from scraper import database as database_module
+from scraper.database import JobDatabase
+from scraper.utils.page_cache import page_cache
+
+
+@pytest.fixture(scope="session")
+def make_database(tmp_path_factory):
+    """Factory for empty databases, each in its own temporary directory."""
+    def make(name: str = "jobs.db") -> JobDatabase:
+        return JobDatabase(str(tmp_path_factory.mktemp("db") / name))
+    return make
+
+
+@pytest.fixture
+def database(make_database, monkeypatch):
+    """An empty database, also returned by ``get_database()`` during the test."""
+    db = make_database()
+    monkeypatch.setattr(database_module, '_database', db)
+    return db
+
+
+@pytest.fixture
+def empty_page_cache(tmp_path, monkeypatch):
+    """The shared page cache, writing to an empty directory during the test."""
+    monkeypatch.setattr(page_cache, 'cache_dir', str(tmp_path / "pages"))
+    return page_cache
+
+
+@pytest.fixture
+def client(database):
+    """A test client of the dashboard, serving ``database`` with an empty response cache."""
+    import dashboard
+    from scraper.utils.response_cache import response_cache
+    response_cache.clear()
+    yield dashboard.app.test_client()
+    response_cache.clear()
@@ -1,11 +1,134 @@
-from flask import Flask, render_template, jsonify, request
-from scraper.database import JobDatabase
-from scraper.job_api import get_job_statistics, get_recent_jobs
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
+from functools import wraps
+from urllib.parse import urlencode
+from scraper.config import API_PAGE_SIZE, API_MAX_PAGE_SIZE, GZIP_MIN_SIZE
+from scraper.database import get_database
+from scraper.export import MIME_TYPES, iter_export, parse_since
+from scraper.utils.response_cache import response_cache
+import base64
+import gzip
 import json
 from datetime import datetime
 
 app = Flask(__name__)
-db = JobDatabase()
+
+# Set from the body when a cached response is rebuilt
+ENTITY_HEADERS = ('Content-Type', 'Content-Length')
+
+
+def cached_json(view):
+    """Cache a JSON view's response, headers and gzipped body until the data version changes."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        version = get_database().data_version()
+        
+        cached = response_cache.get(key, version)
+        if cached is None:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            body, gzipped = response.get_data(), None
+            headers = [(name, value) for name, value in response.headers if name not in ENTITY_HEADERS]
+            etag = response_cache.put(key, version, body, headers)
+        else:
+            etag, body, headers, gzipped = cached
+            response = app.response_class(body, mimetype='application/json')
+            for name, value in headers:
+                response.headers.add(name, value)
+        
+        # Weak, so the validator still matches once the body is gzipped
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        if request.if_none_match.contains_weak(etag):
+            response.status_code = 304
+            response.set_data(b'')
+        elif _wants_gzip(body):
+            if gzipped is None:
+                gzipped = gzip.compress(body, compresslevel=6)
+                response_cache.put_gzipped(key, etag, gzipped)
+            _set_gzipped(response, gzipped)
+        return response
+    
+    return wrapper
+
+
+def _wants_gzip(body: bytes) -> bool:
+    return len(body) >= GZIP_MIN_SIZE and 'gzip' in request.headers.get('Accept-Encoding', '')
+
+
+def _set_gzipped(response, gzipped: bytes):
+    response.set_data(gzipped)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+
+
+@app.after_request
+def compress_json(response):
+    """Gzip JSON responses for clients that accept it (cached_json views gzip their own)."""
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    body = response.get_data()
+    if _wants_gzip(body):
+        _set_gzipped(response, gzip.compress(body, compresslevel=6))
+    return response
+
+
+def _encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, list) or len(key) != 2:
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
+def paged_jobs(fetch, sort_key, default_limit: int = API_PAGE_SIZE):
+    """Serve one page of jobs as a JSON array.
+    
+    ``fetch(fields, after, limit)`` returns an iterator over the jobs. The
+    request may pass ``limit``, ``cursor`` (from the previous page) and
+    ``fields`` (comma separated, e.g. ``fields=id,title,company``). When
+    more jobs follow, the next page's cursor is sent in ``X-Next-Cursor``
+    and as a ``Link: <...>; rel="next"`` header.
+    """
+    try:
+        limit = max(1, min(int(request.args.get('limit', default_limit)), API_MAX_PAGE_SIZE))
+        fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()] or None
+        cursor = request.args.get('cursor')
+        after = _decode_cursor(cursor) if cursor else None
+        # One extra row tells whether there is a next page
+        jobs = list(fetch(fields, after, limit + 1))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    has_more = len(jobs) > limit
+    jobs = jobs[:limit]
+    next_cursor = _encode_cursor(sort_key(jobs[-1])) if has_more else None
+    
+    if fields:
+        # id and scraped_at are always fetched for the cursor; drop them unless asked for
+        for job in jobs:
+            for key in ('id', 'scraped_at'):
+                if key not in fields:
+                    job.pop(key, None)
+    
+    response = jsonify(jobs)
+    if next_cursor:
+        args = request.args.to_dict()
+        args['cursor'] = next_cursor
+        response.headers['X-Next-Cursor'] = next_cursor
+        response.headers['Link'] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return response
+
 
 @app.route('/')
 def dashboard():
@@ -13,21 +136,15 @@ def dashboard():
     return render_template('dashboard.html')
 
 @app.route('/api/stats')
+@cached_json
 def api_stats():
     """Get statistics for the dashboard."""
-    stats = get_job_statistics()
-    
-    # Add some additional stats
-    recent_jobs = get_recent_jobs(days=1)
-    today_jobs = len(recent_jobs)
-    
-    week_jobs = get_recent_jobs(days=7)
-    week_count = len(week_jobs)
+    stats = get_database().get_statistics()
     
     return jsonify({
         'total_jobs': stats['total_jobs'],
-        'today_jobs': today_jobs,
-        'week_jobs': week_count,
+        'today_jobs': stats['today_jobs'],
+        'week_jobs': stats['week_jobs'],
         'companies': len(stats['jobs_by_company']),
         'jobs_by_company': stats['jobs_by_company'],
         'recent_runs': stats['recent_runs'][:10]  # Last 10 runs
@@ -36,41 +153,73 @@ def api_stats():
 @app.route('/api/job/<int:job_id>')
 def api_job_details(job_id):
     """Get detailed job information."""
-    job = db.get_job_details(job_id)
+    job = get_database().get_job_details(job_id)
     if job:
         return jsonify(job)
     else:
         return jsonify({'error': 'Job not found'}), 404
 
 @app.route('/api/search')
+@cached_json
 def api_search():
-    """Search jobs."""
+    """Search jobs, best match first (paged, see paged_jobs)."""
     query = request.args.get('q', '')
-    limit = int(request.args.get('limit', 20))
     
     if not query:
         return jsonify([])
     
-    jobs = db.search_jobs(query, limit)
-    return jsonify(jobs)
+    db = get_database()
+    return paged_jobs(
+        lambda fields, after, limit: db.iter_search_jobs(query, limit, fields, after),
+        db.search_sort_key, default_limit=20
+    )
 
 @app.route('/api/jobs')
+@cached_json
 def api_jobs():
-    """Get recent jobs."""
+    """Get recent jobs, newest first (paged, see paged_jobs)."""
     company = request.args.get('company')
     days = int(request.args.get('days', 7))
     
-    jobs = get_recent_jobs(company, days)
-    return jsonify(jobs)
+    return paged_jobs(
+        lambda fields, after, limit: get_database().iter_recent_jobs(company, days, fields, after, limit),
+        lambda job: (job['scraped_at'], job['id'])
+    )
 
 @app.route('/api/jobs/<company>')
+@cached_json
 def api_company_jobs(company):
-    """Get jobs for a specific company."""
-    jobs = get_recent_jobs(company, days=30)
-    return jsonify(jobs)
+    """Get jobs for a specific company (paged, see paged_jobs)."""
+    return paged_jobs(
+        lambda fields, after, limit: get_database().iter_recent_jobs(company, 30, fields, after, limit),
+        lambda job: (job['scraped_at'], job['id'])
+    )
 
-if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+@app.route('/api/export')
+def api_export():
+    """Stream every stored job as NDJSON (default) or CSV.
+    
+    Query arguments: ``format``, ``since`` (7d, 12h or an ISO date),
+    ``company`` and ``include_inactive``. The body is produced chunk by
+    chunk from a database cursor, so a full snapshot never sits in memory.
+    """
+    fmt = request.args.get('format', 'ndjson')
+    try:
+        chunks = iter_export(fmt, since=parse_since(request.args.get('since')),
+                             company=request.args.get('company'),
+                             include_inactive=request.args.get('include_inactive') in ('1', 'true'),
+                             database=get_database())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    filename = f"jobs-{datetime.now():%Y%m%d-%H%M%S}.{fmt}"
+    return Response(stream_with_context(chunks), mimetype=MIME_TYPES[fmt],
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
+@app.route('/api/cache')
+def api_cache():
+    """Response cache counters (hits, misses, evictions, size)."""
+    return jsonify(response_cache.stats())
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
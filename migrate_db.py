@@ -43,5 +43,38 @@ def migrate_database():
     conn.close()
     print("Database migration completed!")
 
+def backfill_fingerprints(batch_size: int = 500):
+    """Recompute job fingerprints and collapse duplicate jobs.
+    
+    Older versions keyed jobs on Python's per-process salted hash(), so every
+    run re-inserted the same jobs. Safe to run repeatedly.
+    """
+    from scraper.database import JobDatabase
+    
+    db = JobDatabase(profile="bulk")
+    stats = db.backfill_fingerprints(batch_size=batch_size)
+    print(f"Fingerprint backfill completed: {stats['scanned']} jobs scanned, "
+          f"{stats['updated']} updated, {stats['merged']} duplicates removed")
+
+def enable_incremental_vacuum():
+    """Let retention return freed space to the file system (rewrites the file once)."""
+    from scraper.database import JobDatabase
+    
+    db = JobDatabase()
+    before = os.path.getsize(db.db_path)
+    db.enable_incremental_vacuum()
+    print(f"Incremental vacuum enabled: {before / 1024:.0f} KB -> {os.path.getsize(db.db_path) / 1024:.0f} KB")
+
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Migrate the local job database')
+    parser.add_argument('--batch-size', type=int, default=500, help='Rows per backfill transaction')
+    parser.add_argument('--incremental-vacuum', action='store_true',
+                        help='Also switch the database to auto_vacuum=INCREMENTAL (full VACUUM, run while idle)')
+    args = parser.parse_args()
+    
     migrate_database()
+    backfill_fingerprints(args.batch_size)
+    if args.incremental_vacuum:
+        enable_incremental_vacuum()
@@ -11,7 +11,6 @@ import time
 from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scraper.main import PARSER_MODULES
 from scraper.utils.logger import setup_logger
 
 logger = setup_logger("Monitor")
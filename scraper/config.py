@@ -1,15 +1,47 @@
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 # API Configuration
 API_URL = os.getenv("JOB_API_URL", "https://your-domain.com/api/jobs")
 API_TOKEN = os.getenv("JOB_API_TOKEN", "")
+API_BATCH_URL = os.getenv("JOB_API_BATCH_URL", "")  # accepts a JSON array of jobs; empty = post one by one
+
+# Background publishing of new jobs to the API (outbox)
+PUBLISH_CONCURRENCY = int(os.getenv("PUBLISH_CONCURRENCY", "4"))  # requests in flight
+PUBLISH_BATCH_SIZE = int(os.getenv("PUBLISH_BATCH_SIZE", "25"))  # jobs per request when API_BATCH_URL is set
+PUBLISH_INTERVAL = float(os.getenv("PUBLISH_INTERVAL", "30"))  # seconds between outbox polls when idle
+PUBLISH_MAX_ATTEMPTS = int(os.getenv("PUBLISH_MAX_ATTEMPTS", "8"))  # then the job is left for manual requeue
+PUBLISH_BACKOFF = float(os.getenv("PUBLISH_BACKOFF", "30"))  # first retry delay, doubled per attempt
+PUBLISH_BACKOFF_MAX = float(os.getenv("PUBLISH_BACKOFF_MAX", "3600"))
+PUBLISH_DRAIN_TIMEOUT = float(os.getenv("PUBLISH_DRAIN_TIMEOUT", "60"))  # wait for the outbox before a one-off run exits
 
 # Scraping Configuration
 REQUEST_TIMEOUT = 15
 RETRY_COUNT = 3
 SLEEP_BETWEEN_REQUESTS = 1
+
+# Per-host politeness (token bucket shared by every HttpClient in the process)
+HOST_RATE_LIMIT = float(os.getenv("HOST_RATE_LIMIT", str(1 / SLEEP_BETWEEN_REQUESTS)))  # requests/second per host
+HOST_BURST = int(os.getenv("HOST_BURST", "1"))  # requests allowed back-to-back before throttling
+HOST_RATE_OVERRIDES: Dict[str, Tuple[float, int]] = {}
+# Example per-host override (rate, burst):
+# HOST_RATE_OVERRIDES = {
+#     "careers.smartrecruiters.com": (0.5, 1),
+# }
 SLEEP_BETWEEN_RUNS = int(os.getenv("SLEEP_BETWEEN_RUNS", "3600"))  # 1 hour default
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "1"))  # Parsers run concurrently per cycle
+
+# Connection pooling for the shared HTTP clients
+POOL_CONNECTIONS = int(os.getenv("POOL_CONNECTIONS", "32"))  # hosts kept in the pool
+POOL_MAXSIZE = int(os.getenv("POOL_MAXSIZE", "10"))  # keep-alive connections per host
+
+# Conditional-GET page cache (ETag / Last-Modified validators per URL)
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED", "true").lower() == "true"
+PAGE_CACHE_DIR = os.getenv("PAGE_CACHE_DIR", os.path.join(".cache", "pages"))
+
+# HTML parsing backend: selectolax (native, fastest) | lxml | html.parser.
+# Falls back to the next one when the package isn't installed.
+HTML_PARSER = os.getenv("HTML_PARSER", "selectolax")
 
 # Headers for requests (helps avoid blocking)
 DEFAULT_HEADERS = {
@@ -29,6 +61,18 @@ PROXIES: Optional[Dict[str, str]] = None
 #     "https": "https://proxy.example.com:8080"
 # }
 
+# Local SQLite database
+DB_PATH = os.getenv("DB_PATH", "jobs.db")
+DB_PRAGMA_PROFILE = os.getenv("DB_PRAGMA_PROFILE", "default")  # default | safe | bulk
+
+# Retention: jobs unseen for RETENTION_DAYS (and older scraping runs) are
+# archived and deleted at most once per RETENTION_INTERVAL seconds
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "90"))
+RETENTION_INTERVAL = float(os.getenv("RETENTION_INTERVAL", "86400"))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "500"))  # rows per delete transaction
+RETENTION_ARCHIVE_DIR = os.getenv("RETENTION_ARCHIVE_DIR", "archive")  # empty = delete without archiving
+RETENTION_VACUUM_PAGES = int(os.getenv("RETENTION_VACUUM_PAGES", "0"))  # free pages returned per pass, 0 = all
+
 # Logging Configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = "[%(asctime)s] %(levelname)s - %(name)s - %(message)s"
@@ -37,3 +81,16 @@ LOG_FORMAT = "[%(asctime)s] %(levelname)s - %(name)s - %(message)s"
 USE_PLAYWRIGHT = os.getenv("USE_PLAYWRIGHT", "false").lower() == "true"
 HEADLESS_BROWSER = os.getenv("HEADLESS_BROWSER", "true").lower() == "true"
 BROWSER_TIMEOUT = 30000  # 30 seconds
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))  # warm Chromium instances
+BROWSER_MAX_PAGES = int(os.getenv("BROWSER_MAX_PAGES", "50"))  # pages served before a browser is recycled
+# Request types aborted while rendering; the parsers only read the DOM
+BLOCKED_RESOURCE_TYPES = [t for t in os.getenv("BLOCKED_RESOURCE_TYPES", "image,font,stylesheet,media").split(",") if t]
+
+# In-process cache of the dashboard's JSON responses
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "256"))  # responses kept (LRU)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))  # seconds before a response is recomputed anyway
+
+# Dashboard API paging and compression
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "100"))  # jobs per page when no limit is given
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "1000"))
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", "1024"))  # smaller responses are sent uncompressed
@@ -1,23 +1,199 @@
 import sqlite3
+import hashlib
+import html
 import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, List, Dict, Optional, Union
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from .config import DB_PATH, DB_PRAGMA_PROFILE
 from .utils.logger import setup_logger
 
 logger = setup_logger("Database")
 
+# Bump whenever init_database's DDL changes (tables, columns, indexes,
+# triggers), so existing databases run it again on their next start.
+# Version 2: databases from before stable fingerprints are backfilled.
+SCHEMA_VERSION = 2
+
+# Column each table expires by, for retention (see JobDatabase.purge_batch)
+RETENTION_COLUMNS = {'jobs': 'last_seen', 'scraping_runs': 'run_time'}
+
+# Pragmas applied to every connection. WAL lets the dashboard read while the
+# scraper writes; busy_timeout makes writers wait for each other instead of
+# failing with "database is locked".
+PRAGMA_PROFILES = {
+    # Balanced: durable across application crashes, fast commits
+    'default': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,  # KiB (negative = size rather than pages)
+        'mmap_size': 64 * 1024 * 1024,
+        'busy_timeout': 5000,
+        'temp_store': 'MEMORY',
+    },
+    # Every commit is fsynced, also survives power loss
+    'safe': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -16000,
+        'mmap_size': 0,
+        'busy_timeout': 10000,
+        'temp_store': 'DEFAULT',
+    },
+    # Bulk loads and backfills: fastest, may lose the last commits on power loss
+    'bulk': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -64000,
+        'mmap_size': 256 * 1024 * 1024,
+        'busy_timeout': 30000,
+        'temp_store': 'MEMORY',
+    },
+}
+
+
+# Columns indexed for full-text search, with their bm25 weights
+SEARCH_WEIGHTS = {'title': 10.0, 'company': 5.0, 'location': 2.0, 'skills': 4.0, 'description': 1.0}
+SEARCH_COLUMNS = list(SEARCH_WEIGHTS)
+# Put around matched terms by FTS5's snippet(); private-use characters, so
+# they survive HTML escaping and become <mark> tags afterwards
+SNIPPET_MARKS = ('\ue000', '\ue001')
+
+# Columns the job listing and search APIs can return, for ``fields`` projections.
+# Descriptions are cut in SQL so list views never carry the full text.
+JOB_FIELDS = {
+    'id': 'j.id',
+    'title': 'j.title',
+    'company': 'j.company',
+    'location': 'j.location',
+    'type': 'j.type',
+    'description': "CASE WHEN length(j.description) > 200 THEN substr(j.description, 1, 200) || '...' "
+                   "ELSE j.description END",
+    'apply_link': 'j.apply_link',
+    'scraped_at': 'j.scraped_at',
+    'experience_level': "COALESCE(j.experience_level, '')",
+    'salary_range': "COALESCE(j.salary_range, '')",
+    'skills': "COALESCE(j.skills, '')",
+    'posted_date': "COALESCE(j.posted_date, '')",
+    'first_seen': 'j.first_seen',
+    'last_seen': 'j.last_seen',
+}
+# Columns written by bulk exports, in order
+EXPORT_COLUMNS = ['id', 'title', 'company', 'location', 'type', 'description', 'requirements', 'responsibilities',
+                  'benefits', 'salary_range', 'experience_level', 'skills', 'apply_link', 'source_url',
+                  'posted_date', 'deadline', 'scraped_at', 'first_seen', 'last_seen', 'is_active']
+SEARCH_FIELDS = ['id', 'title', 'company', 'location', 'type', 'description', 'apply_link', 'scraped_at']
+
+# Query parameters that vary between visits without changing the posting
+TRACKING_PARAMS = {'ref', 'source', 'src', 'fbclid', 'gclid', 'mc_cid', 'mc_eid'}
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lowercase and collapse whitespace so cosmetic changes don't alter a fingerprint."""
+    return re.sub(r'\s+', ' ', (value or '').strip().lower())
+
+
+def canonical_url(url: Optional[str]) -> str:
+    """Canonical form of an apply link: lowercase host without ``www.``, no
+    fragment, no trailing slash, tracking parameters removed, query sorted."""
+    url = (url or '').strip()
+    if not url:
+        return ''
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith('utm_')
+    )
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip('/'), urlencode(query), ''))
+
+
+def job_fingerprint(job: Dict) -> str:
+    """Deterministic dedup key for a job.
+    
+    Unlike the built-in ``hash()``, which is salted per process, this is
+    stable across runs and machines.
+    """
+    key = '\x1f'.join((
+        normalize_text(job.get('title')),
+        normalize_text(job.get('company')),
+        normalize_text(job.get('location')),
+        canonical_url(job.get('apply_link')),
+    ))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class ConnectionManager:
+    """Long-lived SQLite connections with a pragma profile, one per thread (they can't be shared)."""
+    
+    def __init__(self, db_path: str, profile: Union[str, Dict] = DB_PRAGMA_PROFILE):
+        self.db_path = db_path
+        if isinstance(profile, str):
+            if profile not in PRAGMA_PROFILES:
+                raise ValueError(f"Unknown pragma profile '{profile}', expected one of {list(PRAGMA_PROFILES)}")
+            profile = PRAGMA_PROFILES[profile]
+        self.pragmas = dict(profile)
+        self._local = threading.local()
+    
+    def connect(self) -> sqlite3.Connection:
+        """Open a new connection with the profile's pragmas applied."""
+        busy_timeout = self.pragmas.get('busy_timeout', 5000)
+        conn = sqlite3.connect(self.db_path, timeout=busy_timeout / 1000)
+        # Lets retention hand freed pages back to the file system (see
+        # JobDatabase.incremental_vacuum). Only takes effect on a new file and
+        # must come before journal_mode; a no-op for existing databases.
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+    
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self.connect()
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection, if it has one."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
 class JobDatabase:
     """Local SQLite database for job storage and deduplication."""
     
-    def __init__(self, db_path: str = "jobs.db"):
+    def __init__(self, db_path: str = DB_PATH, profile: Union[str, Dict] = DB_PRAGMA_PROFILE):
         self.db_path = db_path
+        self.connections = ConnectionManager(db_path, profile)
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        return self.connections.connection()
+    
     def init_database(self):
-        """Initialize the database with required tables."""
-        conn = sqlite3.connect(self.db_path)
+        """Initialize the database with required tables.
+        
+        The schema version is stored in ``PRAGMA user_version``; when it is
+        current, the DDL below is skipped entirely, so opening an up-to-date
+        database costs a single pragma read.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+            self.fts_enabled = cursor.fetchone() is not None
+            return
+        
         # Create jobs table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS jobs (
@@ -41,10 +217,37 @@ class JobDatabase:
                 posted_to_api BOOLEAN DEFAULT FALSE,
                 hash TEXT UNIQUE,
                 is_active BOOLEAN DEFAULT TRUE,
-                view_count INTEGER DEFAULT 0
+                view_count INTEGER DEFAULT 0,
+                api_payload TEXT,
+                publish_after TIMESTAMP,
+                publish_attempts INTEGER DEFAULT 0,
+                publish_error TEXT,
+                first_seen TIMESTAMP,
+                last_seen TIMESTAMP
             )
         ''')
         
+        # Outbox columns: new jobs wait for the background publisher with
+        # publish_after set; NULL means published, given up, or never queued
+        added = self._add_missing_columns(cursor, 'jobs', [
+            ('api_payload', 'TEXT'),
+            ('publish_after', 'TIMESTAMP'),
+            ('publish_attempts', 'INTEGER DEFAULT 0'),
+            ('publish_error', 'TEXT'),
+        ])
+        if 'publish_after' in added:
+            # Jobs stored before the outbox were posted synchronously when found
+            cursor.execute('UPDATE jobs SET posted_to_api = 1')
+        
+        # Lifecycle columns: scraped_at/first_seen is the first sighting,
+        # last_seen the latest run that still listed the job
+        added = self._add_missing_columns(cursor, 'jobs', [
+            ('first_seen', 'TIMESTAMP'),
+            ('last_seen', 'TIMESTAMP'),
+        ])
+        if 'last_seen' in added:
+            cursor.execute('UPDATE jobs SET first_seen = scraped_at, last_seen = scraped_at')
+        
         # Create scraping_runs table for monitoring
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS scraping_runs (
@@ -54,60 +257,529 @@ class JobDatabase:
                 jobs_new INTEGER DEFAULT 0,
                 success BOOLEAN DEFAULT TRUE,
                 error_message TEXT,
-                run_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                run_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                skipped BOOLEAN DEFAULT FALSE,
+                jobs_updated INTEGER DEFAULT 0,
+                jobs_duplicate INTEGER DEFAULT 0,
+                jobs_failed INTEGER DEFAULT 0,
+                fetch_seconds REAL,
+                store_seconds REAL,
+                jobs_deactivated INTEGER DEFAULT 0
             )
         ''')
         
-        # Create index for faster lookups
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_hash ON jobs(hash)')
+        # Columns added after the first release
+        self._add_missing_columns(cursor, 'scraping_runs', [
+            ('skipped', 'BOOLEAN DEFAULT FALSE'),
+            ('jobs_updated', 'INTEGER DEFAULT 0'),
+            ('jobs_duplicate', 'INTEGER DEFAULT 0'),
+            ('jobs_failed', 'INTEGER DEFAULT 0'),
+            ('fetch_seconds', 'REAL'),
+            ('store_seconds', 'REAL'),
+            ('jobs_deactivated', 'INTEGER DEFAULT 0'),
+        ])
+        
+        # Create index for faster lookups. Dedup lookups (hash = ? / hash IN (...))
+        # are served by the UNIQUE constraint's own index on hash, which makes a
+        # separate idx_job_hash a redundant copy that only slows down inserts.
+        cursor.execute('DROP INDEX IF EXISTS idx_job_hash')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_company ON jobs(company)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_scraped_at ON jobs(scraped_at)')
         
+        # Listing queries only ever look at active jobs, newest first. NULL
+        # is_active (rows from before the column existed) is normalized so
+        # the queries can say ``is_active = 1`` and use the partial indexes.
+        cursor.execute('UPDATE jobs SET is_active = 1 WHERE is_active IS NULL')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_active_scraped_at ON jobs(scraped_at) WHERE is_active = 1')
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_active_company_scraped_at ON jobs(company, scraped_at) WHERE is_active = 1'
+        )
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_runs_run_time ON scraping_runs(run_time)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_last_seen ON jobs(last_seen)')
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_outbox ON jobs(publish_after) WHERE posted_to_api = 0'
+        )
+        
+        # Small key/value table; data_version is bumped by every write that
+        # changes what the API returns, so readers can tell if cached data is stale
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0)")
+        
+        self.fts_enabled = self._init_search_index(cursor)
+        self._init_statistics(cursor)
+        conn.commit()
+        
+        if version < 2:
+            # Jobs may still carry salted hash() keys; recorded as done only once
+            # the backfill finished, so an interrupted one runs again next start
+            stats = self.backfill_fingerprints()
+            if stats['updated'] or stats['merged']:
+                logger.info(f"Recomputed job fingerprints: {stats}")
+        
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        conn.close()
         logger.info("Database initialized successfully")
     
+    def _init_statistics(self, cursor):
+        """Create the summary tables behind :meth:`get_statistics`.
+        
+        ``job_stats_totals`` (one row), ``job_stats_company`` and
+        ``job_stats_daily`` (per UTC day of ``scraped_at`` and company) hold
+        the number of jobs and of active jobs. Triggers on ``jobs`` keep
+        them in step inside the same transaction as every insert, delete
+        and deactivation, so the stats never drift from the table.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_stats_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                jobs INTEGER NOT NULL DEFAULT 0,
+                active INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_stats_company (
+                company TEXT PRIMARY KEY,
+                jobs INTEGER NOT NULL DEFAULT 0,
+                active INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_stats_daily (
+                day TEXT NOT NULL,
+                company TEXT NOT NULL,
+                jobs INTEGER NOT NULL DEFAULT 0,
+                active INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, company)
+            )
+        ''')
+        
+        def apply(row: str, sign: str) -> str:
+            """Statements adding (sign '+') or removing (sign '-') one job row from the stats."""
+            active = f"(CASE WHEN {row}.is_active = 1 THEN 1 ELSE 0 END)"
+            return f'''
+                UPDATE job_stats_totals SET jobs = jobs {sign} 1, active = active {sign} {active} WHERE id = 1;
+                INSERT INTO job_stats_company (company, jobs, active) VALUES ({row}.company, {sign}1, {sign}{active})
+                    ON CONFLICT (company) DO UPDATE SET jobs = jobs + excluded.jobs, active = active + excluded.active;
+                INSERT INTO job_stats_daily (day, company, jobs, active)
+                    VALUES (date({row}.scraped_at), {row}.company, {sign}1, {sign}{active})
+                    ON CONFLICT (day, company) DO UPDATE SET jobs = jobs + excluded.jobs, active = active + excluded.active;
+            '''
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS jobs_stats_insert AFTER INSERT ON jobs BEGIN
+                {apply('new', '+')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS jobs_stats_delete AFTER DELETE ON jobs BEGIN
+                {apply('old', '-')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS jobs_stats_update AFTER UPDATE OF company, scraped_at, is_active ON jobs BEGIN
+                {apply('old', '-')}
+                {apply('new', '+')}
+            END
+        ''')
+        
+        cursor.execute("SELECT 1 FROM job_stats_totals WHERE id = 1")
+        if cursor.fetchone() is None:
+            # First start with the summary tables: count the jobs already stored
+            self._rebuild_statistics(cursor)
+            logger.info("Built job statistics summary")
+    
+    def _rebuild_statistics(self, cursor):
+        """Recompute the summary tables from ``jobs``."""
+        cursor.execute("DELETE FROM job_stats_totals")
+        cursor.execute("DELETE FROM job_stats_company")
+        cursor.execute("DELETE FROM job_stats_daily")
+        cursor.execute('''
+            INSERT INTO job_stats_totals (id, jobs, active)
+            SELECT 1, COUNT(*), COALESCE(SUM(is_active = 1), 0) FROM jobs
+        ''')
+        cursor.execute('''
+            INSERT INTO job_stats_company (company, jobs, active)
+            SELECT company, COUNT(*), SUM(is_active = 1) FROM jobs GROUP BY company
+        ''')
+        cursor.execute('''
+            INSERT INTO job_stats_daily (day, company, jobs, active)
+            SELECT date(scraped_at), company, COUNT(*), SUM(is_active = 1) FROM jobs GROUP BY 1, 2
+        ''')
+    
+    def rebuild_statistics(self):
+        """Recompute the summary tables from scratch (e.g. after editing ``jobs`` by hand)."""
+        conn = self._connect()
+        with conn:
+            self._rebuild_statistics(conn.cursor())
+            self._bump_data_version(conn)
+    
+    def _init_search_index(self, cursor) -> bool:
+        """Create the FTS5 index over ``jobs`` and the triggers that keep it in sync.
+        
+        Returns False when this SQLite build lacks FTS5; search then falls
+        back to LIKE.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+        exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    {', '.join(SEARCH_COLUMNS)},
+                    content='jobs', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+            return False
+        
+        columns = ', '.join(SEARCH_COLUMNS)
+        new_values = ', '.join(f'new.{c}' for c in SEARCH_COLUMNS)
+        old_values = ', '.join(f'old.{c}' for c in SEARCH_COLUMNS)
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+        # Only re-index when searchable text changes, not on view_count bumps
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF {columns} ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO jobs_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        ''')
+        
+        if not exists:
+            # Index the jobs that were stored before the search index existed
+            cursor.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+            logger.info("Built full-text search index")
+        
+        return True
+    
+    def _add_missing_columns(self, cursor, table: str, columns: List[tuple]) -> List[str]:
+        """Add any of ``columns`` that an older database file is missing; return the added names."""
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in cursor.fetchall()}
+        added = []
+        for column_name, column_type in columns:
+            if column_name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+                logger.info(f"Added column {table}.{column_name}")
+                added.append(column_name)
+        return added
+    
+    def _bump_data_version(self, conn: sqlite3.Connection):
+        """Mark the stored data as changed; call inside the writing transaction."""
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+    
+    def data_version(self) -> int:
+        """Counter that changes whenever jobs, runs or stats change (in any process)."""
+        return self.get_meta('data_version')
+    
+    def get_meta(self, key: str, default: int = 0) -> int:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+    
+    def set_meta(self, key: str, value: int):
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
     def _generate_job_hash(self, job: Dict) -> str:
         """Generate a unique hash for job deduplication."""
-        # Use title + company + location for uniqueness
-        unique_string = f"{job['title'].lower().strip()}_{job['company'].lower().strip()}_{job.get('location', '').lower().strip()}"
-        return str(hash(unique_string))
+        # Use title + company + location + apply link for uniqueness
+        return job_fingerprint(job)
+    
+    def backfill_fingerprints(self, batch_size: int = 500) -> Dict:
+        """Recompute every job's fingerprint and collapse the duplicates.
+        
+        Rows are processed in id order, one transaction per batch, so the
+        write lock is only held briefly. When several rows share a
+        fingerprint the oldest one is kept (its ``scraped_at`` is the first
+        sighting) with the newest ``last_seen``, active if any copy was, and
+        the view counts of all of them.
+        """
+        conn = self._connect()
+        stats = {'scanned': 0, 'updated': 0, 'merged': 0}
+        last_id = 0
+        
+        while True:
+            with conn:
+                rows = conn.execute('''
+                    SELECT id, title, company, location, apply_link, hash, COALESCE(view_count, 0),
+                           COALESCE(last_seen, scraped_at), is_active
+                    FROM jobs WHERE id > ? ORDER BY id LIMIT ?
+                ''', (last_id, batch_size)).fetchall()
+                if not rows:
+                    break
+                
+                for job_id, title, company, location, apply_link, old_hash, views, last_seen, active in rows:
+                    fingerprint = job_fingerprint({
+                        'title': title, 'company': company, 'location': location, 'apply_link': apply_link
+                    })
+                    if fingerprint == old_hash:
+                        continue
+                    
+                    owner = conn.execute('''
+                        SELECT id, COALESCE(view_count, 0), COALESCE(last_seen, scraped_at), is_active
+                        FROM jobs WHERE hash = ?
+                    ''', (fingerprint,)).fetchone()
+                    if owner and owner[0] < job_id:
+                        # An older row already carries this fingerprint: fold this one into it
+                        conn.execute('''
+                            UPDATE jobs SET view_count = COALESCE(view_count, 0) + ?,
+                                            last_seen = MAX(COALESCE(last_seen, scraped_at), ?),
+                                            is_active = MAX(COALESCE(is_active, 0), ?)
+                            WHERE id = ?
+                        ''', (views, last_seen, active or 0, owner[0]))
+                        conn.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+                        stats['merged'] += 1
+                        continue
+                    if owner:
+                        # A newer copy was inserted after the fingerprint change; keep this older row
+                        conn.execute('DELETE FROM jobs WHERE id = ?', (owner[0],))
+                        views += owner[1]
+                        last_seen = max(last_seen, owner[2])
+                        active = max(active or 0, owner[3] or 0)
+                        stats['merged'] += 1
+                    
+                    conn.execute('UPDATE jobs SET hash = ?, view_count = ?, last_seen = ?, is_active = ? WHERE id = ?',
+                                 (fingerprint, views, last_seen, active, job_id))
+                    stats['updated'] += 1
+            
+            stats['scanned'] += len(rows)
+            last_id = rows[-1][0]
+            logger.info(f"Backfilled fingerprints up to job {last_id}: {stats}")
+        
+        if stats['updated'] or stats['merged']:
+            with conn:
+                self._bump_data_version(conn)
+        return stats
     
     def add_job(self, job: Dict) -> bool:
         """Add a job to the database. Returns True if job is new, False if duplicate."""
-        job_hash = self._generate_job_hash(job)
+        return self.ingest_jobs([job])[0] == 'new'
+
+    def add_jobs(self, jobs: List[Dict]) -> List[bool]:
+        """Add a batch of jobs in a single transaction.
         
-        conn = sqlite3.connect(self.db_path)
+        Returns one flag per job, True if it was new and False if it was
+        already stored (see :meth:`ingest_jobs` for the detailed status).
+        """
+        return [status == 'new' for status in self.ingest_jobs(jobs)]
+    
+    def ingest_jobs(self, jobs: List[Dict]) -> List[str]:
+        """Store a batch of jobs in a single transaction.
+        
+        Every job is written with one ``INSERT ... ON CONFLICT(hash) DO
+        UPDATE``: new jobs are inserted with ``first_seen`` and
+        ``last_seen`` set to now, known ones only get ``last_seen`` moved
+        forward. Returns one status per job: ``'new'``; ``'updated'`` if it
+        was already stored but its type, description or source URL changed
+        (the stored row is refreshed) or it had been deactivated and is
+        listed again; ``'duplicate'`` if it was already stored unchanged or
+        appeared earlier in the same batch.
+        """
+        if not jobs:
+            return []
+        
+        hashes = [self._generate_job_hash(job) for job in jobs]
+        seen_at = self.now()
+        
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT INTO jobs (title, company, location, type, description, apply_link, source_url, hash)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job['title'],
-                job['company'], 
-                job.get('location', ''),
-                job.get('type', ''),
-                job.get('description', ''),
-                job.get('apply_link', ''),
-                job.get('source_url', ''),
-                job_hash
-            ))
+            # Look up which hashes are already stored (in chunks below SQLite's variable limit)
+            unique_hashes = list(dict.fromkeys(hashes))
+            existing = {}
+            for i in range(0, len(unique_hashes), 500):
+                chunk = unique_hashes[i:i + 500]
+                cursor.execute(
+                    f"SELECT hash, type, description, source_url, is_active FROM jobs "
+                    f"WHERE hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                existing.update((row[0], row[1:]) for row in cursor.fetchall())
+            
+            statuses = []
+            rows = []
+            updates = []
+            reactivated = []
+            seen = set()
+            for job, job_hash in zip(jobs, hashes):
+                if job_hash in seen:
+                    statuses.append('duplicate')
+                    continue
+                seen.add(job_hash)
+                
+                content = (job.get('type', ''), job.get('description', ''), job.get('source_url', ''))
+                stored = existing.get(job_hash)
+                if stored is None:
+                    statuses.append('new')
+                else:
+                    changed = content != stored[:3]
+                    if changed:
+                        updates.append(content + (job_hash,))
+                    if stored[3] != 1:
+                        reactivated.append((job_hash,))
+                    statuses.append('updated' if changed or stored[3] != 1 else 'duplicate')
+                
+                rows.append((
+                    job['title'],
+                    job['company'],
+                    job.get('location', ''),
+                    job.get('type', ''),
+                    job.get('description', ''),
+                    job.get('apply_link', ''),
+                    job.get('source_url', ''),
+                    job_hash,
+                    self._api_payload(job) if stored is None else None,
+                    seen_at,
+                    seen_at
+                ))
+            
+            cursor.executemany('''
+                INSERT INTO jobs (title, company, location, type, description, apply_link, source_url, hash,
+                                  api_payload, publish_after, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
+                ON CONFLICT(hash) DO UPDATE SET last_seen = excluded.last_seen
+            ''', rows)
+            cursor.executemany('''
+                UPDATE jobs SET type = ?, description = ?, source_url = ? WHERE hash = ?
+            ''', updates)
+            cursor.executemany('''
+                UPDATE jobs SET is_active = 1 WHERE hash = ? AND is_active != 1
+            ''', reactivated)
+            if any(status != 'duplicate' for status in statuses):
+                self._bump_data_version(conn)
             conn.commit()
-            logger.info(f"Added new job: {job['title']} at {job['company']}")
-            return True
             
-        except sqlite3.IntegrityError:
-            # Duplicate job
-            logger.debug(f"Duplicate job skipped: {job['title']} at {job['company']}")
-            return False
-        finally:
-            conn.close()
-
+            for job, status in zip(jobs, statuses):
+                if status == 'new':
+                    logger.info(f"Added new job: {job['title']} at {job['company']}")
+                elif status == 'updated':
+                    logger.info(f"Updated job: {job['title']} at {job['company']}")
+                else:
+                    logger.debug(f"Duplicate job skipped: {job['title']} at {job['company']}")
+            return statuses
+            
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+    
+    def touch_jobs(self, jobs: List[Dict], seen_at: Optional[str] = None):
+        """Move ``last_seen`` forward for jobs that are still listed but were not re-ingested
+        (e.g. because the career page was unchanged)."""
+        seen_at = seen_at or self.now()
+        conn = self._connect()
+        with conn:
+            conn.executemany("UPDATE jobs SET last_seen = ? WHERE hash = ?",
+                             [(seen_at, self._generate_job_hash(job)) for job in jobs])
+    
+    def deactivate_missing(self, companies: List[str], run_started_at: str) -> int:
+        """Deactivate the companies' active jobs that a run starting at ``run_started_at`` did not see.
+        
+        Call only after a successful run that stored at least one job, so a
+        broken parser or an empty page doesn't retire every posting. Jobs
+        that show up again are reactivated by :meth:`ingest_jobs`.
+        """
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(f'''
+                UPDATE jobs SET is_active = 0
+                WHERE is_active = 1 AND company IN ({','.join('?' * len(companies))}) AND last_seen < ?
+            ''', list(companies) + [run_started_at])
+            deactivated = cursor.rowcount
+            if deactivated:
+                self._bump_data_version(conn)
+        
+        if deactivated:
+            logger.info(f"Deactivated {deactivated} jobs no longer listed by {', '.join(companies)}")
+        return deactivated
+    
+    @staticmethod
+    def _api_payload(job: Dict) -> str:
+        """The job exactly as the parser produced it, to be posted by the publisher."""
+        return json.dumps(job, ensure_ascii=False, default=str)
+    
+    def pending_publications(self, limit: int = 100) -> List[Dict]:
+        """Jobs in the outbox whose (re)try time has come, oldest first.
+        
+        Each entry has the job ``id``, the ``payload`` to post and the
+        number of ``attempts`` made so far.
+        """
+        rows = self._connect().execute('''
+            SELECT id, api_payload, publish_attempts, title, company, location, type, description, apply_link
+            FROM jobs
+            WHERE posted_to_api = 0 AND publish_after <= ?
+            ORDER BY publish_after
+            LIMIT ?
+        ''', (self._cutoff(0), limit)).fetchall()
+        
+        pending = []
+        for job_id, payload, attempts, *columns in rows:
+            if payload:
+                payload = json.loads(payload)
+            else:
+                payload = dict(zip(['title', 'company', 'location', 'type', 'description', 'apply_link'], columns))
+            pending.append({'id': job_id, 'payload': payload, 'attempts': attempts or 0})
+        return pending
+    
+    def mark_published(self, job_ids: List[int]):
+        """Take published jobs out of the outbox."""
+        conn = self._connect()
+        with conn:
+            conn.executemany('''
+                UPDATE jobs SET posted_to_api = 1, publish_after = NULL, publish_error = NULL, api_payload = NULL
+                WHERE id = ?
+            ''', [(job_id,) for job_id in job_ids])
+    
+    def mark_publish_failed(self, failures: List[tuple]):
+        """Record failed publish attempts.
+        
+        ``failures`` holds ``(job_id, error, retry_at)`` tuples; ``retry_at``
+        is a timestamp for the next attempt, or None to stop retrying.
+        """
+        conn = self._connect()
+        with conn:
+            conn.executemany('''
+                UPDATE jobs SET publish_attempts = COALESCE(publish_attempts, 0) + 1, publish_error = ?, publish_after = ?
+                WHERE id = ?
+            ''', [(error, retry_at, job_id) for job_id, error, retry_at in failures])
+    
+    def requeue_failed_publications(self) -> int:
+        """Put jobs the publisher gave up on back into the outbox."""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute('''
+                UPDATE jobs SET publish_after = CURRENT_TIMESTAMP, publish_attempts = 0
+                WHERE posted_to_api = 0 AND publish_after IS NULL AND publish_error IS NOT NULL
+            ''')
+        return cursor.rowcount
+    
+    def outbox_stats(self) -> Dict:
+        """Jobs waiting to be published and jobs the publisher gave up on."""
+        pending, failed = self._connect().execute('''
+            SELECT COUNT(publish_after), COUNT(*) - COUNT(publish_after)
+            FROM jobs WHERE posted_to_api = 0 AND (publish_after IS NOT NULL OR publish_error IS NOT NULL)
+        ''').fetchone()
+        return {'pending': pending, 'failed': failed}
+    
     def get_job_details(self, job_id: int) -> Optional[Dict]:
         """Get detailed job information by ID and increment view count."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -116,7 +788,7 @@ class JobDatabase:
                 SELECT id, title, company, location, type, description, requirements, 
                        responsibilities, benefits, salary_range, experience_level, skills,
                        apply_link, source_url, posted_date, deadline, scraped_at, view_count
-                FROM jobs WHERE id = ? AND is_active = TRUE
+                FROM jobs WHERE id = ? AND is_active = 1
             ''', (job_id,))
             
             job = cursor.fetchone()
@@ -152,149 +824,402 @@ class JobDatabase:
             return job_dict
             
         except sqlite3.Error as e:
+            conn.rollback()
             logger.error(f"Error getting job details: {e}")
             return None
-        finally:
-            conn.close()
 
     def search_jobs(self, query: str, limit: int = 20) -> List[Dict]:
-        """Search jobs by title, company, or description."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Search jobs by title, company, location, skills or description.
         
+        Results are ranked by bm25 (title matches weigh most) and the last
+        word is treated as a prefix, so partial input like ``pyth`` matches.
+        Each result carries a ``snippet``: HTML-escaped text with the matched
+        terms wrapped in ``<mark>`` tags.
+        """
         try:
-            cursor.execute('''
-                SELECT id, title, company, location, type, description, apply_link, scraped_at
-                FROM jobs 
-                WHERE is_active = TRUE AND (
-                    title LIKE ? OR 
-                    company LIKE ? OR 
-                    description LIKE ? OR
-                    skills LIKE ?
-                )
-                ORDER BY scraped_at DESC
-                LIMIT ?
-            ''', (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', limit))
-            
-            jobs = []
-            for row in cursor.fetchall():
-                jobs.append({
-                    'id': row[0],
-                    'title': row[1],
-                    'company': row[2],
-                    'location': row[3],
-                    'type': row[4],
-                    'description': row[5][:200] + '...' if row[5] and len(row[5]) > 200 else row[5],
-                    'apply_link': row[6],
-                    'scraped_at': row[7]
-                })
-            
-            return jobs
-            
+            return list(self.iter_search_jobs(query, limit))
         except sqlite3.Error as e:
             logger.error(f"Error searching jobs: {e}")
             return []
-        finally:
-            conn.close()
+    
+    def iter_search_jobs(self, query: str, limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                         after: Optional[tuple] = None) -> Iterator[Dict]:
+        """Yield search results one at a time, best match first.
+        
+        ``fields`` restricts the returned columns (see ``JOB_FIELDS``;
+        ``snippet`` and ``score`` are always included). ``after`` is the
+        :meth:`search_sort_key` of the last result of the previous page.
+        """
+        match = self._fts_query(query)
+        if not self.fts_enabled or not match:
+            yield from self._iter_search_jobs_like(query, limit, fields, after)
+            return
+        
+        names = self._job_fields(fields or SEARCH_FIELDS)
+        weights = ', '.join(str(SEARCH_WEIGHTS[c]) for c in SEARCH_COLUMNS)
+        sql = f'''
+            SELECT * FROM (
+                SELECT {', '.join(JOB_FIELDS[name] for name in names)},
+                       snippet(jobs_fts, -1, ?, ?, '...', 24) AS snippet,
+                       bm25(jobs_fts, {weights}) AS rank, j.id AS key_id
+                FROM jobs_fts
+                JOIN jobs j ON j.id = jobs_fts.rowid
+                WHERE jobs_fts MATCH ? AND j.is_active = 1
+            )
+        '''
+        params = [SNIPPET_MARKS[0], SNIPPET_MARKS[1], match]
+        if after:
+            # bm25 ranks are negative, lower is better; score is the negated rank
+            sql += " WHERE rank > ? OR (rank = ? AND key_id > ?)"
+            params += [-after[0], -after[0], after[1]]
+        sql += " ORDER BY rank, key_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        for row in self._connect().execute(sql, params):
+            job = dict(zip(names, row))
+            job['snippet'] = self._snippet_html(row[len(names)])
+            job['score'] = -row[len(names) + 1]
+            yield job
+    
+    @staticmethod
+    def _snippet_html(snippet: Optional[str]) -> Optional[str]:
+        """Escape scraped text for HTML, then turn the match markers into ``<mark>`` tags."""
+        if snippet is None:
+            return None
+        start, end = SNIPPET_MARKS
+        return html.escape(snippet).replace(start, '<mark>').replace(end, '</mark>')
+    
+    @staticmethod
+    def search_sort_key(job: Dict) -> tuple:
+        """Position of a search result, for the ``after`` of the next page."""
+        if job.get('score') is not None:
+            return job['score'], job['id']
+        return job['scraped_at'], job['id']
+    
+    def _fts_query(self, query: str) -> str:
+        """Turn free text into an FTS5 query: every word must match, the last as a prefix."""
+        words = re.findall(r'\w+', query or '')
+        if not words:
+            return ''
+        terms = [f'"{word}"' for word in words]
+        terms[-1] += '*'
+        return ' '.join(terms)
+    
+    @staticmethod
+    def _job_fields(fields: List[str]) -> List[str]:
+        """Validate a ``fields`` projection; the sort key columns are always included."""
+        unknown = [name for name in fields if name not in JOB_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(unknown)}")
+        return list(dict.fromkeys(list(fields) + ['id', 'scraped_at']))
+    
+    def _iter_search_jobs_like(self, query: str, limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                               after: Optional[tuple] = None) -> Iterator[Dict]:
+        """Unranked substring search, newest first; used when FTS5 is unavailable."""
+        names = self._job_fields(fields or SEARCH_FIELDS)
+        sql = f'''
+            SELECT {', '.join(JOB_FIELDS[name] for name in names)}
+            FROM jobs j
+            WHERE j.is_active = 1 AND (
+                j.title LIKE ? OR 
+                j.company LIKE ? OR 
+                j.description LIKE ? OR
+                j.skills LIKE ?
+            )
+        '''
+        params = [f'%{query}%'] * 4
+        if after:
+            sql += " AND (j.scraped_at, j.id) < (?, ?)"
+            params += list(after)
+        sql += " ORDER BY j.scraped_at DESC, j.id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        for row in self._connect().execute(sql, params):
+            job = dict(zip(names, row))
+            job['snippet'] = None
+            job['score'] = None
+            yield job
+    
+    def _search_jobs_like(self, query: str, limit: int = 20) -> List[Dict]:
+        """Unranked substring search, used when FTS5 is unavailable."""
+        try:
+            return list(self._iter_search_jobs_like(query, limit))
+        except sqlite3.Error as e:
+            logger.error(f"Error searching jobs: {e}")
+            return []
+    
+    @staticmethod
+    def _cutoff(days: float) -> str:
+        """Timestamp ``days`` ago, in the format SQLite's CURRENT_TIMESTAMP stores."""
+        return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+    
+    @classmethod
+    def now(cls) -> str:
+        """Current UTC time, in the format SQLite's CURRENT_TIMESTAMP stores."""
+        return cls._cutoff(0)
+    
+    def _recent_jobs_query(self, company: Optional[str] = None, days: int = 7, fields: Optional[List[str]] = None,
+                           after: Optional[tuple] = None, limit: Optional[int] = None) -> tuple:
+        """SQL, parameters and column names for :meth:`iter_recent_jobs`.
+        
+        The filter is written so it matches the partial indexes: a plain
+        ``is_active = 1``, a bound cutoff instead of a ``datetime('now')``
+        expression, and ``company = ?`` leading the composite index. Both
+        indexes end in the rowid, so ``scraped_at DESC, id DESC`` and the
+        keyset condition on that pair are served without a sort.
+        """
+        names = self._job_fields(fields or list(JOB_FIELDS))
+        query = f'''
+            SELECT {', '.join(JOB_FIELDS[name] for name in names)}
+            FROM jobs j
+            WHERE j.is_active = 1 AND j.scraped_at >= ?
+        '''
+        params = [self._cutoff(days)]
+        
+        if company:
+            query += " AND j.company = ?"
+            params.append(company)
+        
+        if after:
+            query += " AND (j.scraped_at, j.id) < (?, ?)"
+            params += list(after)
+        
+        query += " ORDER BY j.scraped_at DESC, j.id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, params, names
+    
+    def iter_recent_jobs(self, company: Optional[str] = None, days: int = 7, fields: Optional[List[str]] = None,
+                         after: Optional[tuple] = None, limit: Optional[int] = None) -> Iterator[Dict]:
+        """Yield jobs scraped in the last N days, newest first, without loading them all.
+        
+        ``fields`` restricts the returned columns (see ``JOB_FIELDS``; ``id``
+        and ``scraped_at`` are always included). ``after`` is the
+        ``(scraped_at, id)`` of the last job of the previous page.
+        """
+        query, params, names = self._recent_jobs_query(company, days, fields, after, limit)
+        for row in self._connect().execute(query, params):
+            yield dict(zip(names, row))
     
     def get_recent_jobs(self, company: Optional[str] = None, days: int = 7) -> List[Dict]:
         """Get jobs scraped in the last N days."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = '''
-            SELECT id, title, company, location, type, description, apply_link, scraped_at, 
-                   COALESCE(experience_level, '') as experience_level, 
-                   COALESCE(salary_range, '') as salary_range, 
-                   COALESCE(skills, '') as skills, 
-                   COALESCE(posted_date, '') as posted_date
-            FROM jobs 
-            WHERE COALESCE(is_active, 1) = 1 AND scraped_at >= datetime('now', '-{} days')
-        '''.format(days)
+        return list(self.iter_recent_jobs(company, days))
+    
+    def iter_export(self, since: Optional[str] = None, company: Optional[str] = None,
+                    include_inactive: bool = False, batch_size: int = 1000) -> Iterator[tuple]:
+        """Yield full job rows (``EXPORT_COLUMNS`` order) for a bulk export.
         
+        Runs on its own connection so a long export neither holds up nor
+        sees half of a write on the thread's shared connection: the single
+        SELECT reads one consistent WAL snapshot from start to finish, and
+        rows are pulled ``batch_size`` at a time, so memory stays flat
+        however many jobs there are.
+        """
+        query = f"SELECT {', '.join(EXPORT_COLUMNS)} FROM jobs WHERE 1 = 1"
         params = []
+        if not include_inactive:
+            query += " AND is_active = 1"
+        if since:
+            query += " AND scraped_at >= ?"
+            params.append(since)
         if company:
             query += " AND company = ?"
             params.append(company)
+        query += " ORDER BY id"
         
-        query += " ORDER BY scraped_at DESC"
-        
-        cursor.execute(query, params)
-        jobs = []
-        for row in cursor.fetchall():
-            jobs.append({
-                'id': row[0],
-                'title': row[1],
-                'company': row[2],
-                'location': row[3],
-                'type': row[4],
-                'description': row[5][:200] + '...' if row[5] and len(row[5]) > 200 else row[5],
-                'apply_link': row[6],
-                'scraped_at': row[7],
-                'experience_level': row[8],
-                'salary_range': row[9],
-                'skills': row[10],
-                'posted_date': row[11]
-            })
-        
-        conn.close()
-        return jobs
-    
-    def record_scraping_run(self, company: str, jobs_found: int, jobs_new: int, success: bool = True, error: str = None):
-        """Record a scraping run for monitoring."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self.connections.connect()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            conn.close()
+    
+    def record_scraping_run(self, company: str, jobs_found: int, jobs_new: int, success: bool = True, error: str = None,
+                            skipped: bool = False, jobs_updated: int = 0, jobs_duplicate: int = 0,
+                            jobs_failed: int = 0, fetch_seconds: float = None, store_seconds: float = None,
+                            jobs_deactivated: int = 0):
+        """Record a scraping run for monitoring.
         
-        cursor.execute('''
-            INSERT INTO scraping_runs (company, jobs_found, jobs_new, success, error_message)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (company, jobs_found, jobs_new, success, error))
+        ``skipped`` marks runs that reused the previous job set because the
+        career page had not changed since the last run. The remaining
+        counts and timings come from the run's ingest result.
+        """
+        conn = self._connect()
         
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute('''
+                INSERT INTO scraping_runs (company, jobs_found, jobs_new, success, error_message, skipped,
+                                           jobs_updated, jobs_duplicate, jobs_failed, fetch_seconds, store_seconds,
+                                           jobs_deactivated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (company, jobs_found, jobs_new, success, error, skipped,
+                  jobs_updated, jobs_duplicate, jobs_failed, fetch_seconds, store_seconds, jobs_deactivated))
+            self._bump_data_version(conn)
     
     def get_statistics(self) -> Dict:
-        """Get overall statistics."""
-        conn = sqlite3.connect(self.db_path)
+        """Get overall statistics.
+        
+        Read from the summary tables, so the cost does not grow with the
+        number of stored jobs. ``active_jobs`` counts the jobs that are
+        still listed; ``today_jobs`` and ``week_jobs`` the active jobs
+        scraped today and over the last 7 days (UTC calendar days).
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Total jobs
-        cursor.execute("SELECT COUNT(*) FROM jobs")
-        total_jobs = cursor.fetchone()[0]
+        cursor.execute("SELECT jobs, active FROM job_stats_totals WHERE id = 1")
+        total_jobs, active_jobs = cursor.fetchone() or (0, 0)
         
         # Jobs by company
-        cursor.execute("SELECT company, COUNT(*) FROM jobs GROUP BY company ORDER BY COUNT(*) DESC")
+        cursor.execute("SELECT company, jobs FROM job_stats_company WHERE jobs > 0 ORDER BY jobs DESC")
         jobs_by_company = dict(cursor.fetchall())
         
+        # Active jobs per day
+        today = datetime.now(timezone.utc).date()
+        cursor.execute('''
+            SELECT COALESCE(SUM(CASE WHEN day = ? THEN active END), 0), COALESCE(SUM(active), 0)
+            FROM job_stats_daily WHERE day >= ?
+        ''', (today.isoformat(), (today - timedelta(days=6)).isoformat()))
+        today_jobs, week_jobs = cursor.fetchone()
+        
         # Recent runs
         cursor.execute("""
             SELECT company, jobs_found, jobs_new, success, run_time 
             FROM scraping_runs 
-            WHERE run_time >= datetime('now', '-24 hours')
+            WHERE run_time >= ?
             ORDER BY run_time DESC
-        """)
+        """, (self._cutoff(1),))
         recent_runs = cursor.fetchall()
         
-        conn.close()
-        
         return {
             'total_jobs': total_jobs,
+            'active_jobs': active_jobs,
+            'today_jobs': today_jobs,
+            'week_jobs': week_jobs,
             'jobs_by_company': jobs_by_company,
             'recent_runs': recent_runs
         }
     
-    def cleanup_old_jobs(self, days: int = 90):
-        """Remove jobs older than specified days."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def purge_batch(self, table: str, cutoff: str, batch_size: int = 500,
+                    archive: Optional[Callable[[str, List[Dict]], None]] = None) -> int:
+        """Delete up to ``batch_size`` rows of ``table`` that expired before ``cutoff``.
         
-        cursor.execute("DELETE FROM jobs WHERE scraped_at < datetime('now', '-{} days')".format(days))
-        deleted = cursor.rowcount
+        Jobs expire by ``last_seen``, scraping runs by ``run_time``; both
+        are indexed, so a batch costs the same however large the table is.
+        When given, ``archive(table, rows)`` is called with the rows (as
+        dicts) before they are deleted; if it raises, nothing is deleted.
+        Each batch is its own short transaction. Returns the rows deleted,
+        0 once nothing has expired.
+        """
+        column = RETENTION_COLUMNS[table]
+        conn = self._connect()
         
-        cursor.execute("DELETE FROM scraping_runs WHERE run_time < datetime('now', '-{} days')".format(days))
+        cursor = conn.execute(
+            f"SELECT * FROM {table} WHERE {column} < ? ORDER BY {column} LIMIT ?", (cutoff, batch_size)
+        )
+        names = [description[0] for description in cursor.description]
+        rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+        if not rows:
+            return 0
         
-        conn.commit()
-        conn.close()
+        if archive is not None:
+            archive(table, rows)
         
-        logger.info(f"Cleaned up {deleted} old jobs")
+        with conn:
+            # Re-check the cutoff: a job seen again since the SELECT is kept
+            # (it is then archived without being deleted, which is harmless)
+            cursor = conn.executemany(
+                f"DELETE FROM {table} WHERE id = ? AND {column} < ?", [(row['id'], cutoff) for row in rows]
+            )
+            deleted = cursor.rowcount
+            if table == 'jobs' and deleted:
+                # The triggers have already subtracted the deleted jobs; drop emptied days
+                conn.execute("DELETE FROM job_stats_daily WHERE jobs = 0")
+                self._bump_data_version(conn)
         return deleted
+    
+    def cleanup_old_jobs(self, days: int = 90, batch_size: int = 500,
+                         archive: Optional[Callable[[str, List[Dict]], None]] = None) -> int:
+        """Remove jobs (and scraping runs) that no run has seen for the specified number of days.
+        
+        Keyed on ``last_seen``, so a job that is still listed is kept however
+        long ago it was first scraped. Rows are deleted in batches of
+        ``batch_size`` (see :meth:`purge_batch`), so the write lock is never
+        held for long. Returns the number of jobs deleted.
+        """
+        cutoff = self._cutoff(days)
+        deleted = {}
+        for table in RETENTION_COLUMNS:
+            deleted[table] = 0
+            while True:
+                count = self.purge_batch(table, cutoff, batch_size, archive)
+                if not count:
+                    break
+                deleted[table] += count
+        
+        logger.info(f"Cleaned up {deleted['jobs']} old jobs and {deleted['scraping_runs']} old runs")
+        return deleted['jobs']
+    
+    def free_bytes(self) -> int:
+        """Size of the unused pages inside the database file."""
+        conn = self._connect()
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return conn.execute("PRAGMA freelist_count").fetchone()[0] * page_size
+    
+    def incremental_vacuum(self, pages: int = 0) -> int:
+        """Give up to ``pages`` free pages (0 = all) back to the file system; return the bytes reclaimed.
+        
+        Only databases in ``auto_vacuum = INCREMENTAL`` mode can do this
+        (new ones are; run ``python migrate_db.py --incremental-vacuum`` once
+        to convert an older file). Elsewhere it is a no-op returning 0.
+        """
+        conn = self._connect()
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return 0
+        before = self.free_bytes()
+        # executescript steps the pragma to completion; execute() would free a single page
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+        return before - self.free_bytes()
+    
+    def enable_incremental_vacuum(self):
+        """Switch an existing database to ``auto_vacuum = INCREMENTAL``.
+        
+        Takes a full VACUUM, which rewrites the file and locks it while it
+        runs, so this is a one-off migration step rather than maintenance.
+        """
+        conn = self._connect()
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        logger.info("Database switched to incremental vacuum")
+
+
+_database: Optional[JobDatabase] = None
+_database_lock = threading.Lock()
+
+
+def get_database() -> JobDatabase:
+    """The process-wide :class:`JobDatabase` at ``DB_PATH``, opened on first use.
+    
+    Modules call this where they need the database instead of opening one
+    at import time, so importing them stays cheap and the schema check runs
+    once per process.
+    """
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = JobDatabase()
+    return _database
@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+import re
+from datetime import datetime, timezone
+from typing import IO, Iterable, Iterator, Optional
+from .database import JobDatabase, EXPORT_COLUMNS, get_database
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+MIME_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+# Rows encoded per chunk; keeps writes large without buffering the export
+CHUNK_ROWS = 500
+
+
+def parse_since(value: Optional[str]) -> Optional[str]:
+    """Turn ``--since`` input into a ``scraped_at`` lower bound.
+
+    Accepts a relative age (``7d``, ``12h``) or an ISO date/datetime;
+    one with a UTC offset is converted to UTC, like ``scraped_at``, and
+    one without is taken to be UTC already.
+    """
+    if not value:
+        return None
+
+    match = re.fullmatch(r'(\d+)([dh])', value.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        return JobDatabase._cutoff(amount if unit == 'd' else amount / 24)
+
+    try:
+        since = datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise ValueError(f"Invalid --since value '{value}': use e.g. 7d, 12h or 2025-01-31")
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc)
+    return since.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def iter_ndjson(rows: Iterable[tuple]) -> Iterator[str]:
+    """Encode export rows as newline-delimited JSON, a chunk of lines at a time."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False))
+        if len(lines) >= CHUNK_ROWS:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def iter_csv(rows: Iterable[tuple]) -> Iterator[str]:
+    """Encode export rows as CSV with a header line, a chunk of lines at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_export(fmt: str, since: Optional[str] = None, company: Optional[str] = None,
+                include_inactive: bool = False, database: Optional[JobDatabase] = None) -> Iterator[str]:
+    """Stream the stored jobs in ``fmt`` (``ndjson`` or ``csv``) as text chunks."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {list(EXPORT_FORMATS)}")
+
+    rows = (database or get_database()).iter_export(since, company, include_inactive)
+    encoder = iter_ndjson if fmt == 'ndjson' else iter_csv
+    return encoder(rows)
+
+
+def export_jobs(out: IO[str], fmt: str = 'ndjson', **filters) -> None:
+    """Write a full export to a text stream (a file or stdout)."""
+    for chunk in iter_export(fmt, **filters):
+        out.write(chunk)
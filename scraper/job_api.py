@@ -1,50 +1,104 @@
-import requests
+import threading
+import time
+from typing import Dict, List, Optional
 from .utils.logger import setup_logger
-from .config import API_URL, API_TOKEN
-from .database import JobDatabase
+from .database import JobDatabase, get_database
+from .publisher import publisher
 
 logger = setup_logger("JobAPI")
-db = JobDatabase()
+
+_local = threading.local()
+
+
+class JobSink:
+    """Buffer the jobs posted on this thread and store them in one transaction on exit."""
+    
+    def __init__(self, database: Optional[JobDatabase] = None):
+        self.db = database or get_database()
+        self.pending: List[Dict] = []
+        self.results: List[Dict] = []
+        # Recorded with the run; failed jobs lack a title or company
+        self.counts = {'new': 0, 'updated': 0, 'duplicate': 0, 'failed': 0}
+        self.store_seconds = 0.0
+        # Companies whose unlisted jobs a successful run deactivates
+        self.companies = set()
+        self._previous = None
+    
+    def add(self, job_data: dict):
+        """Queue a job for the next flush."""
+        self.pending.append(job_data)
+    
+    def flush(self) -> List[Dict]:
+        """Store the queued jobs and return one status dict per job."""
+        if not self.pending:
+            return []
+        batch, self.pending = self.pending, []
+        
+        valid = [job_data for job_data in batch if job_data.get('title') and job_data.get('company')]
+        started = time.perf_counter()
+        try:
+            statuses = iter(self.db.ingest_jobs(valid))
+        except Exception:
+            self.counts['failed'] += len(batch)
+            raise
+        finally:
+            self.store_seconds += time.perf_counter() - started
+        self.companies.update(job_data['company'] for job_data in valid)
+        
+        results = []
+        for job_data in batch:
+            if not (job_data.get('title') and job_data.get('company')):
+                logger.warning(f"Skipping job without title or company: {job_data}")
+                self.counts['failed'] += 1
+                results.append({"status": "error", "error": "missing title or company", "job": job_data})
+                continue
+            
+            status = next(statuses)
+            self.counts[status] += 1
+            if status == 'new':
+                results.append({"status": "pending", "job": job_data})
+            else:
+                logger.debug(f"Skipping {status} job: {job_data.get('title')} ({job_data.get('company')})")
+                results.append({"status": status, "job": job_data})
+        
+        if self.counts['new']:
+            publisher.wake()
+        self.results.extend(results)
+        return results
+    
+    def __enter__(self):
+        self._previous = getattr(_local, 'sink', None)
+        _local.sink = self
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        _local.sink = self._previous
+        self.flush()
+        return False
+
 
 def post_job(job_data: dict):
-    """Post job data to the API endpoint and store in local database."""
+    """Store a job (buffered inside an active :class:`JobSink`) and queue it for the API."""
+    sink = getattr(_local, 'sink', None)
+    if sink is not None:
+        sink.add(job_data)
+        return {"status": "queued", "job": job_data}
     
     # Add to local database first (with deduplication)
-    is_new_job = db.add_job(job_data)
+    is_new_job = get_database().add_job(job_data)
     
     if not is_new_job:
         logger.debug(f"Skipping duplicate job: {job_data.get('title')} ({job_data.get('company')})")
         return {"status": "duplicate", "job": job_data}
     
-    # Only post new jobs to API
-    try:
-        headers = {"Content-Type": "application/json"}
-        if API_TOKEN:
-            headers["Authorization"] = f"Bearer {API_TOKEN}"
-        
-        response = requests.post(API_URL, json=job_data, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Mark as posted to API in database
-        # (We could add this field update here if needed)
-        
-        logger.info(f"Posted new job: {job_data.get('title')} ({job_data.get('company')})")
-        return response.json()
-        
-    except requests.exceptions.HTTPError as e:
-        logger.error(f"HTTP error posting job {job_data.get('title')}: {e}")
-        return {"status": "api_error", "error": str(e)}
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request error posting job {job_data.get('title')}: {e}")
-        return {"status": "request_error", "error": str(e)}
-    except Exception as e:
-        logger.error(f"Unexpected error posting job {job_data.get('title')}: {e}")
-        return {"status": "error", "error": str(e)}
+    # Only new jobs are published
+    publisher.wake()
+    return {"status": "pending", "job": job_data}
 
 def get_job_statistics():
     """Get job statistics from local database."""
-    return db.get_statistics()
+    return get_database().get_statistics()
 
 def get_recent_jobs(company=None, days=7):
     """Get recent jobs from local database."""
-    return db.get_recent_jobs(company, days)
+    return get_database().get_recent_jobs(company, days)
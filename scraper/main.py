@@ -1,120 +1,185 @@
-import importlib
 import time
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 # Add parent directory to path so we can import scraper modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scraper.utils.logger import setup_logger
-from scraper.database import JobDatabase
+from scraper.database import get_database
+from scraper.config import MAX_WORKERS, PUBLISH_DRAIN_TIMEOUT
+from scraper.utils.page_cache import page_cache
+from scraper.utils.browser_pool import browser_pool
+from scraper.job_api import JobSink
+from scraper.publisher import publisher
+from scraper.retention import retention
+from scraper.parsers.registry import get_spec, load_parser, parser_names, parser_specs
 
 logger = setup_logger("Main")
-db = JobDatabase()
-
-# All available parser modules
-PARSER_MODULES = [
-    'scraper.parsers.pathao',
-    'scraper.parsers.welldev', 
-    'scraper.parsers.enosis',
-    'scraper.parsers.brainstation23',
-    'scraper.parsers.selise',
-    'scraper.parsers.vivasoft',
-    'scraper.parsers.therap',
-    'scraper.parsers.fiftytwodigital',
-    'scraper.parsers.bitmascot',
-    'scraper.parsers.inverseai',
-    'scraper.parsers.konasl',
-    'scraper.parsers.shellbeehaken',
-    'scraper.parsers.kinetik',
-    'scraper.parsers.brotecs',
-    'scraper.parsers.wpxpo',
-    'scraper.parsers.bracits',
-    'scraper.parsers.ibos',
-    'scraper.parsers.dsinnovators',
-    'scraper.parsers.relisource',
-    'scraper.parsers.shopup',
-]
 
 SLEEP_BETWEEN_RUNS = 3600  # 1 hour
 
 
-def run_all_parsers():
-    """Run all available parsers with enhanced monitoring."""
-    total_jobs_found = 0
-    total_new_jobs = 0
-    successful_parsers = 0
-    failed_parsers = []
-    
-    logger.info("Starting scraping run for all parsers...")
-    
-    for module_name in PARSER_MODULES:
-        parser_name = module_name.split('.')[-1]
-        jobs_found = 0
-        jobs_new = 0
-        success = True
-        error_msg = None
+def _run_parser(parser_name: str) -> Dict:
+    """Run one parser, record the run and return its result (counts come from the parser's JobSink)."""
+    db = get_database()
+    spec = get_spec(parser_name) or {}
+    result = {
+        'parser': parser_name,
+        'company': spec.get('company') or parser_name.title(),
+        'jobs_found': 0,
+        'jobs_new': 0,
+        'jobs_updated': 0,
+        'jobs_duplicate': 0,
+        'jobs_failed': 0,
+        'jobs_deactivated': 0,
+        'fetch_seconds': None,
+        'store_seconds': None,
+        'success': True,
+        'error': None,
+        'skipped': False,
+    }
+    sink = JobSink()
+    
+    try:
+        parser = load_parser(parser_name)()
+        result['company'] = parser.company
+        logger.info(f"Running parser: {parser.company}")
         
-        try:
-            module = importlib.import_module(module_name)
-            parser_class = None
-            
-            # Find the parser class
-            for attr in dir(module):
-                obj = getattr(module, attr)
-                if hasattr(obj, 'fetch_jobs') and hasattr(obj, 'company') and callable(obj):
-                    parser_class = obj
-                    break
-            
-            if parser_class:
-                parser = parser_class()
-                logger.info(f"Running parser: {parser.company}")
-                
-                # Count jobs before parsing (for new job calculation)
-                before_count = len(db.get_recent_jobs(parser.company, days=1))
-                
-                jobs = parser.fetch_jobs()
-                jobs_found = len(jobs)
-                
-                # Count new jobs added today
-                after_count = len(db.get_recent_jobs(parser.company, days=1))
-                jobs_new = after_count - before_count
-                
-                total_jobs_found += jobs_found
-                total_new_jobs += jobs_new
-                successful_parsers += 1
-                
-                logger.info(f"✓ {parser.company}: {jobs_found} jobs found, {jobs_new} new")
-            else:
-                raise Exception(f"No valid parser class found in {module_name}")
-                
-        except Exception as e:
-            success = False
-            error_msg = str(e)
-            logger.error(f"✗ Failed to run parser {parser_name}: {e}")
-            failed_parsers.append(parser_name)
+        # Buffer the parser's post_job calls and store them in one transaction
+        run_started_at = db.now()
+        with sink:
+            started = time.perf_counter()
+            jobs = parser.fetch_jobs()
+            result['fetch_seconds'] = round(time.perf_counter() - started, 3)
+        # The jobs are committed now; a cached page that skips them next time is safe
+        parser.commit_cache()
+        result['jobs_found'] = len(jobs)
+        result['skipped'] = parser.unchanged
+        if parser.error:
+            # The jobs found before the error are stored, but the run failed
+            result['success'] = False
+            result['error'] = parser.error
+            logger.warning(f"✗ {result['company']}: parser failed partway ({parser.error}); "
+                           f"{len(jobs)} jobs stored, none deactivated")
         
-        # Record the run in database
-        try:
-            company_name = parser.company if 'parser' in locals() and parser else parser_name.title()
-            db.record_scraping_run(company_name, jobs_found, jobs_new, success, error_msg)
-        except Exception as db_error:
-            logger.error(f"Failed to record run for {parser_name}: {db_error}")
+        if result['skipped']:
+            # Reused jobs were not stored again, but they are still listed
+            db.touch_jobs(jobs, run_started_at)
+        elif sink.companies and result['success']:
+            # Only a run that stored jobs can tell which ones disappeared; an
+            # empty result is more likely a broken parser than an empty page
+            result['jobs_deactivated'] = db.deactivate_missing(sorted(sink.companies), run_started_at)
+        
+    except Exception as e:
+        result['success'] = False
+        result['error'] = str(e)
+        logger.error(f"✗ Failed to run parser {parser_name}: {e}")
+    
+    for status, count in sink.counts.items():
+        result[f'jobs_{status}'] = count
+    result['store_seconds'] = round(sink.store_seconds, 3)
+    
+    if result['skipped']:
+        logger.info(f"✓ {result['company']}: unchanged since last run, {result['jobs_found']} jobs reused")
+    elif result['success']:
+        logger.info(f"✓ {result['company']}: {result['jobs_found']} jobs found, {result['jobs_new']} new, "
+                    f"{result['jobs_updated']} updated, {result['jobs_duplicate']} duplicate"
+                    + (f", {result['jobs_failed']} failed" if result['jobs_failed'] else "")
+                    + (f", {result['jobs_deactivated']} deactivated" if result['jobs_deactivated'] else "")
+                    + f" ({result['fetch_seconds']:.1f}s fetch, {result['store_seconds']:.2f}s store)")
+    
+    # Record the run in database
+    try:
+        db.record_scraping_run(result['company'], result['jobs_found'], result['jobs_new'],
+                               result['success'], result['error'], result['skipped'],
+                               jobs_updated=result['jobs_updated'], jobs_duplicate=result['jobs_duplicate'],
+                               jobs_failed=result['jobs_failed'], fetch_seconds=result['fetch_seconds'],
+                               store_seconds=result['store_seconds'], jobs_deactivated=result['jobs_deactivated'])
+    except Exception as db_error:
+        logger.error(f"Failed to record run for {parser_name}: {db_error}")
+    
+    return result
+
+
+def run_all_parsers(workers: int = MAX_WORKERS, names: Optional[List[str]] = None):
+    """Run all available parsers (or just ``names``) with enhanced monitoring.
+    
+    With ``workers > 1`` the parsers run concurrently on a bounded thread
+    pool; every site lives on its own host, so a cycle then takes roughly
+    as long as the slowest parser instead of the sum of all of them. The
+    schedule comes from the parser manifest: parsers that need a browser
+    are the slowest, so they are started first.
+    """
+    # Imported here so that --list and --stats don't load requests
+    from scraper.utils.http_client import pop_connection_stats
+    
+    db = get_database()
+    specs = parser_specs(names)
+    schedule = [spec['name'] for spec in sorted(specs, key=lambda spec: not spec['needs_browser'])]
+    workers = max(1, min(workers, len(schedule)))
+    started = time.time()
+    
+    # New jobs are posted in the background while the parsers keep going
+    publisher.start()
+    
+    logger.info(f"Starting scraping run for all parsers ({workers} worker{'s' if workers > 1 else ''})...")
+    
+    if workers == 1:
+        results = [_run_parser(name) for name in schedule]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parser") as executor:
+            # map() keeps the schedule order so the summary stays stable
+            results = list(executor.map(_run_parser, schedule))
+    
+    total_jobs_found = sum(r['jobs_found'] for r in results)
+    total_new_jobs = sum(r['jobs_new'] for r in results)
+    total_updated_jobs = sum(r['jobs_updated'] for r in results)
+    total_deactivated_jobs = sum(r['jobs_deactivated'] for r in results)
+    successful_parsers = sum(1 for r in results if r['success'])
+    failed_parsers = [r['parser'] for r in results if not r['success']]
     
     # Summary
     logger.info("=" * 60)
-    logger.info(f"Scraping run completed:")
-    logger.info(f"  ✓ Successful parsers: {successful_parsers}/{len(PARSER_MODULES)}")
+    logger.info(f"Scraping run completed in {time.time() - started:.1f}s:")
+    logger.info(f"  ✓ Successful parsers: {successful_parsers}/{len(schedule)}")
     logger.info(f"  📊 Total jobs found: {total_jobs_found}")
     logger.info(f"  🆕 New jobs: {total_new_jobs}")
+    if total_updated_jobs:
+        logger.info(f"  ✏️  Updated jobs: {total_updated_jobs}")
+    if total_deactivated_jobs:
+        logger.info(f"  💤 Deactivated jobs: {total_deactivated_jobs}")
     
     if failed_parsers:
         logger.warning(f"  ❌ Failed parsers: {', '.join(failed_parsers)}")
     
-    # Database maintenance
+    http = pop_connection_stats()
+    if http['requests']:
+        logger.info(f"  🔌 HTTP: {http['requests']} requests over {http['connections']} connections "
+                    f"to {http['hosts']} hosts ({http['reused'] / http['requests']:.0%} reused)")
+    
+    cache = page_cache.pop_stats()
+    if cache['not_modified'] or cache['unchanged']:
+        logger.info(f"  📦 Page cache: {cache['not_modified']} pages not modified, {cache['unchanged']} unchanged, "
+                    f"{cache['bytes_saved'] / 1024:.0f} KB and {cache['parse_seconds_saved']:.2f}s of parsing saved")
+    
+    published = publisher.pop_stats()
+    outbox = db.outbox_stats()
+    if published['requests'] or outbox['pending'] or outbox['failed']:
+        logger.info(f"  📤 API: {published['published']} jobs published in {published['requests']} requests, "
+                    f"{outbox['pending']} pending, {outbox['failed']} failed")
+    
+    browsers = browser_pool.pop_stats()
+    if browsers['pages']:
+        logger.info(f"  🌐 Browser pool: {browsers['pages']} pages rendered, "
+                    f"{browsers['launches']} launches, {browsers['recycles']} recycles")
+    
+    # Database maintenance: a no-op until the next retention pass is due
     try:
-        db.cleanup_old_jobs(days=90)  # Keep 90 days of data
+        retention.run()
     except Exception as e:
         logger.error(f"Database cleanup failed: {e}")
     
@@ -128,50 +193,13 @@ def run_all_parsers():
 
 def run_single_parser(parser_name: str):
     """Run a single parser by name with enhanced monitoring."""
-    module_name = f'scraper.parsers.{parser_name}'
-    if module_name not in PARSER_MODULES:
-        logger.error(f"Parser '{parser_name}' not found. Available parsers: {[p.split('.')[-1] for p in PARSER_MODULES]}")
+    if get_spec(parser_name) is None:
+        logger.error(f"Parser '{parser_name}' not found. Available parsers: {parser_names()}")
         return None
     
-    try:
-        module = importlib.import_module(module_name)
-        parser_class = None
-        
-        # Find the parser class
-        for attr in dir(module):
-            obj = getattr(module, attr)
-            if hasattr(obj, 'fetch_jobs') and hasattr(obj, 'company') and callable(obj):
-                parser_class = obj
-                break
-        
-        if parser_class:
-            parser = parser_class()
-            logger.info(f"Running parser: {parser.company}")
-            
-            before_count = len(db.get_recent_jobs(parser.company, days=1))
-            jobs = parser.fetch_jobs()
-            after_count = len(db.get_recent_jobs(parser.company, days=1))
-            
-            jobs_found = len(jobs)
-            jobs_new = after_count - before_count
-            
-            logger.info(f"✓ {parser.company}: {jobs_found} jobs found, {jobs_new} new")
-            
-            # Record the run
-            db.record_scraping_run(parser.company, jobs_found, jobs_new, True, None)
-            
-            return {'jobs_found': jobs_found, 'jobs_new': jobs_new}
-        else:
-            raise Exception(f"No valid parser class found in {module_name}")
-            
-    except Exception as e:
-        logger.error(f"Failed to run parser {module_name}: {e}")
-        # Record the failed run
-        try:
-            db.record_scraping_run(parser_name.title(), 0, 0, False, str(e))
-        except:
-            pass
-        return None
+    publisher.start()
+    result = _run_parser(parser_name)
+    return result if result['success'] else None
 
 
 if __name__ == "__main__":
@@ -180,13 +208,14 @@ if __name__ == "__main__":
     parser.add_argument('--once', action='store_true', help='Run all parsers once and exit')
     parser.add_argument('--list', action='store_true', help='List all available parsers')
     parser.add_argument('--stats', action='store_true', help='Show database statistics')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help=f'Number of parsers to run concurrently (default: {MAX_WORKERS})')
     
     args = parser.parse_args()
     
     if args.list:
         logger.info("Available parsers:")
-        for module_name in PARSER_MODULES:
-            parser_name = module_name.split('.')[-1]
+        for parser_name in parser_names():
             logger.info(f"  - {parser_name}")
     elif args.stats:
         from scraper.job_api import get_job_statistics
@@ -198,13 +227,15 @@ if __name__ == "__main__":
             logger.info(f"    {company}: {count}")
     elif args.single:
         run_single_parser(args.single)
+        publisher.stop(PUBLISH_DRAIN_TIMEOUT)
     elif args.once:
-        run_all_parsers()
+        run_all_parsers(args.workers)
+        publisher.stop(PUBLISH_DRAIN_TIMEOUT)
     else:
         logger.info("Starting continuous scraping mode...")
         try:
             while True:
-                result = run_all_parsers()
+                result = run_all_parsers(args.workers)
                 logger.info(f"Sleeping for {SLEEP_BETWEEN_RUNS} seconds before next run...")
                 time.sleep(SLEEP_BETWEEN_RUNS)
         except KeyboardInterrupt:
@@ -1,11 +1,59 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
+from ..utils.page_cache import page_cache
+from ..utils.logger import setup_logger
+
+logger = setup_logger("BaseParser")
 
 class BaseJobParser(ABC):
     company: str
     url: str
+    unchanged: bool = False  # True when the last fetch_jobs reused cached jobs
+    error: Optional[str] = None  # set when the last fetch_jobs gave up partway
+
+    def __init__(self):
+        # Page cache entries wait until the jobs they list are in the database
+        self._cache_updates: List[tuple] = []
 
     @abstractmethod
     def fetch_jobs(self) -> List[Dict]:
         """Fetch and parse job listings from the career page."""
         pass
+
+    def fail(self, error):
+        """Record that fetching failed; the jobs returned may be incomplete.
+        
+        Parsers call this from the handler that catches their scraping
+        errors, so the run is not taken as a complete listing of the
+        company's jobs.
+        """
+        self.error = str(error)
+
+    def cached_jobs(self, resp) -> Optional[List[Dict]]:
+        """Return last run's jobs if the page has not changed, else None.
+        
+        Parsers call this right after ``client.get(..., conditional=True)`` and
+        return the result as-is, skipping parsing and ``post_job`` entirely.
+        """
+        entry = getattr(resp, 'cache_entry', None)
+        if entry is None:
+            return None
+        jobs = entry.get('jobs', [])
+        reason = "not modified" if resp.status_code == 304 else "unchanged"
+        logger.info(f"{self.company}: page {reason}, reusing {len(jobs)} jobs from last run")
+        self.unchanged = True
+        return jobs
+
+    def remember_jobs(self, resp, jobs: List[Dict]):
+        """Queue a fully parsed page's validators and jobs for the page cache (see :meth:`commit_cache`)."""
+        self.unchanged = False
+        if resp.status_code != 200 or not hasattr(resp, 'received_at'):
+            return
+        self._cache_updates.append((resp.requested_url, resp, jobs, time.perf_counter() - resp.received_at))
+
+    def commit_cache(self):
+        """Write the queued page cache entries; call only once the jobs are stored."""
+        updates, self._cache_updates = self._cache_updates, []
+        for url, resp, jobs, parse_seconds in updates:
+            page_cache.remember(url, resp, jobs, parse_seconds)
@@ -1,22 +1,27 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
-from ..utils.http_client import HttpClient
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
 from ..utils.logger import setup_logger
 
 logger = setup_logger("DSInnovatorsParser")
 
+@register_parser()
 class DSInnovatorsJobParser(BaseJobParser):
     company = "Data Soft"
     url = "https://apply.workable.com/dsinnovators/"
 
     def fetch_jobs(self) -> List[Dict]:
-        client = HttpClient()
+        client = get_client()
         jobs = []
         try:
-            resp = client.get(self.url, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = client.get(self.url, timeout=15, conditional=True)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            soup = make_soup(resp.text)
             
             # Workable uses specific patterns - look for job links
             job_links = soup.find_all('a', href=lambda x: x and ('/jobs/' in x or '/j/' in x) if x else False)
@@ -85,9 +90,12 @@ class DSInnovatorsJobParser(BaseJobParser):
                             jobs.append(job)
                             post_job(job)
                             logger.info(f"Found job: {title}")
+            
+            self.remember_jobs(resp, jobs)
                     
         except Exception as e:
             logger.error(f"Error scraping DS Innovators: {e}")
+            self.fail(e)
         
         logger.info(f"Found {len(jobs)} jobs from {self.company}")
         return jobs
@@ -1,30 +1,35 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
-from ..utils.http_client import HttpClient
+from ..utils.html import parse_html
+from ..utils.http_client import get_client
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
 from ..utils.logger import setup_logger
 
 logger = setup_logger("EnosisParser")
 
+@register_parser()
 class EnosisJobParser(BaseJobParser):
     company = "Enosis"
     url = "https://enosisbd.pinpointhq.com/"
 
     def fetch_jobs(self) -> List[Dict]:
-        client = HttpClient()
+        client = get_client()
         jobs = []
         try:
-            resp = client.get(self.url, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
-            job_cards = soup.select("div[data-qa='job-listing']")
+            resp = client.get(self.url, timeout=15, conditional=True)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            document = parse_html(resp.text)
+            job_cards = document.select("div[data-qa='job-listing']")
             for card in job_cards:
-                title = card.select_one("h3").get_text(strip=True) if card.select_one("h3") else ""
-                location = card.select_one(".job-location").get_text(strip=True) if card.select_one(".job-location") else ""
-                job_type = card.select_one(".job-type").get_text(strip=True) if card.select_one(".job-type") else ""
-                desc = card.select_one(".job-description").get_text(strip=True) if card.select_one(".job-description") else ""
+                title = card.select_one("h3").text() if card.select_one("h3") else ""
+                location = card.select_one(".job-location").text() if card.select_one(".job-location") else ""
+                job_type = card.select_one(".job-type").text() if card.select_one(".job-type") else ""
+                desc = card.select_one(".job-description").text() if card.select_one(".job-description") else ""
                 apply_link = card.select_one("a")
-                apply_link = apply_link["href"] if apply_link and apply_link.has_attr("href") else self.url
+                apply_link = apply_link.attr("href", self.url) if apply_link else self.url
                 job = {
                     "title": title,
                     "company": self.company,
@@ -35,6 +40,9 @@ class EnosisJobParser(BaseJobParser):
                 }
                 jobs.append(job)
                 post_job(job)
+            
+            self.remember_jobs(resp, jobs)
         except Exception as e:
             logger.error(f"Error scraping Enosis: {e}")
+            self.fail(e)
         return jobs
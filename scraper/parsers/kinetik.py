@@ -1,22 +1,27 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
-from ..utils.http_client import HttpClient
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
 from ..utils.logger import setup_logger
 
 logger = setup_logger("KinetikParser")
 
+@register_parser()
 class KinetikJobParser(BaseJobParser):
     company = "Kinetik"
     url = "https://job-boards.greenhouse.io/kinetik"
 
     def fetch_jobs(self) -> List[Dict]:
-        client = HttpClient()
+        client = get_client()
         jobs = []
         try:
-            resp = client.get(self.url, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = client.get(self.url, timeout=15, conditional=True)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            soup = make_soup(resp.text)
             
             # Greenhouse typically uses specific patterns
             # Look for job links - they usually contain job titles
@@ -78,9 +83,12 @@ class KinetikJobParser(BaseJobParser):
                             jobs.append(job)
                             post_job(job)
                             logger.info(f"Found job: {title}")
+            
+            self.remember_jobs(resp, jobs)
                     
         except Exception as e:
             logger.error(f"Error scraping Kinetik: {e}")
+            self.fail(e)
         
         logger.info(f"Found {len(jobs)} jobs from {self.company}")
         return jobs
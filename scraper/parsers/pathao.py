@@ -1,109 +1,163 @@
-from typing import List, Dict
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from typing import List, Dict, Optional
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
+from ..utils.browser_pool import browser_pool
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
+from ..utils.render import render_page
+from ..utils.xhr import (
+    capture_json_responses, read_json, find_job_records, jobs_from_payloads,
+    record_to_job, remember_endpoint, remembered_endpoint,
+)
 from ..utils.logger import setup_logger
-from ..config import HEADLESS_BROWSER, BROWSER_TIMEOUT
 
 logger = setup_logger("PathaoParser")
 
+@register_parser(needs_browser=True)
 class PathaoJobParser(BaseJobParser):
     company = "Pathao"
     url = "https://career.pathao.com/"
 
-    def fetch_jobs(self) -> List[Dict]:
+    def _render(self, page) -> tuple:
+        """Render the career page, capturing the JSON it loads its jobs from."""
+        responses = capture_json_responses(page)
+        content = render_page(page, self.url,
+                              ready_selector="h1, h2, h3, .job, .career, .position",
+                              item_selector="h2, h3, h4, .job, .position")
+        return content, read_json(responses)
+
+    def _post_records(self, records: List[Dict]) -> List[Dict]:
+        """Turn API records into jobs and post them."""
         jobs = []
+        for record in records:
+            job = record_to_job(record, self.company, self.url)
+            if job["title"]:
+                jobs.append(job)
+                post_job(job)
+                logger.info(f"Found job: {job['title']}")
+        return jobs
+
+    def _fetch_from_api(self) -> Optional[List[Dict]]:
+        """Fetch jobs straight from the JSON endpoint seen on an earlier render.
+        
+        Returns None when no endpoint is known or it no longer yields jobs,
+        in which case the page is rendered again.
+        """
+        api_url = remembered_endpoint(self.url)
+        if not api_url:
+            return None
+        
         try:
-            # Pathao's career page is likely JavaScript-heavy, use Playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=HEADLESS_BROWSER)
-                page = browser.new_page()
-                
-                # Set user agent to avoid detection
-                page.set_extra_http_headers({
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                })
-                
-                page.goto(self.url, timeout=BROWSER_TIMEOUT)
-                
-                # Wait for content to load
-                try:
-                    page.wait_for_selector("h1, h2, h3, .job, .career, .position", timeout=15000)
-                except:
-                    logger.warning(f"Timeout waiting for content on {self.url}")
-                
-                # Additional wait for JavaScript
-                page.wait_for_timeout(5000)
-                
-                content = page.content()
-                browser.close()
-                
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(content, "html.parser")
+            resp = get_client().get(api_url, conditional=True, headers={"Accept": "application/json"})
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            resp.raise_for_status()
+            records = find_job_records(resp.json())
+        except Exception as e:
+            logger.warning(f"Jobs API {api_url} failed, rendering the page instead: {e}")
+            return None
+        
+        if not records:
+            return None
+        jobs = self._post_records(records)
+        self.remember_jobs(resp, jobs)
+        return jobs
+
+    def _parse_html(self, content: str) -> List[Dict]:
+        """Guess jobs from the rendered DOM when no JSON payload had any."""
+        jobs = []
+        soup = make_soup(content)
+        
+        # Look for job-related headings
+        headings = soup.find_all(['h1', 'h2', 'h3', 'h4'])
+        for heading in headings:
+            text = heading.get_text(strip=True)
+            if any(keyword in text.lower() for keyword in ['developer', 'engineer', 'manager', 'analyst', 'designer', 'specialist']):
+                # Look for apply link near this heading
+                apply_link = self.url
+                apply_elem = heading.find_next('a', string=lambda x: 'apply' in x.lower() if x else False)
+                if not apply_elem:
+                    apply_elem = heading.find_parent().find('a') if heading.find_parent() else None
                 
-                # Look for job-related headings
-                headings = soup.find_all(['h1', 'h2', 'h3', 'h4'])
-                for heading in headings:
-                    text = heading.get_text(strip=True)
-                    if any(keyword in text.lower() for keyword in ['developer', 'engineer', 'manager', 'analyst', 'designer', 'specialist']):
-                        # Look for apply link near this heading
-                        apply_link = self.url
-                        apply_elem = heading.find_next('a', string=lambda x: 'apply' in x.lower() if x else False)
-                        if not apply_elem:
-                            apply_elem = heading.find_parent().find('a') if heading.find_parent() else None
-                        
-                        if apply_elem and apply_elem.get('href'):
-                            apply_link = apply_elem['href']
-                            if not apply_link.startswith('http'):
-                                apply_link = "https://career.pathao.com" + apply_link
-                        
-                        job = {
-                            "title": text,
-                            "company": self.company,
-                            "location": "Dhaka",
-                            "type": "Full-Time",
-                            "description": "",
-                            "apply_link": apply_link
-                        }
-                        jobs.append(job)
-                        post_job(job)
-                        logger.info(f"Found job: {text}")
+                if apply_elem and apply_elem.get('href'):
+                    apply_link = apply_elem['href']
+                    if not apply_link.startswith('http'):
+                        apply_link = "https://career.pathao.com" + apply_link
                 
-                # If no jobs found with headings, try looking for links or buttons
-                if not jobs:
-                    job_elements = soup.find_all(['a', 'button', 'div'], string=lambda x: any(keyword in x.lower() if x else False for keyword in ['developer', 'engineer', 'manager', 'position', 'job', 'career']))
+                job = {
+                    "title": text,
+                    "company": self.company,
+                    "location": "Dhaka",
+                    "type": "Full-Time",
+                    "description": "",
+                    "apply_link": apply_link
+                }
+                jobs.append(job)
+                post_job(job)
+                logger.info(f"Found job: {text}")
+        
+        # If no jobs found with headings, try looking for links or buttons
+        if not jobs:
+            job_elements = soup.find_all(['a', 'button', 'div'], string=lambda x: any(keyword in x.lower() if x else False for keyword in ['developer', 'engineer', 'manager', 'position', 'job', 'career']))
+            
+            for element in job_elements[:10]:  # Limit to 10 to avoid spam
+                text = element.get_text(strip=True)
+                if len(text) > 5 and len(text) < 50:  # Reasonable title length
+                    apply_link = self.url
+                    if element.name == 'a' and element.get('href'):
+                        apply_link = element['href']
+                        if not apply_link.startswith('http'):
+                            apply_link = "https://career.pathao.com" + apply_link
                     
-                    for element in job_elements[:10]:  # Limit to 10 to avoid spam
-                        text = element.get_text(strip=True)
-                        if len(text) > 5 and len(text) < 50:  # Reasonable title length
-                            apply_link = self.url
-                            if element.name == 'a' and element.get('href'):
-                                apply_link = element['href']
-                                if not apply_link.startswith('http'):
-                                    apply_link = "https://career.pathao.com" + apply_link
-                            
-                            job = {
-                                "title": text,
-                                "company": self.company,
-                                "location": "Dhaka",
-                                "type": "Full-Time",
-                                "description": "",
-                                "apply_link": apply_link
-                            }
-                            jobs.append(job)
-                            post_job(job)
-                            logger.info(f"Found job: {text}")
+                    job = {
+                        "title": text,
+                        "company": self.company,
+                        "location": "Dhaka",
+                        "type": "Full-Time",
+                        "description": "",
+                        "apply_link": apply_link
+                    }
+                    jobs.append(job)
+                    post_job(job)
+                    logger.info(f"Found job: {text}")
+        
+        return jobs
+
+    def fetch_jobs(self) -> List[Dict]:
+        jobs = []
+        try:
+            # Skip the browser entirely once the jobs API is known
+            api_jobs = self._fetch_from_api()
+            if api_jobs is not None:
+                jobs = api_jobs
+            else:
+                # Pathao's career page is JavaScript-heavy, render it in a
+                # pooled browser (custom user agent to avoid detection)
+                content, payloads = browser_pool.run(
+                    self._render,
+                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                )
                 
+                # Prefer the data payload the page renders from
+                api_url, records = jobs_from_payloads(payloads)
+                remember_endpoint(self.url, api_url)
+                if records:
+                    logger.info(f"Using {len(records)} job records from {api_url}")
+                    jobs = self._post_records(records)
+                else:
+                    jobs = self._parse_html(content)
+            
         except Exception as e:
             logger.error(f"Error scraping Pathao with Playwright: {e}")
+            self.fail(e)
             
             # Fallback to regular HTTP request
             try:
-                from ..utils.http_client import HttpClient
-                client = HttpClient()
+                client = get_client()
                 resp = client.get(self.url, timeout=15)
-                soup = BeautifulSoup(resp.text, "html.parser")
+                soup = make_soup(resp.text)
                 
                 # Simple fallback parsing
                 headings = soup.find_all(['h1', 'h2', 'h3'])
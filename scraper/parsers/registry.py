@@ -0,0 +1,192 @@
+"""Registry of the site parsers.
+
+Parsers register themselves with the :func:`register_parser` decorator,
+or are declared as data in ``sites.json`` (see :mod:`.site_spec`).
+``manifest.json`` next to this file lists every registered parser with its
+module, class, company, URL and capabilities; it is generated from the
+parser sources with :mod:`ast` and from ``sites.json``, without importing
+anything, so listing and
+selecting parsers costs no parser (or Playwright) imports. Regenerate it
+after adding a parser with::
+
+    python -m scraper.parsers.registry
+
+A missing or outdated manifest is rebuilt automatically on first use.
+"""
+
+import ast
+import hashlib
+import importlib
+import json
+import os
+from typing import Dict, List, Optional
+
+PARSERS_DIR = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = 'scraper.parsers'
+MANIFEST_PATH = os.path.join(PARSERS_DIR, 'manifest.json')
+SITES_FILE = 'sites.json'
+
+# Parser classes registered by the modules imported so far, by parser name
+PARSERS: Dict[str, type] = {}
+
+_manifest: Optional[Dict] = None
+
+
+def register_parser(name: Optional[str] = None, needs_browser: bool = False):
+    """Class decorator adding a parser to the registry.
+
+    ``name`` defaults to the module name (``scraper.parsers.pathao`` ->
+    ``pathao``); ``needs_browser`` marks parsers that render pages with
+    Playwright. Arguments must be literals so the manifest can be built
+    without importing the module.
+    """
+    def decorator(cls):
+        cls.name = name or cls.__module__.rsplit('.', 1)[-1]
+        cls.needs_browser = needs_browser
+        PARSERS[cls.name] = cls
+        return cls
+    return decorator
+
+
+def _literal(node, default=None):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return default
+
+
+def _parse_module(path: str) -> List[Dict]:
+    """Manifest entries for the registered parser classes defined in one source file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    module = os.path.splitext(os.path.basename(path))[0]
+    entries = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            if not (isinstance(decorator, ast.Call) and getattr(decorator.func, 'id', None) == 'register_parser'):
+                continue
+            options = {keyword.arg: _literal(keyword.value) for keyword in decorator.keywords}
+            if decorator.args:
+                options['name'] = _literal(decorator.args[0])
+
+            attributes = {}
+            for statement in node.body:
+                if isinstance(statement, ast.Assign) and len(statement.targets) == 1 \
+                        and isinstance(statement.targets[0], ast.Name):
+                    attributes[statement.targets[0].id] = _literal(statement.value)
+
+            entries.append({
+                'name': options.get('name') or module,
+                'module': f"{PACKAGE}.{module}",
+                'class': node.name,
+                'company': attributes.get('company'),
+                'url': attributes.get('url'),
+                'needs_browser': bool(options.get('needs_browser', False)),
+            })
+    return entries
+
+
+def _parse_sites(path: str) -> List[Dict]:
+    """Manifest entries for the declarative sites, served by :mod:`.site_spec`."""
+    with open(path, 'r', encoding='utf-8') as f:
+        sites = json.load(f)
+    return [{
+        'name': site['name'],
+        'module': f"{PACKAGE}.site_spec",
+        'class': 'SiteSpecParser',
+        'company': site['company'],
+        'url': site['url'],
+        'needs_browser': False,
+    } for site in sites]
+
+
+def _source_files() -> Dict[str, str]:
+    """Parser source files with a digest of their contents, for staleness checks."""
+    sources = {}
+    for filename in sorted(os.listdir(PARSERS_DIR)):
+        if (filename.endswith('.py') and not filename.startswith('_') and filename != 'registry.py') \
+                or filename == SITES_FILE:
+            with open(os.path.join(PARSERS_DIR, filename), 'rb') as f:
+                sources[filename] = hashlib.sha1(f.read()).hexdigest()[:12]
+    return sources
+
+
+def build_manifest() -> Dict:
+    """Scan the parser sources (without importing them) and return a fresh manifest."""
+    sources = _source_files()
+    parsers = []
+    for filename in sources:
+        path = os.path.join(PARSERS_DIR, filename)
+        parsers.extend(_parse_sites(path) if filename == SITES_FILE else _parse_module(path))
+    parsers.sort(key=lambda entry: entry['name'])
+    return {'parsers': parsers, 'sources': sources}
+
+
+def write_manifest(manifest: Optional[Dict] = None) -> Dict:
+    manifest = manifest or build_manifest()
+    # Replace atomically so a concurrent reader never sees a half-written file
+    tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, MANIFEST_PATH)
+    return manifest
+
+
+def load_manifest() -> Dict:
+    """The parser manifest, rebuilt (and rewritten if possible) when the sources changed."""
+    global _manifest
+    if _manifest is not None:
+        return _manifest
+
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+
+    if manifest is None or manifest.get('sources') != _source_files():
+        manifest = build_manifest()
+        try:
+            write_manifest(manifest)
+        except OSError:
+            pass  # read-only install: use the fresh manifest in memory
+
+    _manifest = manifest
+    return manifest
+
+
+def parser_specs(names: Optional[List[str]] = None) -> List[Dict]:
+    """Manifest entries of all parsers, or of ``names`` in that order; unknown names raise KeyError."""
+    specs = {entry['name']: entry for entry in load_manifest()['parsers']}
+    if names is None:
+        return list(specs.values())
+    return [specs[name] for name in names]
+
+
+def parser_names() -> List[str]:
+    return [entry['name'] for entry in load_manifest()['parsers']]
+
+
+def get_spec(name: str) -> Optional[Dict]:
+    for entry in load_manifest()['parsers']:
+        if entry['name'] == name:
+            return entry
+    return None
+
+
+def load_parser(name: str) -> type:
+    """Import the module of one parser (and nothing else) and return its class."""
+    spec = get_spec(name)
+    if spec is None:
+        raise KeyError(f"Unknown parser '{name}'")
+    module = importlib.import_module(spec['module'])
+    return PARSERS.get(name) or getattr(module, spec['class'])
+
+
+if __name__ == "__main__":
+    manifest = write_manifest()
+    print(f"Wrote {MANIFEST_PATH} with {len(manifest['parsers'])} parsers")
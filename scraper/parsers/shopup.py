@@ -1,22 +1,27 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
-from ..utils.http_client import HttpClient
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
 from ..utils.logger import setup_logger
 
 logger = setup_logger("ShopUpParser")
 
+@register_parser()
 class ShopUpJobParser(BaseJobParser):
     company = "ShopUp"
     url = "https://careers.smartrecruiters.com/ShopUp"
 
     def fetch_jobs(self) -> List[Dict]:
-        client = HttpClient()
+        client = get_client()
         jobs = []
         try:
-            resp = client.get(self.url, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = client.get(self.url, timeout=15, conditional=True)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            soup = make_soup(resp.text)
             
             # SmartRecruiters structure - look for job links and containers
             job_links = soup.find_all('a', href=lambda x: x and '/jobs/' in x if x else False)
@@ -83,9 +88,12 @@ class ShopUpJobParser(BaseJobParser):
                             jobs.append(job)
                             post_job(job)
                             logger.info(f"Found job: {title}")
+            
+            self.remember_jobs(resp, jobs)
                     
         except Exception as e:
             logger.error(f"Error scraping ShopUp: {e}")
+            self.fail(e)
         
         logger.info(f"Found {len(jobs)} jobs from {self.company}")
         return jobs
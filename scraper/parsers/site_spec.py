@@ -0,0 +1,201 @@
+"""Declarative parsers for career pages that list jobs as repeated cards.
+
+Each site in ``sites.json`` is a spec: the page ``url`` (plus optional
+``paths`` to try after it, stopping at the first page with jobs), a
+``cards`` selector and, when they differ from :data:`DEFAULT_FIELDS` and
+:data:`DEFAULT_VALUES`, the selectors and defaults of the job fields.
+Links are stored as written on the page, like the hand-written parsers
+do (the apply link is part of a job's fingerprint); a spec can set
+``url_base`` to resolve relative ones against it.
+A spec is compiled once into an :class:`ExtractionPlan`, which extracts
+every field of a card in a single walk over the card's elements instead of
+one ``select_one`` scan per field. Adding such a site takes a ``sites.json``
+entry and ``python -m scraper.parsers.registry``; no code.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urljoin
+import soupsieve
+from bs4 import Tag
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
+from .base_parser import BaseJobParser
+from .registry import register_parser
+from ..job_api import post_job
+from ..utils.logger import setup_logger
+
+logger = setup_logger("SiteSpecParser")
+
+SITES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sites.json')
+
+# Field selectors shared by the WordPress-style career pages. A string is a
+# selector whose first match's text is used; a dict can read an attribute.
+DEFAULT_FIELDS = {
+    'title': "h3, h4, .job-title, .position-title",
+    'location': ".location, .job-location",
+    'type': ".job-type, .employment-type",
+    'description': ".job-description, .description, p",
+    'apply_link': {'selector': "a", 'attr': "href"},
+}
+
+# Used when a card has no element for the field ({url} is the site URL)
+DEFAULT_VALUES = {
+    'location': "Dhaka",
+    'type': "Full-Time",
+    'description': "",
+    'apply_link': "{url}",
+}
+
+
+_SIMPLE_SELECTOR = re.compile(r'^(?:([a-zA-Z][\w-]*)|\.([\w-]+))$')
+
+
+def compile_matcher(selector: str) -> Callable[[Tag], bool]:
+    """Predicate telling whether an element matches ``selector``.
+
+    Selector lists made only of tag names and single classes (``h3, h4,
+    .job-title``, the common case) are checked with a set lookup on the
+    element; anything else goes through soupsieve.
+    """
+    names, classes = set(), set()
+    for part in selector.split(','):
+        match = _SIMPLE_SELECTOR.match(part.strip())
+        if match is None:
+            return soupsieve.compile(selector).match
+        if match.group(1):
+            names.add(match.group(1).lower())
+        else:
+            classes.add(match.group(2))
+
+    def matches(element: Tag) -> bool:
+        return element.name in names or (bool(classes) and not classes.isdisjoint(element.get('class') or ()))
+    return matches
+
+
+class ExtractionPlan:
+    """Compiled form of a site spec: card selector plus one matcher per field."""
+
+    def __init__(self, cards: str, fields: Dict, defaults: Dict, url_base: Optional[str] = None):
+        self.cards = soupsieve.compile(cards)
+        self.url_base = url_base
+        self.fields = []
+        for name, field in fields.items():
+            if isinstance(field, str):
+                field = {'selector': field}
+            self.fields.append((name, compile_matcher(field['selector']), field.get('attr')))
+        self.defaults = defaults
+
+    @classmethod
+    def from_spec(cls, spec: Dict) -> "ExtractionPlan":
+        return cls(spec['cards'], {**DEFAULT_FIELDS, **spec.get('fields', {})},
+                   {**DEFAULT_VALUES, **spec.get('defaults', {})}, spec.get('url_base'))
+
+    def extract_card(self, card: Tag, site_url: str) -> Dict:
+        """Field values of one card, in one pass over its descendants.
+
+        A field takes the first element in document order that matches its
+        selector, which is what ``card.select_one(selector)`` would return.
+        """
+        values = {}
+        pending = list(self.fields)
+        for element in card.descendants:
+            if not isinstance(element, Tag):
+                continue
+            for field in [field for field in pending if field[1](element)]:
+                name, _, attr = field
+                if attr is None:
+                    values[name] = element.get_text(strip=True)
+                elif element.has_attr(attr):
+                    values[name] = element[attr]
+                pending.remove(field)
+            if not pending:
+                break
+
+        for name, _, _ in self.fields:
+            if name not in values:
+                values[name] = self.defaults.get(name, "").format(url=site_url)
+        if self.url_base and values.get('apply_link'):
+            values['apply_link'] = urljoin(self.url_base, values['apply_link'])
+        return values
+
+    def extract(self, soup, site_url: str) -> List[Dict]:
+        """Field values of every card on a parsed page."""
+        return [self.extract_card(card, site_url) for card in self.cards.select(soup)]
+
+
+class SiteSpecParser(BaseJobParser):
+    """Parser driven by a ``sites.json`` entry; one subclass is registered per site."""
+    spec: Dict = {}
+    _plan: Optional[ExtractionPlan] = None
+
+    @classmethod
+    def plan(cls) -> ExtractionPlan:
+        if cls._plan is None:
+            cls._plan = ExtractionPlan.from_spec(cls.spec)
+        return cls._plan
+
+    def fetch_jobs(self) -> List[Dict]:
+        client = get_client()
+        paths = self.spec.get('paths', [""])
+        jobs = []
+        try:
+            for path in paths:
+                url = self.url + path
+                try:
+                    resp = client.get(url, timeout=15, conditional=True)
+                    cached = self.cached_jobs(resp)
+                    if cached is not None:
+                        if cached:
+                            jobs = cached
+                            break
+                        continue
+
+                    started = time.perf_counter()
+                    soup = make_soup(resp.text)
+                    for values in self.plan().extract(soup, self.url):
+                        if values['title']:
+                            job = {"company": self.company, **values}
+                            jobs.append(job)
+                            post_job(job)
+                    logger.debug(f"{self.company}: extracted {len(jobs)} jobs from {url} "
+                                 f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+                    # Remember empty pages too, so they cost a 304 next time
+                    self.remember_jobs(resp, jobs)
+                    if jobs:
+                        break
+                except Exception as e:
+                    if len(paths) == 1:
+                        raise
+                    logger.debug(f"{self.company}: skipping {url}: {e}")
+
+        except Exception as e:
+            logger.error(f"Error scraping {self.company}: {e}")
+            self.fail(e)
+
+        logger.info(f"Found {len(jobs)} jobs from {self.company}")
+        return jobs
+
+
+def load_sites(path: str = SITES_PATH) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _register_sites():
+    for spec in load_sites():
+        class_name = ''.join(part.title() for part in spec['name'].split('_')) + 'JobParser'
+        parser_class = type(class_name, (SiteSpecParser,), {
+            '__module__': __name__,
+            'company': spec['company'],
+            'url': spec['url'],
+            'spec': spec,
+        })
+        register_parser(spec['name'])(parser_class)
+
+
+_register_sites()
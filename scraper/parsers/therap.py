@@ -1,22 +1,27 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
-from ..utils.http_client import HttpClient
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
 from ..utils.logger import setup_logger
 
 logger = setup_logger("TherapParser")
 
+@register_parser()
 class TherapJobParser(BaseJobParser):
     company = "Therap Services"
     url = "https://therap.hire.trakstar.com/"
 
     def fetch_jobs(self) -> List[Dict]:
-        client = HttpClient()
+        client = get_client()
         jobs = []
         try:
-            resp = client.get(self.url, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = client.get(self.url, timeout=15, conditional=True)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            soup = make_soup(resp.text)
             
             # Look for job title headings with specific classes from Trakstar
             job_titles = soup.select("h3.js-job-list-opening-name")
@@ -61,9 +66,12 @@ class TherapJobParser(BaseJobParser):
                     }
                     jobs.append(job)
                     post_job(job)
+            
+            self.remember_jobs(resp, jobs)
                     
         except Exception as e:
             logger.error(f"Error scraping Therap: {e}")
+            self.fail(e)
         
         logger.info(f"Found {len(jobs)} jobs from {self.company}")
         return jobs
@@ -1,22 +1,27 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
-from ..utils.http_client import HttpClient
+from ..utils.html import make_soup
+from ..utils.http_client import get_client
 from .base_parser import BaseJobParser
+from .registry import register_parser
 from ..job_api import post_job
 from ..utils.logger import setup_logger
 
 logger = setup_logger("VivasoftParser")
 
+@register_parser()
 class VivasoftJobParser(BaseJobParser):
     company = "Vivasoft"
     url = "https://vivasoftltd.com/career/"
 
     def fetch_jobs(self) -> List[Dict]:
-        client = HttpClient()
+        client = get_client()
         jobs = []
         try:
-            resp = client.get(self.url, timeout=15)
-            soup = BeautifulSoup(resp.text, "html.parser")
+            resp = client.get(self.url, timeout=15, conditional=True)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            soup = make_soup(resp.text)
             
             # Find job titles - they are in h2 tags with specific classes
             job_titles = soup.find_all('h2', class_=['elementor-heading-title', 'elementor-size-default'])
@@ -100,9 +105,12 @@ class VivasoftJobParser(BaseJobParser):
                 jobs.append(job)
                 post_job(job)
                 logger.info(f"Found job: {title} in {location}")
+            
+            self.remember_jobs(resp, jobs)
                     
         except Exception as e:
             logger.error(f"Error scraping Vivasoft: {e}")
+            self.fail(e)
         
         logger.info(f"Found {len(jobs)} jobs from {self.company}")
         return jobs
@@ -0,0 +1,187 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from .config import (API_URL, API_TOKEN, API_BATCH_URL, PUBLISH_CONCURRENCY, PUBLISH_BATCH_SIZE, PUBLISH_INTERVAL,
+                     PUBLISH_MAX_ATTEMPTS, PUBLISH_BACKOFF, PUBLISH_BACKOFF_MAX)
+from .database import JobDatabase, get_database
+from .utils.logger import setup_logger
+
+logger = setup_logger("Publisher")
+
+
+class JobPublisher:
+    """Background worker that drains the job outbox to the external API.
+
+    Ingest only marks new jobs as pending in the database; this thread
+    picks them up and posts them over a pooled keep-alive session, with up
+    to ``concurrency`` requests in flight. When ``batch_url`` is set, jobs
+    are posted ``batch_size`` at a time as a JSON array. Failed posts are
+    retried with exponential backoff (network errors, 5xx, 408 and 429) or
+    given up on (other 4xx, or after ``max_attempts``); successful ones set
+    ``posted_to_api``. Because the outbox lives in the database, jobs that
+    are still pending when the process exits are published by the next run.
+    """
+
+    def __init__(self, database: Optional[JobDatabase] = None, api_url: str = API_URL, api_token: str = API_TOKEN,
+                 batch_url: str = API_BATCH_URL, concurrency: int = PUBLISH_CONCURRENCY,
+                 batch_size: int = PUBLISH_BATCH_SIZE, interval: float = PUBLISH_INTERVAL,
+                 max_attempts: int = PUBLISH_MAX_ATTEMPTS, backoff: float = PUBLISH_BACKOFF,
+                 backoff_max: float = PUBLISH_BACKOFF_MAX):
+        self._db = database
+        self.api_url = api_url
+        self.batch_url = batch_url
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size) if batch_url else 1
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+        self.headers = {"Content-Type": "application/json"}
+        if api_token:
+            self.headers["Authorization"] = f"Bearer {api_token}"
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {'published': 0, 'retrying': 0, 'failed': 0, 'requests': 0}
+
+    @property
+    def db(self) -> JobDatabase:
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+
+    @property
+    def client(self):
+        # Imported on first publish: requests is the heaviest import of the scraper
+        from .utils.http_client import get_client
+        # Our own API: no politeness rate limit, one pooled connection per worker
+        return get_client("api", proxies=None, rate_limited=False, pool_maxsize=self.concurrency)
+
+    def start(self):
+        """Start the background thread (no-op if it is already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="publisher", daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        """Ask the publisher to look at the outbox now instead of at its next poll."""
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Publish what is due, then stop; gives up waiting after ``timeout`` seconds."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stopping.set()
+        self._wake.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"Publisher still busy after {timeout}s; remaining jobs stay in the outbox")
+
+    def _run(self):
+        while True:
+            try:
+                self.publish_pending()
+            except Exception as e:
+                logger.error(f"Publishing failed: {e}")
+            if self._stopping.is_set():
+                break
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def publish_pending(self) -> int:
+        """Publish every job that is due; return how many were published."""
+        published = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="publish") as pool:
+            while True:
+                # Jobs that fail are rescheduled into the future, so this ends
+                pending = self.db.pending_publications(limit=self.concurrency * self.batch_size)
+                if not pending:
+                    break
+
+                batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+                done, failures, requests_made = [], [], 0
+                for batch, (outcomes, sent) in zip(batches, pool.map(self._send, batches)):
+                    requests_made += sent
+                    for job, (error, retryable) in zip(batch, outcomes):
+                        if error is None:
+                            done.append(job['id'])
+                        else:
+                            failures.append(self._failure(job, error, retryable))
+
+                if done:
+                    self.db.mark_published(done)
+                    published += len(done)
+                if failures:
+                    self.db.mark_publish_failed(failures)
+
+                with self._lock:
+                    self._stats['published'] += len(done)
+                    self._stats['requests'] += requests_made
+                    for _, _, retry_at in failures:
+                        self._stats['retrying' if retry_at else 'failed'] += 1
+
+        if published:
+            logger.info(f"Published {published} jobs to the API")
+        return published
+
+    def _post(self, url: str, payload) -> Tuple[Optional[str], bool]:
+        """POST one payload; return ``(error, retryable)``."""
+        import requests
+        
+        try:
+            response = self.client.post(url, json=payload, headers=self.headers, timeout=10)
+        except requests.exceptions.RequestException as e:
+            return f"Request error: {e}", True
+
+        if response.ok:
+            return None, False
+        retryable = response.status_code >= 500 or response.status_code in (408, 429)
+        return f"HTTP {response.status_code}: {response.text[:200]}", retryable
+
+    def _send(self, batch: List[Dict]) -> Tuple[List[Tuple[Optional[str], bool]], int]:
+        """Publish one job or one batch; return one ``(error, retryable)`` per job and the requests made."""
+        if len(batch) == 1:
+            return [self._post(self.api_url, batch[0]['payload'])], 1
+
+        error, retryable = self._post(self.batch_url, [job['payload'] for job in batch])
+        if error is None or retryable:
+            return [(error, retryable)] * len(batch), 1
+
+        # The batch was rejected, most likely because of one bad job: find it
+        # by posting the jobs one by one instead of failing them all
+        return [self._post(self.api_url, job['payload']) for job in batch], 1 + len(batch)
+
+    def _failure(self, job: Dict, error: str, retryable: bool) -> tuple:
+        """``(job_id, error, retry_at)`` for a failed attempt, with jittered exponential backoff."""
+        attempts = job['attempts'] + 1
+        title = job['payload'].get('title') if isinstance(job['payload'], dict) else job['id']
+        if not retryable or attempts >= self.max_attempts:
+            logger.error(f"Giving up on publishing job {title} after {attempts} attempts: {error}")
+            return job['id'], error, None
+
+        delay = min(self.backoff * 2 ** (attempts - 1), self.backoff_max) * random.uniform(0.8, 1.2)
+        retry_at = (datetime.now(timezone.utc) + timedelta(seconds=delay)).strftime('%Y-%m-%d %H:%M:%S')
+        logger.warning(f"Publishing job {title} failed ({error}); retry {attempts} in {delay:.0f}s")
+        return job['id'], error, retry_at
+
+    def pop_stats(self) -> Dict:
+        """Return and reset the counters since the last call."""
+        with self._lock:
+            stats, self._stats = self._stats, self._empty_stats()
+        return stats
+
+
+publisher = JobPublisher()
@@ -0,0 +1,106 @@
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from .config import (RETENTION_DAYS, RETENTION_INTERVAL, RETENTION_BATCH_SIZE, RETENTION_ARCHIVE_DIR,
+                     RETENTION_VACUUM_PAGES)
+from .database import JobDatabase, RETENTION_COLUMNS, get_database
+from .utils.logger import setup_logger
+
+logger = setup_logger("Retention")
+
+
+class RetentionEngine:
+    """Expire old jobs and scraping runs without stalling the scraper.
+    
+    A pass deletes in batches of ``batch_size`` rows, each in its own short
+    transaction, so parsers and the dashboard are never locked out for
+    long. Before a batch is deleted its rows are appended to a gzipped
+    NDJSON file per table and month in ``archive_dir`` (e.g.
+    ``archive/jobs-2025-01.ndjson.gz``); if the archive cannot be written,
+    the rows stay in the database. Afterwards up to ``vacuum_pages`` free
+    pages are returned to the file system with an incremental vacuum.
+    
+    ``run`` is cheap to call every cycle: it only does work once
+    ``interval`` seconds have passed since the last pass, which is recorded
+    in the database so separate processes share the schedule.
+    """
+    
+    def __init__(self, database: Optional[JobDatabase] = None, days: int = RETENTION_DAYS,
+                 interval: float = RETENTION_INTERVAL, batch_size: int = RETENTION_BATCH_SIZE,
+                 archive_dir: str = RETENTION_ARCHIVE_DIR, vacuum_pages: int = RETENTION_VACUUM_PAGES):
+        self._db = database
+        self.days = days
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self.archive_dir = archive_dir
+        self.vacuum_pages = max(0, vacuum_pages)
+    
+    @property
+    def db(self) -> JobDatabase:
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+    
+    def due(self) -> bool:
+        """Whether ``interval`` seconds have passed since the last pass."""
+        return time.time() - self.db.get_meta('retention_run_at') >= self.interval
+    
+    def run(self, force: bool = False) -> Optional[Dict]:
+        """Run a retention pass if one is due (or ``force``); return its report, or None if skipped.
+        
+        The report has the rows ``deleted`` and ``archived`` per table,
+        ``bytes_reclaimed`` by the vacuum, ``free_bytes`` left in the file
+        and the ``seconds`` the pass took.
+        """
+        if not force and not self.due():
+            return None
+        
+        started = time.perf_counter()
+        cutoff = self.db._cutoff(self.days)
+        report = {
+            'deleted': dict.fromkeys(RETENTION_COLUMNS, 0),
+            'archived': dict.fromkeys(RETENTION_COLUMNS, 0),
+            'bytes_reclaimed': 0,
+            'free_bytes': 0,
+            'seconds': 0.0,
+        }
+        
+        def archive(table: str, rows: List[Dict]):
+            self._archive(table, rows)
+            report['archived'][table] += len(rows)
+        
+        for table in RETENTION_COLUMNS:
+            while True:
+                deleted = self.db.purge_batch(table, cutoff, self.batch_size,
+                                              archive if self.archive_dir else None)
+                if not deleted:
+                    break
+                report['deleted'][table] += deleted
+        
+        report['bytes_reclaimed'] = self.db.incremental_vacuum(self.vacuum_pages)
+        report['free_bytes'] = self.db.free_bytes()
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        self.db.set_meta('retention_run_at', int(time.time()))
+        
+        logger.info(f"Retention: {report['deleted']['jobs']} jobs and {report['deleted']['scraping_runs']} runs "
+                    f"older than {self.days} days deleted, {report['bytes_reclaimed'] / 1024:.0f} KB reclaimed "
+                    f"in {report['seconds']:.2f}s")
+        return report
+    
+    def archive_path(self, table: str) -> str:
+        month = datetime.now(timezone.utc).strftime('%Y-%m')
+        return os.path.join(self.archive_dir, f"{table}-{month}.ndjson.gz")
+    
+    def _archive(self, table: str, rows: List[Dict]):
+        """Append rows to the table's archive; the file is closed before the rows are deleted."""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        # Each call appends a gzip member; gzip and zcat read them back as one stream
+        with gzip.open(self.archive_path(table), 'at', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+
+retention = RetentionEngine()
@@ -0,0 +1,147 @@
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+from ..config import HEADLESS_BROWSER, BROWSER_POOL_SIZE, BROWSER_MAX_PAGES
+from .logger import setup_logger
+
+logger = setup_logger("BrowserPool")
+
+_STOP = object()
+
+
+class BrowserPool:
+    """Warm Chromium instances kept alive for the life of the process.
+    
+    Playwright's sync API is bound to the thread that started it, so each
+    browser lives on its own long-running worker thread. Callers submit a
+    function through :meth:`run`; it is executed on one of those threads with
+    a fresh page in an isolated browser context, and its return value is
+    handed back. Parser threads therefore never touch Playwright objects
+    directly and can come and go without killing the browsers.
+    
+    Browsers are started lazily on first use, health-checked before every
+    page and recycled after ``max_pages`` pages to keep memory in check.
+    """
+    
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_pages: int = BROWSER_MAX_PAGES,
+                 headless: bool = HEADLESS_BROWSER):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.headless = headless
+        self._tasks: queue.Queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._stats = self._empty_stats()
+    
+    def run(self, fn: Callable[[Any], Any], timeout: Optional[float] = None, **context_options) -> Any:
+        """Call ``fn(page)`` on a pooled browser and return its result.
+        
+        ``context_options`` are passed to ``browser.new_context`` (for example
+        ``user_agent``). Exceptions raised by ``fn`` or by the browser are
+        re-raised in the calling thread.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self._tasks.put((fn, context_options, future))
+        return future.result(timeout=timeout)
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {'launches': 0, 'recycles': 0, 'pages': 0, 'errors': 0}
+    
+    def pop_stats(self) -> Dict[str, int]:
+        """Browser launches, recycles and pages served since the last call; resets the counters."""
+        with self._lock:
+            stats, self._stats = self._stats, self._empty_stats()
+        return stats
+    
+    def close(self):
+        """Stop the worker threads and shut their browsers down."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._tasks.put(_STOP)
+        for thread in threads:
+            thread.join(timeout=30)
+    
+    def _ensure_started(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.size):
+                thread = threading.Thread(target=self._worker, name=f"browser-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+    
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+    
+    def _worker(self):
+        playwright = None
+        browser = None
+        pages = 0
+        
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is _STOP:
+                    break
+                fn, context_options, future = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                
+                try:
+                    # Health check: relaunch a crashed or disconnected browser
+                    if browser is not None and not browser.is_connected():
+                        logger.warning("Browser disconnected, relaunching")
+                        browser = None
+                    if browser is None:
+                        if playwright is None:
+                            from playwright.sync_api import sync_playwright
+                            playwright = sync_playwright().start()
+                        browser = playwright.chromium.launch(headless=self.headless)
+                        pages = 0
+                        self._count('launches')
+                    
+                    context = browser.new_context(**context_options)
+                    try:
+                        result = fn(context.new_page())
+                    finally:
+                        context.close()
+                    future.set_result(result)
+                except BaseException as e:
+                    self._count('errors')
+                    future.set_exception(e)
+                finally:
+                    if browser is not None:
+                        pages += 1
+                        self._count('pages')
+                
+                if browser is not None and self.max_pages and pages >= self.max_pages:
+                    logger.info(f"Recycling browser after {pages} pages")
+                    self._close_browser(browser)
+                    browser = None
+                    self._count('recycles')
+        finally:
+            if browser is not None:
+                self._close_browser(browser)
+            if playwright is not None:
+                try:
+                    playwright.stop()
+                except Exception as e:
+                    logger.debug(f"Error stopping Playwright: {e}")
+    
+    @staticmethod
+    def _close_browser(browser):
+        try:
+            browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+
+
+# Shared by every Playwright-based parser in the process
+browser_pool = BrowserPool()
+atexit.register(browser_pool.close)
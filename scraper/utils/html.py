@@ -0,0 +1,131 @@
+"""HTML parsing for the site parsers.
+
+Parsers don't construct ``BeautifulSoup`` themselves. Those that only
+select elements and read their text and attributes use :func:`parse_html`,
+which returns a :class:`Node` with a small API (``select``, ``select_one``,
+``text``, ``attr``) implemented by every backend:
+
+* ``selectolax`` -- lexbor, a native HTML5 parser; the fastest, used when
+  the ``selectolax`` package is installed
+* ``lxml`` -- BeautifulSoup on the lxml tree builder
+* ``html.parser`` -- BeautifulSoup on the pure-Python tree builder
+
+Parsers that walk the tree with BeautifulSoup's own API (``find_next``,
+``find_parent``, ...) use :func:`make_soup`, which picks the fastest
+installed BeautifulSoup builder. ``HTML_PARSER`` in the config overrides
+the backend; unknown or uninstalled backends fall back to the next one.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..config import HTML_PARSER
+
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+SOUP_BUILDERS = ('lxml', 'html.parser')
+
+_available = {}
+
+
+def backend_available(backend: str) -> bool:
+    """Whether the package behind ``backend`` can be imported (checked once)."""
+    if backend not in _available:
+        module = {'selectolax': 'selectolax.lexbor', 'lxml': 'lxml.etree'}.get(backend)
+        try:
+            if module:
+                __import__(module)
+            _available[backend] = backend in BACKENDS
+        except ImportError:
+            _available[backend] = False
+    return _available[backend]
+
+
+def resolve_backend(backend: Optional[str] = None, choices=BACKENDS) -> str:
+    """The backend to use: ``backend`` or the configured one if installed, else the fastest installed one."""
+    backend = backend or HTML_PARSER
+    if backend in choices and backend_available(backend):
+        return backend
+    return next(choice for choice in choices if backend_available(choice))
+
+
+class Node(ABC):
+    """An element (or the whole document) of a parsed page."""
+
+    @abstractmethod
+    def select(self, selector: str) -> List["Node"]:
+        """All descendants matching a CSS selector, in document order."""
+        pass
+
+    @abstractmethod
+    def select_one(self, selector: str) -> Optional["Node"]:
+        """The first descendant matching a CSS selector, or None."""
+        pass
+
+    @abstractmethod
+    def text(self, strip: bool = True) -> str:
+        """Text of the element and its descendants; ``strip`` strips every text node."""
+        pass
+
+    @abstractmethod
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Value of an attribute (multi-valued ones like ``class`` space-joined), or ``default``."""
+        pass
+
+
+class SoupNode(Node):
+    __slots__ = ('tag',)
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def select(self, selector: str) -> List[Node]:
+        return [SoupNode(tag) for tag in self.tag.select(selector)]
+
+    def select_one(self, selector: str) -> Optional[Node]:
+        tag = self.tag.select_one(selector)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self, strip: bool = True) -> str:
+        return self.tag.get_text(strip=strip)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self.tag.get(name)
+        if value is None:
+            return default
+        return ' '.join(value) if isinstance(value, list) else value
+
+
+class LexborNode(Node):
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, selector: str) -> List[Node]:
+        return [LexborNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional[Node]:
+        node = self.node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def text(self, strip: bool = True) -> str:
+        return self.node.text(strip=strip)
+
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self.node.attributes.get(name, default)
+        # Valueless attributes (<input disabled>) come back as None
+        return default if value is None else value
+
+
+def make_soup(markup: str, builder: Optional[str] = None):
+    """A ``BeautifulSoup`` of ``markup`` built with the fastest installed tree builder."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(markup, resolve_backend(builder, SOUP_BUILDERS))
+
+
+def parse_html(markup: str, backend: Optional[str] = None) -> Node:
+    """Parse a page with ``backend`` (default: ``HTML_PARSER``) and return its document node."""
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborNode(LexborHTMLParser(markup).root)
+    return SoupNode(make_soup(markup, backend))
@@ -1,14 +1,72 @@
 import requests
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlparse
+import threading
 import time
-from ..config import DEFAULT_HEADERS, REQUEST_TIMEOUT, RETRY_COUNT, SLEEP_BETWEEN_REQUESTS
+import weakref
+from ..config import (
+    DEFAULT_HEADERS, REQUEST_TIMEOUT, RETRY_COUNT, HOST_RATE_LIMIT, HOST_BURST, HOST_RATE_OVERRIDES,
+    POOL_CONNECTIONS, POOL_MAXSIZE, PROXIES,
+)
+from .page_cache import page_cache
 
-class HttpClient:
-    def __init__(self, proxies: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None):
-        self.session = requests.Session()
+
+class HostRateLimiter:
+    """Process-wide token bucket per hostname.
+    
+    Each host gets ``burst`` tokens that refill at ``rate`` tokens per second.
+    Requests to different hosts never wait on each other, while every
+    HttpClient (and every thread) talking to the same host shares its bucket.
+    """
+    
+    def __init__(self, rate: float = HOST_RATE_LIMIT, burst: int = HOST_BURST,
+                 overrides: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.rate = rate
+        self.burst = burst
+        self.overrides = dict(overrides or {})
+        self._buckets: Dict[str, list] = {}  # host -> [tokens, last_refill]
+        self._lock = threading.Lock()
+    
+    def limits_for(self, host: str) -> Tuple[float, int]:
+        """Return the (rate, burst) pair that applies to a host."""
+        return self.overrides.get(host, (self.rate, self.burst))
+    
+    def acquire(self, host: str) -> float:
+        """Take a token for ``host``, sleeping until one is available.
+        
+        Returns the number of seconds spent waiting.
+        """
+        rate, burst = self.limits_for(host)
+        if rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(host, [float(burst), now])
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            # Reserve the token now (the balance may go negative) so that
+            # concurrent callers queue up behind each other instead of racing.
+            bucket[0] -= 1
+            wait = -bucket[0] / rate if bucket[0] < 0 else 0.0
         
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# Shared by every HttpClient in the process
+rate_limiter = HostRateLimiter(overrides=HOST_RATE_OVERRIDES)
+
+
+class HttpClient:
+    """HTTP client with retries, per-host rate limiting and pooled connections (see :func:`get_client`)."""
+    
+    def __init__(self, proxies: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None,
+                 pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 rate_limited: bool = True):
         # Setup retry strategy
         retries = Retry(
             total=RETRY_COUNT,
@@ -16,33 +74,149 @@ class HttpClient:
             status_forcelist=[500, 502, 503, 504, 429]
         )
         
-        self.session.mount('http://', HTTPAdapter(max_retries=retries))
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
-        
-        # Set proxies if provided
-        self.session.proxies = proxies or {}
+        # pool_connections = hosts kept pooled, pool_maxsize = connections per host
+        self.adapters = {
+            'http://': HTTPAdapter(max_retries=retries, pool_connections=pool_connections, pool_maxsize=pool_maxsize),
+            'https://': HTTPAdapter(max_retries=retries, pool_connections=pool_connections, pool_maxsize=pool_maxsize),
+        }
+        self.proxies = proxies or {}
         
         # Set headers
-        combined_headers = DEFAULT_HEADERS.copy()
+        self.headers = DEFAULT_HEADERS.copy()
         if headers:
-            combined_headers.update(headers)
-        self.session.headers.update(combined_headers)
+            self.headers.update(headers)
         
-        self.last_request_time = 0
+        # Politeness limits are for the sites we scrape, not for our own API
+        self.rate_limited = rate_limited
+        self._local = threading.local()
+        # Pool counters at the last pop_connection_stats(), per live pool
+        self._popped = weakref.WeakKeyDictionary()
+        self._popped_lock = threading.Lock()
+    
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, mounted on the shared adapters."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            for prefix, adapter in self.adapters.items():
+                session.mount(prefix, adapter)
+            session.proxies = dict(self.proxies)
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
 
-    def _rate_limit(self):
-        """Simple rate limiting to avoid overwhelming servers."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < SLEEP_BETWEEN_REQUESTS:
-            time.sleep(SLEEP_BETWEEN_REQUESTS - elapsed)
-        self.last_request_time = time.time()
+    def _rate_limit(self, url: str):
+        """Wait for the target host's politeness budget before a request."""
+        if self.rate_limited:
+            rate_limiter.acquire((urlparse(url).hostname or "").lower())
 
-    def get(self, url: str, **kwargs) -> requests.Response:
-        self._rate_limit()
+    def get(self, url: str, conditional: bool = False, **kwargs) -> requests.Response:
+        """GET a URL.
+        
+        With ``conditional=True`` the validators cached for the URL are sent
+        as ``If-None-Match``/``If-Modified-Since``. When the server answers
+        ``304``, or returns a body identical to the one cached, the cached
+        entry is attached as ``resp.cache_entry`` so the parser can skip work.
+        """
+        self._rate_limit(url)
         kwargs.setdefault('timeout', REQUEST_TIMEOUT)
-        return self.session.get(url, **kwargs)
+        
+        validators = page_cache.validators(url) if conditional else {}
+        if validators:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **validators}
+        
+        resp = self.session.get(url, **kwargs)
+        resp.cache_entry = None
+        if validators and resp.status_code == 304:
+            resp.cache_entry = page_cache.get(url)
+            if resp.cache_entry is None:
+                # Entry vanished between the lookup and the response
+                kwargs['headers'] = {k: v for k, v in kwargs['headers'].items() if k not in validators}
+                resp = self.session.get(url, **kwargs)
+                resp.cache_entry = None
+            else:
+                page_cache.record_hit(resp.cache_entry, not_modified=True)
+        
+        if conditional and resp.status_code == 200:
+            # Most sites send no validators; compare the body itself instead
+            resp.cache_entry = page_cache.unchanged_entry(url, resp.content)
+            if resp.cache_entry:
+                page_cache.record_hit(resp.cache_entry, not_modified=False)
+        
+        resp.requested_url = url
+        resp.received_at = time.perf_counter()
+        return resp
 
     def post(self, url: str, data: Any = None, json: Any = None, **kwargs) -> requests.Response:
-        self._rate_limit()
+        self._rate_limit(url)
         kwargs.setdefault('timeout', REQUEST_TIMEOUT)
         return self.session.post(url, data=data, json=json, **kwargs)
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """Count requests and TCP connections made through the pooled adapters."""
+        stats = {'hosts': 0, 'connections': 0, 'requests': 0}
+        for pool in self._pools():
+            stats['hosts'] += 1
+            stats['connections'] += pool.num_connections
+            stats['requests'] += pool.num_requests
+        return stats
+    
+    def pop_connection_stats(self) -> Dict[str, int]:
+        """Like :meth:`connection_stats`, but only counting since the last call."""
+        stats = {'hosts': 0, 'connections': 0, 'requests': 0}
+        with self._popped_lock:
+            for pool in self._pools():
+                connections, requests_made = self._popped.get(pool, (0, 0))
+                self._popped[pool] = (pool.num_connections, pool.num_requests)
+                if pool.num_requests > requests_made:
+                    stats['hosts'] += 1
+                    stats['connections'] += pool.num_connections - connections
+                    stats['requests'] += pool.num_requests - requests_made
+        return stats
+    
+    def _pools(self) -> list:
+        pools = []
+        for adapter in self.adapters.values():
+            manager_pools = adapter.poolmanager.pools
+            for key in manager_pools.keys():
+                pool = manager_pools.get(key)
+                if pool is not None:
+                    pools.append(pool)
+        return pools
+
+
+_clients: Dict[str, HttpClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(name: str = "default", **options) -> HttpClient:
+    """Return the shared client registered under ``name``, created with ``options`` on first use."""
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = HttpClient(**{'proxies': PROXIES, **options})
+            _clients[name] = client
+        return client
+
+
+def _aggregate(stats_of) -> Dict[str, int]:
+    with _clients_lock:
+        clients = list(_clients.values())
+    
+    totals = {'hosts': 0, 'connections': 0, 'requests': 0}
+    for client in clients:
+        for key, value in stats_of(client).items():
+            totals[key] += value
+    totals['reused'] = max(0, totals['requests'] - totals['connections'])
+    return totals
+
+
+def connection_stats() -> Dict[str, int]:
+    """Aggregate connection reuse over every registered client, since the process started."""
+    return _aggregate(HttpClient.connection_stats)
+
+
+def pop_connection_stats() -> Dict[str, int]:
+    """Aggregate connection reuse over every registered client since the last call."""
+    return _aggregate(HttpClient.pop_connection_stats)
@@ -2,6 +2,8 @@ import logging
 import sys
 from ..config import LOG_LEVEL, LOG_FORMAT
 
+_stream = sys.stdout
+
 def setup_logger(name: str) -> logging.Logger:
     """Setup a logger with consistent formatting and level."""
     logger = logging.getLogger(name)
@@ -12,10 +14,19 @@ def setup_logger(name: str) -> logging.Logger:
     
     # Create handler if it doesn't exist
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
+        handler = logging.StreamHandler(_stream)
         formatter = logging.Formatter(LOG_FORMAT)
         handler.setFormatter(formatter)
         logger.addHandler(handler)
     
     logger.propagate = False
     return logger
+
+def log_to_stderr():
+    """Send all log output to stderr, for commands that write data to stdout."""
+    global _stream
+    _stream = sys.stderr
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        for handler in getattr(logger, 'handlers', []):
+            if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout:
+                handler.setStream(sys.stderr)
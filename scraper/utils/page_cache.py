@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+from ..config import PAGE_CACHE_DIR, PAGE_CACHE_ENABLED
+from .logger import setup_logger
+
+logger = setup_logger("PageCache")
+
+# Per-request noise that changes on every download of an otherwise identical
+# page: HTML comments (cache/timing banners) and WordPress/Elementor nonces.
+_COMMENT_RE = re.compile(rb'<!--.*?-->', re.S)
+_NONCE_RE = re.compile(rb'(nonce["\']?\s*[:=]\s*["\'])[0-9a-zA-Z]+')
+_WHITESPACE_RE = re.compile(rb'\s+')
+
+
+def body_digest(content: bytes) -> str:
+    """Fingerprint a response body, ignoring markup noise that changes per request."""
+    normalized = _COMMENT_RE.sub(b'', content)
+    normalized = _NONCE_RE.sub(rb'\1', normalized)
+    normalized = _WHITESPACE_RE.sub(b' ', normalized).strip()
+    return hashlib.sha256(normalized).hexdigest()
+
+
+class PageCache:
+    """On-disk cache of HTTP validators and the jobs parsed from each page.
+    
+    One small JSON file per URL holds the ``ETag``/``Last-Modified`` the
+    server sent with the last full response, a digest of its normalized body
+    and the jobs the parser extracted from it. When the server answers a
+    conditional GET with ``304 Not Modified``, or sends a body whose digest
+    has not changed, the parser can hand those jobs back without parsing or
+    posting anything.
+    """
+    
+    def __init__(self, cache_dir: str = PAGE_CACHE_DIR, enabled: bool = PAGE_CACHE_ENABLED):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self._stats_lock = threading.Lock()
+        self._stats = self._empty_stats()
+    
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {'not_modified': 0, 'unchanged': 0, 'bytes_saved': 0, 'parse_seconds_saved': 0.0}
+    
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cache entry for a URL, or None."""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+    
+    def put(self, url: str, entry: Dict):
+        """Atomically write the cache entry for a URL."""
+        if not self.enabled:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(entry, url=url), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+    
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a URL, if it has been cached."""
+        entry = self.get(url)
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def remember(self, url: str, resp, jobs: List[Dict], parse_seconds: float):
+        """Store a full response's validators with the jobs parsed from it."""
+        self.put(url, {
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'bytes': len(resp.content),
+            'digest': body_digest(resp.content),
+            'parse_seconds': round(parse_seconds, 4),
+            'jobs': jobs,
+            'stored_at': time.time(),
+        })
+    
+    def unchanged_entry(self, url: str, content: bytes) -> Optional[Dict]:
+        """Return the entry for a URL if ``content`` matches its stored digest."""
+        entry = self.get(url)
+        if entry and entry.get('digest') == body_digest(content):
+            return entry
+        return None
+    
+    def record_hit(self, entry: Dict, not_modified: bool):
+        """Account for work skipped thanks to a 304 or an unchanged body."""
+        with self._stats_lock:
+            if not_modified:
+                self._stats['not_modified'] += 1
+                self._stats['bytes_saved'] += entry.get('bytes', 0)
+            else:
+                self._stats['unchanged'] += 1
+            self._stats['parse_seconds_saved'] += entry.get('parse_seconds', 0.0)
+    
+    def pop_stats(self) -> Dict:
+        """Return the counters collected since the last call and reset them."""
+        with self._stats_lock:
+            stats, self._stats = self._stats, self._empty_stats()
+        return stats
+
+
+# Shared by every HttpClient in the process
+page_cache = PageCache()
@@ -0,0 +1,83 @@
+import time
+from typing import Iterable, Optional
+from ..config import BROWSER_TIMEOUT, BLOCKED_RESOURCE_TYPES
+from .logger import setup_logger
+
+logger = setup_logger("Render")
+
+READY_TIMEOUT = 15000  # ms to wait for the ready selector
+IDLE_TIMEOUT = 5000  # ms to wait for the network to go quiet
+STABLE_TIMEOUT = 5000  # ms to wait for the item count to settle
+STABLE_POLL = 250  # ms between item count samples
+
+
+def block_resources(page, resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES) -> dict:
+    """Abort requests for resource types the scraper never looks at.
+    
+    Returns a counter dict whose ``blocked`` entry is updated as requests are
+    aborted.
+    """
+    blocked_types = frozenset(resource_types)
+    counter = {'blocked': 0}
+    
+    def _route(route):
+        if route.request.resource_type in blocked_types:
+            counter['blocked'] += 1
+            route.abort()
+        else:
+            route.continue_()
+    
+    if blocked_types:
+        page.route("**/*", _route)
+    return counter
+
+
+def wait_until_ready(page, ready_selector: str, item_selector: Optional[str] = None):
+    """Wait until the page shows its content, using DOM and network signals.
+    
+    1. ``ready_selector`` is attached to the DOM,
+    2. the network has gone idle (best effort, bounded by ``IDLE_TIMEOUT``),
+    3. if ``item_selector`` is given, the number of matching items stops
+       changing between two samples (bounded by ``STABLE_TIMEOUT``).
+    """
+    try:
+        page.wait_for_selector(ready_selector, state="attached", timeout=READY_TIMEOUT)
+    except Exception:
+        logger.warning(f"Timeout waiting for '{ready_selector}' on {page.url}")
+    
+    try:
+        page.wait_for_load_state("networkidle", timeout=IDLE_TIMEOUT)
+    except Exception:
+        logger.debug(f"Network did not go idle on {page.url}")
+    
+    if item_selector:
+        deadline = time.monotonic() + STABLE_TIMEOUT / 1000
+        count = page.locator(item_selector).count()
+        while time.monotonic() < deadline:
+            page.wait_for_timeout(STABLE_POLL)
+            new_count = page.locator(item_selector).count()
+            if new_count == count:
+                break
+            count = new_count
+
+
+def render_page(page, url: str, ready_selector: str, item_selector: Optional[str] = None,
+                resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES, before_content=None) -> str:
+    """Load ``url`` with non-essential resources blocked and return its HTML.
+    
+    ``before_content`` is an optional ``callback(page)`` run once the page is
+    ready, for interactions such as clicking "Load More". Render time and the
+    number of blocked requests are logged per page.
+    """
+    started = time.perf_counter()
+    counter = block_resources(page, resource_types)
+    
+    page.goto(url, timeout=BROWSER_TIMEOUT, wait_until="domcontentloaded")
+    wait_until_ready(page, ready_selector, item_selector)
+    if before_content:
+        before_content(page)
+    content = page.content()
+    
+    logger.info(f"Rendered {url} in {time.perf_counter() - started:.2f}s "
+                f"({counter['blocked']} requests blocked, {len(content) / 1024:.0f} KB)")
+    return content
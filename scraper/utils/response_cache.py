@@ -0,0 +1,86 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+from ..config import RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL
+
+Headers = Iterable[Tuple[str, str]]
+
+
+class ResponseCache:
+    """In-process LRU cache of serialized API responses, keyed to the database data version."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.max_entries = max_entries
+        # For data that ages without a write, e.g. "jobs of the last day"
+        self.ttl = ttl
+        # key -> [version, stored_at, etag, body, headers, gzipped body or None]
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0}
+
+    @staticmethod
+    def etag(version: int, body: bytes) -> str:
+        """Strong validator (unquoted) for a response body computed at ``version``."""
+        return f'{version}-{hashlib.sha1(body).hexdigest()[:16]}'
+
+    def get(self, key: Hashable, version: int) -> Optional[Tuple[str, bytes, Headers, Optional[bytes]]]:
+        """Return ``(etag, body, headers, gzipped body or None)`` cached for ``key`` at ``version``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            entry_version, stored_at, etag, body, headers, gzipped = entry
+            if entry_version != version or time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._stats['stale'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return etag, body, headers, gzipped
+
+    def put(self, key: Hashable, version: int, body: bytes, headers: Headers = ()) -> str:
+        """Cache a response body with its ``(name, value)`` headers and return its ETag."""
+        etag = self.etag(version, body)
+        if self.max_entries <= 0:
+            return etag
+
+        with self._lock:
+            self._entries[key] = [version, time.monotonic(), etag, body, tuple(headers), None]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return etag
+
+    def put_gzipped(self, key: Hashable, etag: str, gzipped: bytes):
+        """Store the gzipped body of the entry cached for ``key``, if it is still the one with ``etag``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == etag:
+                entry[5] = gzipped
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Counters for sizing the cache: hits, misses (of which stale), evictions, size."""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'hit_rate': round(self._stats['hits'] / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': sum(len(entry[3]) + len(entry[5] or b'') for entry in self._entries.values()),
+                'ttl': self.ttl,
+            }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,145 @@
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+from .page_cache import page_cache
+from .logger import setup_logger
+
+logger = setup_logger("XHR")
+
+# Keys that name a job in the payloads of common career-site APIs
+TITLE_KEYS = ('title', 'job_title', 'jobTitle', 'position', 'designation', 'name')
+LOCATION_KEYS = ('location', 'city', 'office', 'job_location', 'jobLocation')
+TYPE_KEYS = ('employment_type', 'employmentType', 'job_type', 'jobType', 'type')
+DESCRIPTION_KEYS = ('description', 'summary', 'short_description', 'shortDescription')
+LINK_KEYS = ('apply_url', 'applyUrl', 'application_url', 'url', 'link', 'absolute_url', 'hosted_url')
+SLUG_KEYS = ('slug', 'shortcode', 'id')
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def capture_json_responses(page, predicate: Optional[Callable[[Any], bool]] = None) -> List:
+    """Start collecting the page's XHR/fetch responses that carry JSON.
+    
+    Must be called before navigation. Returns a list that fills up as the
+    page loads; read the bodies with :func:`read_json` once it is ready
+    (response bodies are not read inside the event handler itself).
+    """
+    responses = []
+    
+    def _on_response(response):
+        if response.request.resource_type not in ('xhr', 'fetch'):
+            return
+        if 'json' not in (response.headers.get('content-type') or ''):
+            return
+        if predicate is None or predicate(response):
+            responses.append(response)
+    
+    page.on("response", _on_response)
+    return responses
+
+
+def read_json(responses: List) -> List[Dict]:
+    """Read captured responses into ``{"url": ..., "data": ...}`` payloads."""
+    payloads = []
+    for response in responses:
+        try:
+            payloads.append({'url': response.url, 'data': response.json()})
+        except Exception as e:
+            logger.debug(f"Skipping unreadable JSON from {response.url}: {e}")
+    return payloads
+
+
+def _first(record: Dict, keys) -> Any:
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _text(value: Any) -> str:
+    """Flatten a JSON value (string, nested object or list) to plain text."""
+    if isinstance(value, dict):
+        value = _first(value, ('name', 'title', 'label', 'city', 'text', 'value')) or ''
+    elif isinstance(value, list):
+        value = ', '.join(_text(v) for v in value if v)
+    return _TAG_RE.sub(' ', str(value)).strip() if value is not None else ''
+
+
+def _looks_like_job(record: Any) -> bool:
+    if not isinstance(record, dict) or not isinstance(_first(record, TITLE_KEYS), str):
+        return False
+    if _first(record, TITLE_KEYS[:-1]):
+        return True
+    # A bare "name" is also used by offices, departments, tags...; require
+    # at least one other job attribute alongside it
+    return any(_first(record, keys) for keys in (LOCATION_KEYS, TYPE_KEYS, DESCRIPTION_KEYS, LINK_KEYS))
+
+
+def find_job_records(data: Any, min_records: int = 1) -> List[Dict]:
+    """Find the largest list of job-like objects anywhere in a JSON payload."""
+    best: List[Dict] = []
+    
+    def _walk(node: Any) -> Iterator[List[Dict]]:
+        if isinstance(node, list):
+            records = [item for item in node if _looks_like_job(item)]
+            if records and len(records) >= len(node) / 2:
+                yield records
+            for item in node:
+                yield from _walk(item)
+        elif isinstance(node, dict):
+            for value in node.values():
+                yield from _walk(value)
+    
+    for records in _walk(data):
+        if len(records) > len(best):
+            best = records
+    return best if len(best) >= min_records else []
+
+
+def record_to_job(record: Dict, company: str, base_url: str, default_location: str = "Dhaka",
+                  default_type: str = "Full-Time") -> Dict:
+    """Map one API record onto the scraper's job dict."""
+    apply_link = _first(record, LINK_KEYS)
+    if isinstance(apply_link, str) and apply_link:
+        apply_link = urljoin(base_url, apply_link)
+    else:
+        slug = _first(record, SLUG_KEYS)
+        apply_link = urljoin(base_url, str(slug)) if slug is not None else base_url
+    
+    return {
+        "title": _text(_first(record, TITLE_KEYS)),
+        "company": company,
+        "location": _text(_first(record, LOCATION_KEYS)) or default_location,
+        "type": _text(_first(record, TYPE_KEYS)) or default_type,
+        "description": _text(_first(record, DESCRIPTION_KEYS))[:500],
+        "apply_link": apply_link,
+    }
+
+
+def jobs_from_payloads(payloads: List[Dict]) -> tuple:
+    """Pick the payload with the most job records.
+    
+    Returns ``(api_url, records)``; ``(None, [])`` if no payload has any.
+    """
+    best_url, best_records = None, []
+    for payload in payloads:
+        records = find_job_records(payload['data'])
+        if len(records) > len(best_records):
+            best_url, best_records = payload['url'], records
+    return best_url, best_records
+
+
+def _endpoint_key(page_url: str) -> str:
+    return f"xhr-endpoint:{page_url}"
+
+
+def remembered_endpoint(page_url: str) -> Optional[str]:
+    """The JSON endpoint that supplied a page's jobs on an earlier run."""
+    entry = page_cache.get(_endpoint_key(page_url))
+    return entry.get('api_url') if entry else None
+
+
+def remember_endpoint(page_url: str, api_url: Optional[str]):
+    """Remember (or forget, with ``None``) the JSON endpoint behind a page."""
+    page_cache.put(_endpoint_key(page_url), {'api_url': api_url})
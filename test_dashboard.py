@@ -0,0 +1,66 @@
+"""
+Response caching checks for the dashboard API.
+Serves the JSON endpoints from a throwaway database through Flask's test
+client and asserts that cached responses, including 304s, keep the
+pagination headers the view set.
+
+    python -m pytest test_dashboard.py
+"""
+
+import pytest
+
+import dashboard
+from scraper.utils.response_cache import response_cache
+
+
+@pytest.fixture
+def client(client, database):
+    database.add_jobs([{
+        'title': f"Engineer {i}",
+        'company': "Alpha",
+        'location': "Dhaka",
+        'apply_link': f"https://example.com/jobs/{i}",
+    } for i in range(5)])
+    return client
+
+
+def assert_next_page(resp):
+    assert resp.headers['X-Next-Cursor'], dict(resp.headers)
+    assert f"cursor={resp.headers['X-Next-Cursor']}" in resp.headers['Link']
+    assert resp.headers['Link'].endswith('rel="next"')
+
+
+@pytest.mark.parametrize('url', ['/api/jobs?days=1&limit=2', '/api/search?q=engineer&limit=2'])
+def test_cached_page_keeps_cursor(client, url):
+    first = client.get(url)
+    assert first.status_code == 200 and len(first.get_json()) == 2
+    assert_next_page(first)
+
+    hits = response_cache.stats()['hits']
+    second = client.get(url)
+    assert response_cache.stats()['hits'] == hits + 1
+    assert second.get_data() == first.get_data()
+    assert second.headers['X-Next-Cursor'] == first.headers['X-Next-Cursor']
+    assert second.headers['Link'] == first.headers['Link']
+
+    not_modified = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+    assert not_modified.status_code == 304 and not not_modified.get_data()
+    assert not_modified.headers['X-Next-Cursor'] == first.headers['X-Next-Cursor']
+
+
+def test_cached_page_follows_cursor(client):
+    """The cached cursor still leads to the next page."""
+    client.get('/api/jobs?days=1&limit=2')
+    cursor = client.get('/api/jobs?days=1&limit=2').headers['X-Next-Cursor']
+    second_page = client.get(f'/api/jobs?days=1&limit=2&cursor={cursor}')
+    assert len(second_page.get_json()) == 2
+    assert_next_page(second_page)
+
+
+def test_cached_gzip_keeps_cursor(client, monkeypatch):
+    monkeypatch.setattr(dashboard, 'GZIP_MIN_SIZE', 0)
+    url = '/api/jobs?days=1&limit=2'
+    first = client.get(url)
+    gzipped = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+    assert gzipped.headers['X-Next-Cursor'] == first.headers['X-Next-Cursor']
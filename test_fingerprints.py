@@ -0,0 +1,68 @@
+"""
+Fingerprint backfill checks.
+Opens databases written by older versions, whose jobs are keyed on salted
+``hash()`` values, and asserts that the first start rewrites the keys and
+merges the duplicate jobs into the oldest copy.
+
+    python -m pytest test_fingerprints.py
+"""
+
+from scraper.database import SCHEMA_VERSION, JobDatabase, job_fingerprint
+
+JOB = {
+    'title': "Engineer",
+    'company': "Alpha",
+    'location': "Dhaka",
+    'apply_link': "https://example.com/jobs/1",
+}
+
+
+def _legacy_database(make_database, copies) -> str:
+    """A database at schema version 1 holding ``copies`` of JOB as ``(hash, last_seen, is_active, views)``."""
+    db = make_database("legacy.db")
+    conn = db._connect()
+    with conn:
+        conn.executemany('''
+            INSERT INTO jobs (title, company, location, apply_link, hash, scraped_at, first_seen,
+                              last_seen, is_active, view_count)
+            VALUES (?, ?, ?, ?, ?, '2026-01-01 00:00:00', '2026-01-01 00:00:00', ?, ?, ?)
+        ''', [(JOB['title'], JOB['company'], JOB['location'], JOB['apply_link'], *copy) for copy in copies])
+        conn.execute("PRAGMA user_version = 1")
+    return db.db_path
+
+
+def _jobs(db: JobDatabase) -> list:
+    return db._connect().execute(
+        "SELECT id, hash, last_seen, is_active, view_count FROM jobs ORDER BY id").fetchall()
+
+
+def test_duplicates_merge_into_oldest(make_database):
+    path = _legacy_database(make_database, [
+        ('-1234', '2026-01-05 00:00:00', 0, 1),
+        ('5678', '2026-03-01 00:00:00', 1, 2),
+        # A copy inserted after the fingerprint change, already keyed correctly
+        (job_fingerprint(JOB), '2026-02-01 00:00:00', 0, 3),
+    ])
+
+    db = JobDatabase(path)
+    assert _jobs(db) == [(1, job_fingerprint(JOB), '2026-03-01 00:00:00', 1, 6)]
+    assert db._connect().execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert db.get_statistics()['active_jobs'] == 1
+
+
+def test_inactive_duplicates_stay_inactive(make_database):
+    path = _legacy_database(make_database, [
+        ('-1234', '2026-01-05 00:00:00', 0, 0),
+        ('5678', '2026-01-02 00:00:00', 0, 0),
+    ])
+
+    db = JobDatabase(path)
+    assert _jobs(db) == [(1, job_fingerprint(JOB), '2026-01-05 00:00:00', 0, 0)]
+
+
+def test_known_job_is_not_inserted_again(make_database):
+    path = _legacy_database(make_database, [('-1234', '2026-01-05 00:00:00', 1, 0)])
+
+    db = JobDatabase(path)
+    assert db.ingest_jobs([dict(JOB)]) != ['new']
+    assert len(_jobs(db)) == 1
@@ -0,0 +1,134 @@
+"""
+Job lifecycle checks for the orchestrator.
+Runs fake parsers through ``scraper.main._run_parser`` against a throwaway
+database and asserts that a successful run deactivates the company's jobs
+it no longer lists, that a failed or partial run deactivates nothing,
+that a job listed again is reactivated, and that a page is only cached
+once its jobs are stored.
+
+    python -m pytest test_job_lifecycle.py
+"""
+
+import sqlite3
+import time
+from unittest import mock
+
+from scraper import main
+from scraper.database import JobDatabase, get_database
+from scraper.job_api import post_job
+from scraper.parsers.base_parser import BaseJobParser
+from scraper.utils.page_cache import page_cache
+
+
+def _job(company: str, i: int) -> dict:
+    return {
+        'title': f"Engineer {i}",
+        'company': company,
+        'location': "Dhaka",
+        'type': "Full-Time",
+        'description': "",
+        'apply_link': f"https://example.com/{company}/jobs/{i}",
+    }
+
+
+def _parser(company: str, listed, error: Exception = None) -> type:
+    """A parser class that posts the jobs ``listed`` and, if given, then fails with ``error``."""
+    class FakeParser(BaseJobParser):
+        url = "https://example.com/careers"
+
+        def fetch_jobs(self):
+            jobs = []
+            try:
+                for i in listed:
+                    jobs.append(_job(company, i))
+                    post_job(jobs[-1])
+                if error:
+                    raise error
+            except Exception as e:
+                self.fail(e)
+            return jobs
+    FakeParser.company = company
+    return FakeParser
+
+
+def _cached_parser(company: str, page: bytes) -> type:
+    """A parser class for a one-job page, going through the page cache like the site parsers."""
+    class CachedParser(BaseJobParser):
+        url = f"https://example.com/{company}/careers"
+
+        def fetch_jobs(self):
+            resp = mock.Mock(status_code=200, headers={}, content=page, requested_url=self.url,
+                             received_at=time.perf_counter())
+            resp.cache_entry = page_cache.unchanged_entry(self.url, page)
+            cached = self.cached_jobs(resp)
+            if cached is not None:
+                return cached
+            jobs = [_job(company, 0)]
+            post_job(jobs[0])
+            self.remember_jobs(resp, jobs)
+            return jobs
+    CachedParser.company = company
+    return CachedParser
+
+
+def _run(company: str, listed, error: Exception = None) -> dict:
+    # Age the stored jobs as if the previous run was an hour ago
+    conn = get_database()._connect()
+    with conn:
+        conn.execute("UPDATE jobs SET last_seen = datetime(last_seen, '-1 hour') WHERE company = ?", (company,))
+    with mock.patch.object(main, 'load_parser', return_value=_parser(company, listed, error)):
+        return main._run_parser(company.lower())
+
+
+def _active(company: str) -> set:
+    rows = get_database()._connect().execute(
+        "SELECT title FROM jobs WHERE company = ? AND is_active = 1", (company,)).fetchall()
+    return {row[0] for row in rows}
+
+
+def test_unlisted_jobs_are_deactivated(database):
+    _run("Alpha", range(5))
+    result = _run("Alpha", range(3))
+    assert result['success'] and result['jobs_deactivated'] == 2, result
+    assert _active("Alpha") == {"Engineer 0", "Engineer 1", "Engineer 2"}
+
+
+def test_relisted_job_is_reactivated(database):
+    _run("Beta", range(3))
+    _run("Beta", [0])
+    result = _run("Beta", [0, 2])
+    assert result['jobs_updated'] == 1 and result['jobs_deactivated'] == 0, result
+    assert _active("Beta") == {"Engineer 0", "Engineer 2"}
+
+
+def test_partial_run_deactivates_nothing(database):
+    _run("Gamma", range(5))
+    result = _run("Gamma", [0], error=RuntimeError("connection reset"))
+    assert not result['success'] and result['error'] == "connection reset", result
+    assert result['jobs_found'] == 1 and result['jobs_deactivated'] == 0, result
+    assert len(_active("Gamma")) == 5
+
+
+def test_empty_run_deactivates_nothing(database):
+    _run("Delta", range(2))
+    result = _run("Delta", [])
+    assert result['success'] and result['jobs_deactivated'] == 0, result
+    assert len(_active("Delta")) == 2
+
+
+def test_failed_store_does_not_cache_the_page(database, empty_page_cache):
+    parser = _cached_parser("Epsilon", b"<html><h3>Engineer 0</h3></html>")
+    with mock.patch.object(main, 'load_parser', return_value=parser):
+        with mock.patch.object(JobDatabase, 'ingest_jobs',
+                               side_effect=sqlite3.OperationalError("database is locked")):
+            result = main._run_parser("epsilon")
+        assert not result['success'] and not _active("Epsilon"), result
+
+        # The page is unchanged, but its jobs were never stored: parse it again
+        result = main._run_parser("epsilon")
+        assert result['success'] and not result['skipped'] and result['jobs_new'] == 1, result
+        assert _active("Epsilon") == {"Engineer 0"}
+
+        result = main._run_parser("epsilon")
+        assert result['skipped'] and result['jobs_found'] == 1, result
+
@@ -0,0 +1,156 @@
+"""
+Outbox publisher checks.
+Drains the outbox of a throwaway database against a fake API and asserts
+that failed posts are retried with backoff or given up on, and that a
+rejected batch is split to find the bad job.
+
+    python -m pytest test_publisher.py
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from scraper.publisher import JobPublisher
+
+
+class FakeAPI:
+    """Answers each POST with ``status(url, payload)`` and records the calls."""
+
+    def __init__(self, status):
+        self.status = status
+        self.calls = []
+
+    def post(self, url, json, headers, timeout):
+        self.calls.append((url, json))
+        code = self.status(url, json)
+        return mock.Mock(ok=code < 400, status_code=code, text=f"status {code}")
+
+
+def _job(i: int) -> dict:
+    return {
+        'title': f"Engineer {i}",
+        'company': "Alpha",
+        'location': "Dhaka",
+        'apply_link': f"https://example.com/jobs/{i}",
+    }
+
+
+def _publisher(database, monkeypatch, status, **options) -> tuple:
+    api = FakeAPI(status)
+    monkeypatch.setattr(JobPublisher, 'client', property(lambda self: api))
+    options = {'api_url': "https://api/jobs", 'batch_url': "", 'backoff': 10, 'backoff_max': 600, **options}
+    return JobPublisher(database=database, **options), api
+
+
+def _outbox(database) -> dict:
+    rows = database._connect().execute(
+        "SELECT title, posted_to_api, publish_attempts, publish_after, publish_error FROM jobs").fetchall()
+    return {title: row for title, *row in rows}
+
+
+def _utc(timestamp: str) -> datetime:
+    return datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+
+
+def test_publish(database, monkeypatch):
+    database.add_jobs([_job(i) for i in range(3)])
+    publisher, api = _publisher(database, monkeypatch, lambda url, payload: 201)
+    assert publisher.publish_pending() == 3
+    assert all(posted for posted, *_ in _outbox(database).values())
+    assert publisher.pop_stats() == {'published': 3, 'retrying': 0, 'failed': 0, 'requests': 3}
+    assert publisher.publish_pending() == 0 and len(api.calls) == 3
+
+
+@pytest.mark.parametrize('code', [503, 429, 408])
+def test_retryable_error_backs_off(database, monkeypatch, code):
+    database.add_jobs([_job(0)])
+    publisher, _ = _publisher(database, monkeypatch, lambda url, payload: code)
+    started = datetime.now(timezone.utc)
+    assert publisher.publish_pending() == 0
+
+    posted, attempts, retry_at, error = _outbox(database)["Engineer 0"]
+    assert not posted and attempts == 1 and error.startswith(f"HTTP {code}")
+    # First retry after backoff * 2**0, +-20% jitter
+    delay = (_utc(retry_at) - started).total_seconds()
+    assert 8 - 1 <= delay <= 12 + 1, delay
+    assert publisher.pop_stats()['retrying'] == 1
+    # Not due yet, so not posted again
+    assert publisher.publish_pending() == 0 and publisher.pop_stats()['requests'] == 0
+
+
+def test_backoff_grows_and_is_capped(database, monkeypatch):
+    publisher, _ = _publisher(database, monkeypatch, None, backoff=10, backoff_max=60)
+    now = datetime.now(timezone.utc)
+    with mock.patch('scraper.publisher.random.uniform', return_value=1.0):
+        delays = [(_utc(publisher._failure({'id': 1, 'attempts': attempts, 'payload': {}}, "HTTP 503", True)[2])
+                   - now).total_seconds() for attempts in range(5)]
+    for delay, expected in zip(delays, [10, 20, 40, 60, 60]):
+        assert expected - 1 <= delay <= expected + 1, delays
+
+
+def test_retried_job_is_published(database, monkeypatch):
+    database.add_jobs([_job(0)])
+    codes = iter([503, 201])
+    publisher, api = _publisher(database, monkeypatch, lambda url, payload: next(codes))
+    assert publisher.publish_pending() == 0
+
+    # Make the retry due now
+    conn = database._connect()
+    with conn:
+        conn.execute("UPDATE jobs SET publish_after = datetime('now', '-1 second')")
+    assert publisher.publish_pending() == 1
+    posted, attempts, retry_at, error = _outbox(database)["Engineer 0"]
+    assert posted and retry_at is None and error is None and len(api.calls) == 2
+
+
+def test_client_error_gives_up(database, monkeypatch):
+    database.add_jobs([_job(0)])
+    publisher, _ = _publisher(database, monkeypatch, lambda url, payload: 422)
+    assert publisher.publish_pending() == 0
+
+    posted, attempts, retry_at, error = _outbox(database)["Engineer 0"]
+    assert not posted and attempts == 1 and retry_at is None and error.startswith("HTTP 422")
+    assert database.outbox_stats() == {'pending': 0, 'failed': 1}
+    assert publisher.pop_stats()['failed'] == 1
+
+
+def test_gives_up_after_max_attempts(database, monkeypatch):
+    database.add_jobs([_job(0)])
+    conn = database._connect()
+    with conn:
+        conn.execute("UPDATE jobs SET publish_attempts = 2")
+    publisher, _ = _publisher(database, monkeypatch, lambda url, payload: 503, max_attempts=3)
+    assert publisher.publish_pending() == 0
+
+    posted, attempts, retry_at, _ = _outbox(database)["Engineer 0"]
+    assert not posted and attempts == 3 and retry_at is None
+
+
+def test_rejected_batch_is_split(database, monkeypatch):
+    database.add_jobs([_job(i) for i in range(3)])
+
+    def status(url, payload):
+        if url == "https://api/batch":
+            return 400
+        return 400 if payload['title'] == "Engineer 1" else 201
+
+    publisher, api = _publisher(database, monkeypatch, status, batch_url="https://api/batch", batch_size=3)
+    assert publisher.publish_pending() == 2
+
+    outbox = _outbox(database)
+    assert outbox["Engineer 0"][0] and outbox["Engineer 2"][0]
+    assert not outbox["Engineer 1"][0] and outbox["Engineer 1"][2] is None
+    assert [url for url, _ in api.calls] == ["https://api/batch"] + ["https://api/jobs"] * 3
+    assert publisher.pop_stats() == {'published': 2, 'retrying': 0, 'failed': 1, 'requests': 4}
+
+
+def test_retryable_batch_error_is_not_split(database, monkeypatch):
+    database.add_jobs([_job(i) for i in range(3)])
+    publisher, api = _publisher(database, monkeypatch, lambda url, payload: 502,
+                                batch_url="https://api/batch", batch_size=3)
+    assert publisher.publish_pending() == 0
+
+    assert len(api.calls) == 1 and len(api.calls[0][1]) == 3
+    assert all(attempts == 1 and retry_at for _, attempts, retry_at, _ in _outbox(database).values())
@@ -0,0 +1,82 @@
+"""
+Query plan regression checks for the job database.
+Builds a throwaway database with a few thousand jobs and asserts, with
+EXPLAIN QUERY PLAN, that the listing queries behind the dashboard are
+served by indexes: no full scan of ``jobs`` and no temporary sort.
+
+    python -m pytest test_query_plans.py
+"""
+
+import re
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def db(make_database):
+    """A populated database shared by all checks; half of "Company 3" is inactive."""
+    db = make_database("plans.db")
+    db.add_jobs([{
+        'title': f"Engineer {i}",
+        'company': f"Company {i % 20}",
+        'location': "Dhaka",
+        'apply_link': f"https://example.com/jobs/{i}",
+    } for i in range(5000)])
+    conn = db._connect()
+    with conn:
+        conn.execute("UPDATE jobs SET is_active = 0 WHERE id % 40 = 4")
+        conn.execute("ANALYZE")
+    return db
+
+
+def query_plan(db, sql: str, params) -> str:
+    rows = db._connect().execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+def assert_indexed(plan: str, index: str):
+    assert f"USING INDEX {index}" in plan, f"expected {index}:\n{plan}"
+    assert not re.search(r"^SCAN (jobs|j)\b", plan, re.M), f"full scan of jobs:\n{plan}"
+    assert "TEMP B-TREE" not in plan, f"temporary sort:\n{plan}"
+
+
+def test_recent_jobs_plan(db):
+    """Dashboard listing: active jobs of the last N days, newest first."""
+    sql, params, _ = db._recent_jobs_query(days=7)
+    plan = query_plan(db, sql, params)
+    assert_indexed(plan, "idx_active_scraped_at")
+
+
+def test_recent_company_jobs_plan(db):
+    """Per-company listing (/api/jobs/<company>)."""
+    sql, params, _ = db._recent_jobs_query("Company 3", days=30)
+    plan = query_plan(db, sql, params)
+    assert_indexed(plan, "idx_active_company_scraped_at")
+
+
+def test_recent_jobs_page_plan(db):
+    """A later page of /api/jobs: keyset on (scraped_at, id) with a projection."""
+    sql, params, _ = db._recent_jobs_query(days=7, fields=['title', 'company'],
+                                                    after=("2100-01-01 00:00:00", 100), limit=50)
+    assert_indexed(query_plan(db, sql, params), "idx_active_scraped_at")
+
+
+def test_recent_jobs_pages(db):
+    """Walking the pages returns every job exactly once."""
+    seen, after = [], None
+    while True:
+        page = list(db.iter_recent_jobs(days=1, fields=['title'], after=after, limit=700))
+        if not page:
+            break
+        seen += [job['id'] for job in page]
+        after = (page[-1]['scraped_at'], page[-1]['id'])
+    assert seen == [job['id'] for job in db.iter_recent_jobs(days=1, fields=['title'])]
+    assert len(seen) == len(set(seen)) == 4875, len(seen)
+
+
+def test_recent_jobs_results(db):
+    """The rewritten filter still returns only active jobs."""
+    jobs = db.get_recent_jobs("Company 3", days=1)
+    assert len(jobs) == 125, len(jobs)
+    assert all(job['company'] == "Company 3" for job in jobs)
+
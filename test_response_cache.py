@@ -0,0 +1,92 @@
+"""
+Response cache checks.
+Exercises ``ResponseCache`` directly (LRU eviction, TTL expiry, invalidation
+by data version) and the ETag / 304 handling of ``dashboard.cached_json``.
+
+    python -m pytest test_response_cache.py
+"""
+
+from unittest import mock
+
+import pytest
+
+from scraper.utils import response_cache as response_cache_module
+from scraper.utils.response_cache import ResponseCache
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.put('a', 1, b'A')
+    cache.put('b', 1, b'B')
+    assert cache.get('a', 1) is not None  # 'b' is now the least recently used
+    cache.put('c', 1, b'C')
+    assert cache.get('b', 1) is None
+    assert cache.get('a', 1)[1] == b'A' and cache.get('c', 1)[1] == b'C'
+    assert cache.stats()['evictions'] == 1 and cache.stats()['entries'] == 2
+
+
+def test_ttl_expiry():
+    cache = ResponseCache(max_entries=8, ttl=60)
+    with mock.patch.object(response_cache_module.time, 'monotonic', return_value=1000.0):
+        cache.put('a', 1, b'A')
+    with mock.patch.object(response_cache_module.time, 'monotonic', return_value=1059.0):
+        assert cache.get('a', 1) is not None
+    with mock.patch.object(response_cache_module.time, 'monotonic', return_value=1061.0):
+        assert cache.get('a', 1) is None
+    assert cache.stats()['stale'] == 1 and cache.stats()['entries'] == 0
+
+
+def test_data_version_invalidation():
+    cache = ResponseCache(max_entries=8, ttl=60)
+    etag = cache.put('a', 1, b'A', [('X-Next-Cursor', 'abc')])
+    assert cache.get('a', 1) == (etag, b'A', (('X-Next-Cursor', 'abc'),), None)
+    assert cache.get('a', 2) is None
+    # A stale entry is dropped, not served to an older reader either
+    assert cache.get('a', 1) is None
+    assert cache.etag(1, b'A') != cache.etag(2, b'A')
+
+
+def test_gzipped_body_is_kept_for_its_etag():
+    cache = ResponseCache(max_entries=8, ttl=60)
+    etag = cache.put('a', 1, b'A')
+    cache.put_gzipped('a', 'other', b'stale')
+    assert cache.get('a', 1)[3] is None
+    cache.put_gzipped('a', etag, b'gz')
+    assert cache.get('a', 1)[3] == b'gz'
+
+
+def test_disabled_cache():
+    cache = ResponseCache(max_entries=0, ttl=60)
+    assert cache.put('a', 1, b'A') == cache.etag(1, b'A')
+    assert cache.get('a', 1) is None
+
+
+@pytest.fixture
+def client(client, database):
+    database.add_jobs([{
+        'title': "Engineer",
+        'company': "Alpha",
+        'location': "Dhaka",
+        'apply_link': "https://example.com/jobs/1",
+    }])
+    return client
+
+
+def test_etag_and_not_modified(client, database):
+    first = client.get('/api/stats')
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and etag.startswith('W/')
+
+    not_modified = client.get('/api/stats', headers={'If-None-Match': etag})
+    assert not_modified.status_code == 304 and not not_modified.get_data()
+    assert not_modified.headers['ETag'] == etag
+
+    # New data changes the version, so the old ETag no longer matches
+    database.add_jobs([{
+        'title': "Designer",
+        'company': "Alpha",
+        'location': "Dhaka",
+        'apply_link': "https://example.com/jobs/2",
+    }])
+    changed = client.get('/api/stats', headers={'If-None-Match': etag})
+    assert changed.status_code == 200 and changed.headers['ETag'] != etag
@@ -0,0 +1,108 @@
+"""
+Retention checks.
+Expires part of a throwaway database and asserts that the old rows are
+archived to gzipped NDJSON before they are deleted, that rows stay when the
+archive cannot be written, and that the vacuum gives the pages back.
+
+    python -m pytest test_retention.py
+"""
+
+import gzip
+import json
+from unittest import mock
+
+import pytest
+
+from scraper.retention import RetentionEngine
+
+
+@pytest.fixture
+def database(database):
+    """200 jobs, the odd ones last seen 100 days ago, and one old and one new scraping run."""
+    database.add_jobs([{
+        'title': f"Engineer {i}",
+        'company': f"Company {i % 4}",
+        'location': "Dhaka",
+        'description': "Builds and runs the job scraper. " * 50,
+        'apply_link': f"https://example.com/jobs/{i}",
+    } for i in range(200)])
+    database.record_scraping_run("Company 0", 200, 200)
+    database.record_scraping_run("Company 0", 0, 0)
+    conn = database._connect()
+    with conn:
+        conn.execute("UPDATE jobs SET last_seen = datetime('now', '-100 days') WHERE id % 2 = 1")
+        conn.execute("UPDATE scraping_runs SET run_time = datetime('now', '-100 days') WHERE id = 1")
+    return database
+
+
+def _retention(database, archive_dir, **options) -> RetentionEngine:
+    options = {'days': 90, 'interval': 3600, 'batch_size': 30, 'vacuum_pages': 0, **options}
+    return RetentionEngine(database=database, archive_dir=str(archive_dir), **options)
+
+
+def _archived(retention: RetentionEngine, table: str) -> list:
+    with gzip.open(retention.archive_path(table), 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def _ids(database, table: str) -> set:
+    return {row[0] for row in database._connect().execute(f"SELECT id FROM {table}")}
+
+
+def test_expired_rows_are_archived_then_deleted(database, tmp_path):
+    retention = _retention(database, tmp_path)
+    report = retention.run(force=True)
+
+    assert report['deleted'] == {'jobs': 100, 'scraping_runs': 1}
+    assert report['archived'] == {'jobs': 100, 'scraping_runs': 1}
+    assert _ids(database, 'jobs') == set(range(2, 201, 2))
+    assert _ids(database, 'scraping_runs') == {2}
+
+    # Batches append gzip members; the file reads back as one stream
+    jobs = _archived(retention, 'jobs')
+    assert sorted(job['id'] for job in jobs) == list(range(1, 201, 2))
+    assert jobs[0]['title'] and jobs[0]['description'].startswith("Builds")
+    assert [run['id'] for run in _archived(retention, 'scraping_runs')] == [1]
+
+    stats = database.get_statistics()
+    assert stats['total_jobs'] == stats['active_jobs'] == 100
+
+
+def test_failed_archive_keeps_rows(database, tmp_path):
+    retention = _retention(database, tmp_path)
+    with mock.patch.object(retention, '_archive', side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            retention.run(force=True)
+    assert len(_ids(database, 'jobs')) == 200
+    assert len(_ids(database, 'scraping_runs')) == 2
+
+
+def test_without_archive_dir_rows_are_only_deleted(database):
+    retention = RetentionEngine(database=database, days=90, batch_size=30, archive_dir="")
+    report = retention.run(force=True)
+    assert report['deleted']['jobs'] == 100 and report['archived']['jobs'] == 0
+
+
+def test_vacuum_returns_free_pages(database, tmp_path):
+    if database._connect().execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        pytest.skip("database is not in incremental vacuum mode")
+    report = _retention(database, tmp_path).run(force=True)
+    assert report['bytes_reclaimed'] > 0 and report['free_bytes'] == 0
+
+
+def test_vacuum_is_bounded(database, tmp_path):
+    if database._connect().execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        pytest.skip("database is not in incremental vacuum mode")
+    page_size = database._connect().execute("PRAGMA page_size").fetchone()[0]
+    report = _retention(database, tmp_path, vacuum_pages=2).run(force=True)
+    assert report['bytes_reclaimed'] == 2 * page_size and report['free_bytes'] > 0
+
+    # Later passes keep returning what is left
+    assert database.incremental_vacuum() == report['free_bytes'] and database.free_bytes() == 0
+
+
+def test_pass_runs_once_per_interval(database, tmp_path):
+    retention = _retention(database, tmp_path)
+    assert retention.due()
+    assert retention.run() is not None
+    assert not retention.due() and retention.run() is None
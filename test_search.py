@@ -0,0 +1,69 @@
+"""
+Full-text search checks.
+Searches a throwaway database and asserts that results are ranked by bm25
+with title matches first, that prefixes match, and that snippets escape the
+scraped text before highlighting the matched terms.
+
+    python -m pytest test_search.py
+"""
+
+import pytest
+
+
+def _job(i: int, title: str, description: str = "", **fields) -> dict:
+    return {
+        'title': title,
+        'company': "Alpha",
+        'location': "Dhaka",
+        'description': description,
+        'apply_link': f"https://example.com/jobs/{i}",
+        **fields,
+    }
+
+
+@pytest.fixture
+def database(database):
+    if not database.fts_enabled:
+        pytest.skip("SQLite was built without FTS5")
+    return database
+
+
+def test_title_match_ranks_first(database):
+    database.add_jobs([
+        _job(1, "Accountant", "Works closely with the python team"),
+        _job(2, "Python Developer", "Builds services"),
+        _job(3, "Designer", "Python python python scripting for design tools"),
+    ])
+    results = database.search_jobs("python")
+    assert [job['title'] for job in results][0] == "Python Developer"
+    assert {job['title'] for job in results} == {"Python Developer", "Accountant", "Designer"}
+    scores = [job['score'] for job in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_prefix_match(database):
+    database.add_jobs([_job(1, "Python Developer"), _job(2, "Designer")])
+    assert [job['title'] for job in database.search_jobs("pyth")] == ["Python Developer"]
+
+
+def test_inactive_jobs_are_not_found(database):
+    database.add_jobs([_job(1, "Python Developer"), _job(2, "Python Tester")])
+    conn = database._connect()
+    with conn:
+        conn.execute("UPDATE jobs SET is_active = 0 WHERE title = 'Python Tester'")
+    assert [job['title'] for job in database.search_jobs("python")] == ["Python Developer"]
+
+
+def test_snippet_escapes_html(database):
+    database.add_jobs([_job(1, "Engineer", 'Write <script>alert("x")</script> & python code')])
+    snippet = database.search_jobs("python")[0]['snippet']
+    assert '<script>' not in snippet
+    assert '&lt;script&gt;' in snippet and '&amp;' in snippet
+    assert '<mark>python</mark>' in snippet
+
+
+def test_snippet_keeps_only_match_marks(database):
+    """Markup that looks like a highlight in the scraped text stays escaped."""
+    database.add_jobs([_job(1, "Engineer", "Use <mark>tags</mark> with python")])
+    snippet = database.search_jobs("python")[0]['snippet']
+    assert snippet.count('<mark>') == 1 and '&lt;mark&gt;tags&lt;/mark&gt;' in snippet